@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+EncryptionFilter 微基准测试
+
+对比逐次创建过滤器、整体解码后切片解密（旧实现）与缓存过滤器、分块解密到预分配缓冲区（当前实现）
+在不同大小的列表响应上的耗时, 用法:
+
+    python benchmarks/encryption_bench.py --items 10 1000 20000 --repeat 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import json
+import sys
+import time
+import tracemalloc
+
+from pathlib import Path
+from typing import Callable
+
+from Crypto.Cipher import AES
+from Crypto.Util.Padding import unpad
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from httpseeker.utils.encryption_filter import EncryptionFilter, get_encryption_filter
+
+KEY = EncryptionFilter.DEFAULT_KEY
+
+
+def legacy_decrypt_response(response_json: dict) -> dict:
+    """旧实现: 每次创建过滤器, 整体解码并切片复制后解密"""
+    filter_ = EncryptionFilter(encryption_enabled=True, encryption_key=KEY)
+    decoded = base64.b64decode(response_json['data'])
+    cipher = AES.new(filter_.encryption_key, AES.MODE_CBC, decoded[:16])
+    plain = unpad(cipher.decrypt(decoded[16:]), AES.block_size).decode('utf-8')
+    return {**response_json, 'data': json.loads(plain)}
+
+
+def current_decrypt_response(response_json: dict) -> dict:
+    """当前实现"""
+    return get_encryption_filter(KEY).decrypt_response_data(dict(response_json))
+
+
+def make_response(items: int) -> dict:
+    records = [{'id': i, 'name': f'user-{i}', 'balance': '20000.00', 'tags': ['a', 'b']} for i in range(items)]
+    data = get_encryption_filter(KEY).encrypt(json.dumps({'records': records, 'total': items}))
+    return {'code': 20000, 'success': True, 'data': data}
+
+
+def bench(func: Callable[[dict], dict], response_json: dict, repeat: int) -> float:
+    func(response_json)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(response_json)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def peak_memory(func: Callable[[dict], dict], response_json: dict) -> float:
+    tracemalloc.start()
+    func(response_json)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024 / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='EncryptionFilter 微基准测试')
+    parser.add_argument('--items', type=int, nargs='+', default=[10, 1000, 20000], help='响应列表长度')
+    parser.add_argument('--repeat', type=int, default=20, help='每组重复次数')
+    args = parser.parse_args()
+
+    print(
+        f'{"items":>8} {"密文长度":>10} {"legacy ms":>10} {"current ms":>11} {"speedup":>8}'
+        f' {"legacy MiB":>11} {"current MiB":>12}'
+    )
+    for items in args.items:
+        response_json = make_response(items)
+        assert legacy_decrypt_response(response_json) == current_decrypt_response(response_json)
+        legacy = bench(legacy_decrypt_response, response_json, args.repeat)
+        current = bench(current_decrypt_response, response_json, args.repeat)
+        legacy_peak = peak_memory(legacy_decrypt_response, response_json)
+        current_peak = peak_memory(current_decrypt_response, response_json)
+        print(
+            f'{items:>8} {len(response_json["data"]):>12} {legacy:>10.3f} {current:>11.3f} {legacy / current:>7.2f}x'
+            f' {legacy_peak:>11.2f} {current_peak:>12.2f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
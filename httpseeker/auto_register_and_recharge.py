@@ -8,34 +8,57 @@
 3. 查询新注册用户的ID
 4. 为新用户充值20000
 5. 更新auth.yaml文件中的账号信息
+
+批量模式（--batch N）：
+1. 管理员仅登录一次，所有账号共用同一个管理员 token
+2. 多线程并发注册、查询ID、充值，所有线程共用同一个连接池
+3. 成功的账号原子写入账号池文件，可在 auth.yaml 的 accounts 中引用
 """
 
+from __future__ import annotations
+
+import argparse
 import os
 import sys
+import tempfile
+import threading
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
 import requests
 import yaml
-from pathlib import Path
+
 from faker import Faker
 from jsonpath_ng import parse
+from requests.adapters import HTTPAdapter
 
-# 添加项目根目录到系统路径
-current_dir = Path(__file__).parent
-sys.path.insert(0, str(current_dir))
+from httpseeker.common.log import log
+from httpseeker.core.hooks import get_google_auth_code, random_phone
 
-from core.hooks import random_phone, get_google_auth_code
+current_dir = Path(__file__).parent
 
 # 初始化Faker
 faker = Faker(locale='zh_CN')
 
+# 注册账号使用的密码（已加密）
+DEFAULT_PASSWORD = "O4zAs9Mz4aoYOirIST4Xyg=="
+# 默认账号池文件
+DEFAULT_POOL_FILE = current_dir / "core" / "auth_yaml" / "account_pool.yaml"
+
 
 class AutoRegisterAndRecharge:
     """自动注册并充值用户"""
 
-    def __init__(self):
+    def __init__(self, session: requests.Session | None = None, admin_token: str | None = None) -> None:
+        """
+        :param session: 请求会话，批量模式下传入共用连接池的会话
+        :param admin_token: 管理员 token，传入时跳过管理员登录
+        """
         self.phone = None
         self.user_id = None
-        self.admin_token = None
-        self.session = requests.Session()
+        self.admin_token = admin_token
+        self.session = session or requests.Session()
 
     def step1_generate_phone(self):
         """步骤1: 生成随机手机号"""
@@ -54,7 +77,7 @@ class AutoRegisterAndRecharge:
             "account": self.phone,
             "countryCode": "86",
             "invitationCode": "d1yrkg",
-            "password": "O4zAs9Mz4aoYOirIST4Xyg==",
+            "password": DEFAULT_PASSWORD,
             "validateCode": "",
             "uuid": "",
             "phoneValidateCode": "",
@@ -96,7 +119,7 @@ class AutoRegisterAndRecharge:
 
         payload = {
             "username": "rookies",
-            "password": "O4zAs9Mz4aoYOirIST4Xyg==",
+            "password": DEFAULT_PASSWORD,
             "ggcode": google_code
         }
 
@@ -289,17 +312,110 @@ class AutoRegisterAndRecharge:
             return False
 
 
-def main():
-    """主函数"""
-    automation = AutoRegisterAndRecharge()
-    success = automation.run()
-    sys.exit(0 if success else 1)
+class BatchRegisterAndRecharge:
+    """批量注册并充值用户，生成账号池文件"""
+
+    def __init__(self, count: int, workers: int = 10, pool_file: str | Path | None = None) -> None:
+        """
+        :param count: 注册账号数量
+        :param workers: 并发线程数
+        :param pool_file: 账号池文件路径
+        """
+        self.count = count
+        self.workers = max(1, min(workers, count))
+        self.pool_file = Path(pool_file) if pool_file else DEFAULT_POOL_FILE
+        self.admin_token: str | None = None
+        # 所有线程的会话挂载同一个适配器，共用连接池
+        self.adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.workers)
+        self._local = threading.local()
+
+    def _session(self) -> requests.Session:
+        """获取当前线程的会话"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            session.mount("https://", self.adapter)
+            session.mount("http://", self.adapter)
+        return session
+
+    def admin_login(self) -> str:
+        """管理员登录，仅执行一次"""
+        automation = AutoRegisterAndRecharge(session=self._session())
+        self.admin_token = automation.step4_admin_login(automation.step3_generate_google_code())
+        return self.admin_token
+
+    def provision_one(self) -> dict:
+        """注册并充值一个账号"""
+        automation = AutoRegisterAndRecharge(session=self._session(), admin_token=self.admin_token)
+        automation.step1_generate_phone()
+        automation.step2_register_user()
+        automation.step5_get_user_id()
+        automation.step6_recharge_user()
+        phone = automation.phone.replace(' ', '').replace('-', '')
+        return {
+            "account": int(phone) if phone.isdigit() else phone,
+            "pwd": DEFAULT_PASSWORD,
+            "internationalCode": "86",
+            "user_id": automation.user_id,
+        }
 
-def main():
+    def write_pool_file(self, accounts: list[dict]) -> None:
+        """
+        原子写入账号池文件：先写入同目录临时文件，再替换目标文件
+
+        :param accounts: 账号列表
+        """
+        self.pool_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.pool_file.parent, prefix=f".{self.pool_file.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                yaml.safe_dump({"accounts": accounts}, f, allow_unicode=True, sort_keys=False)
+            os.replace(tmp_path, self.pool_file)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def run(self) -> list[dict]:
+        """执行批量流程，返回成功注册的账号列表"""
+        log.info(f"开始批量注册和充值: {self.count} 个账号, 并发 {self.workers}")
+
+        try:
+            self.admin_login()
+        except Exception as e:
+            log.error(f"批量注册失败, 管理员登录失败: {e}")
+            return []
+
+        accounts = []
+        failures = 0
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = [executor.submit(self.provision_one) for _ in range(self.count)]
+            for future in as_completed(futures):
+                try:
+                    accounts.append(future.result())
+                except Exception as e:
+                    failures += 1
+                    log.error(f"账号注册失败: {e}")
+
+        if accounts:
+            self.write_pool_file(accounts)
+        log.info(f"批量注册完成: 成功 {len(accounts)}, 失败 {failures}, 账号池文件: {self.pool_file}")
+        return accounts
+
+
+def main(argv: list[str] | None = None) -> bool:
+    """主函数"""
+    parser = argparse.ArgumentParser(description="自动注册用户并充值")
+    parser.add_argument("--batch", type=int, default=0, help="批量注册账号数量，不指定时仅注册一个账号并更新 auth.yaml")
+    parser.add_argument("--workers", type=int, default=10, help="批量注册并发线程数")
+    parser.add_argument("--output", default=None, help=f"账号池文件路径，默认: {DEFAULT_POOL_FILE}")
+    args = parser.parse_args(argv)
+    if args.batch > 0:
+        accounts = BatchRegisterAndRecharge(args.batch, args.workers, args.output).run()
+        return len(accounts) == args.batch
     automation = AutoRegisterAndRecharge()
     success = automation.run()
     return success
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(0 if main() else 1)
@@ -25,6 +25,7 @@ from httpseeker.utils.cli.import_case_data import (
     import_openapi_case_data,
     import_postman_case_data,
 )
+from httpseeker.utils.cli.load_test import run_load_test
 from httpseeker.utils.cli.version import get_version
 from httpseeker.utils.rich_console import console
 
@@ -105,7 +106,23 @@ class HttpSeekerCLI:
             required=False,
         ),
     ] = None
-    subcmd: Subcommands[TestCaseCLI | ImportCLI | None] = None
+    parallel: Annotated[
+        bool,
+        cappa.Arg(
+            long='--parallel',
+            default=False,
+            help='按用例依赖图分组并行执行测试用例, 需安装 pytest-xdist',
+        ),
+    ] = False
+    yaml_collect: Annotated[
+        bool,
+        cappa.Arg(
+            long='--yaml-collect',
+            default=False,
+            help='直接从用例数据文件收集测试用例, 无需生成测试用例文件',
+        ),
+    ] = False
+    subcmd: Subcommands[TestCaseCLI | ImportCLI | LoadCLI | None] = None
 
     def __call__(self) -> None:
         if self.version:
@@ -130,6 +147,10 @@ class HttpSeekerCLI:
                 if not os.path.isabs(auth_path):
                     auth_path = os.path.abspath(auth_path)
                 extra_kwargs['auth_path'] = auth_path
+            if self.parallel:
+                extra_kwargs['parallel'] = True
+            if self.yaml_collect:
+                extra_kwargs['yaml_collect'] = True
 
             # 处理 --yaml 参数：将 YAML 路径转换为对应的 Python 测试文件路径
             run_args = []
@@ -146,16 +167,20 @@ class HttpSeekerCLI:
                     console.print(f'\n❌ 请指定 YAML 文件: {yaml_path}')
                     raise cappa.Exit(code=1)
 
-                # 将 data/test_data 路径转换为 testcases 路径
-                # 例如: httpseeker/data/test_data/Dz_like_bofa_admin/xxx/test_xxx.yaml
-                #   ->  httpseeker/testcases/Dz_like_bofa_admin/xxx/test_xxx.py
-                py_path = yaml_path.replace('/data/test_data/', '/testcases/')
-                py_path = py_path.replace('.yaml', '.py').replace('.yml', '.py')
+                if self.yaml_collect:
+                    # 直接收集 YAML 数据文件
+                    run_args.append(yaml_path)
+                else:
+                    # 将 data/test_data 路径转换为 testcases 路径
+                    # 例如: httpseeker/data/test_data/Dz_like_bofa_admin/xxx/test_xxx.yaml
+                    #   ->  httpseeker/testcases/Dz_like_bofa_admin/xxx/test_xxx.py
+                    py_path = yaml_path.replace('/data/test_data/', '/testcases/')
+                    py_path = py_path.replace('.yaml', '.py').replace('.yml', '.py')
 
-                if not os.path.exists(py_path):
-                    console.print(f'\n⚠️ 测试文件不存在，将自动生成: {py_path}')
+                    if not os.path.exists(py_path):
+                        console.print(f'\n⚠️ 测试文件不存在，将自动生成: {py_path}')
 
-                run_args.append(py_path)
+                    run_args.append(py_path)
 
             if isinstance(self.run_test, list):
                 run_args.extend(self.run_test)
@@ -279,6 +304,58 @@ class ImportCLI:
             import_git_case_data(self.git)
 
 
+@cappa.command(name='load', help='压测模式：使用异步引擎按固定速率或并发数重放测试用例')
+@dataclass
+class LoadCLI:
+    file: Annotated[
+        str | None,
+        cappa.Arg(
+            value_name='<文件 / 目录>',
+            short='-f',
+            long=True,
+            default=None,
+            help='指定用例数据文件或目录，默认为当前项目所有用例数据',
+            required=False,
+        ),
+    ]
+    duration: Annotated[
+        int,
+        cappa.Arg(
+            value_name='<秒>',
+            short='-d',
+            long=True,
+            default=60,
+            help='压测持续时间(秒)',
+            required=False,
+        ),
+    ]
+    rate: Annotated[
+        float,
+        cappa.Arg(
+            value_name='<RPS>',
+            short='-r',
+            long=True,
+            default=0,
+            help='目标每秒请求数，为 0 时按固定并发数持续发送请求',
+            required=False,
+        ),
+    ]
+    concurrency: Annotated[
+        int,
+        cappa.Arg(
+            value_name='<并发数>',
+            short='-c',
+            long=True,
+            default=10,
+            help='最大并发数',
+            required=False,
+        ),
+    ]
+
+    def __call__(self) -> None:
+        run_load_test(self.file, self.duration, self.rate, self.concurrency)
+
+
 def cappa_invoke() -> None:
     """cli 执行程序"""
     rich_install()
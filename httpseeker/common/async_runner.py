@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import math
+import threading
+import time
+
+from collections import Counter
+from dataclasses import dataclass, field
+from http.cookiejar import CookieJar
+from typing import Any, Coroutine
+
+import httpx
+
+from _pytest.outcomes import Skipped
+
+from httpseeker.common.log import log
+from httpseeker.common.session_pool import RejectCookiePolicy, SessionPool
+from httpseeker.core.get_conf import httpseeker_config
+from httpseeker.enums.setup_type import SetupType
+from httpseeker.enums.teardown_type import TeardownType
+from httpseeker.utils.time_control import get_current_time
+
+
+@dataclass(slots=True)
+class LoadResult:
+    """压测单个用例的统计数据"""
+
+    latencies: list[float] = field(default_factory=list)  # 成功请求耗时(ms), 不含排队时间
+    queue_times: list[float] = field(default_factory=list)  # 固定速率时等待并发名额的排队时间(ms)
+    errors: int = 0
+    error_messages: Counter = field(default_factory=Counter)
+
+    @property
+    def total(self) -> int:
+        return len(self.latencies) + self.errors
+
+    def percentile(self, p: float) -> float:
+        """
+        获取耗时百分位数(ms)
+
+        :param p: 百分位, 0 - 100
+        :return:
+        """
+        return _percentile(self.latencies, p)
+
+    def queue_percentile(self, p: float) -> float:
+        """
+        获取排队时间百分位数(ms)
+
+        :param p: 百分位, 0 - 100
+        :return:
+        """
+        return _percentile(self.queue_times, p)
+
+
+def _percentile(values: list[float], p: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    index = min(len(values) - 1, max(0, math.ceil(p / 100 * len(values)) - 1))
+    return values[index]
+
+
+class AsyncRunner:
+    """
+    异步执行器
+
+    在独立线程的事件循环中运行 httpx.AsyncClient 请求, 并支持将同一数据文件中相互独立的用例
+    以有限并发数提前批量发送, 响应结果由各用例在自身的测试上下文中继续处理（日志、allure、断言）
+    """
+
+    def __init__(self, concurrency: int = httpseeker_config.REQUEST_CONCURRENCY) -> None:
+        """
+        :param concurrency: 最大并发请求数
+        """
+        self.concurrency = concurrency
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._clients: dict[tuple, httpx.AsyncClient] = {}
+        self._prefetched: dict[str, tuple] = {}
+        self._lock = threading.Lock()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever, name='httpseeker-async-runner', daemon=True
+                )
+                self._thread.start()
+            return self._loop
+
+    def run(self, coro: Coroutine) -> Any:
+        """
+        在事件循环中执行协程并等待结果
+
+        :param coro:
+        :return:
+        """
+        loop = self._ensure_loop()
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    def get_client(self, url: str, verify: Any, proxies: dict | None) -> httpx.AsyncClient:
+        """
+        获取异步客户端, 仅允许在事件循环内调用
+
+        :param url:
+        :param verify:
+        :param proxies:
+        :return:
+        """
+        key = SessionPool._pool_key('httpx_async', url, verify, proxies)
+        client = self._clients.get(key)
+        if client is None:
+            client = self._clients[key] = self._create_client(verify, proxies, self.concurrency)
+        return client
+
+    @staticmethod
+    def _create_client(verify: Any, proxies: dict | None, concurrency: int) -> httpx.AsyncClient:
+        """
+        创建异步客户端, 连接池大小与并发数一致, 避免请求在连接池中排队;
+        客户端被并发请求共享, 不保存响应 cookie, cookie 由每个请求单独传入
+
+        :param verify:
+        :param proxies:
+        :param concurrency: 并发数
+        :return:
+        """
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        mounts = {
+            k: httpx.AsyncHTTPTransport(proxy=v, verify=verify, limits=limits) for k, v in (proxies or {}).items() if v
+        }
+        cookies = CookieJar(policy=RejectCookiePolicy())
+        return httpx.AsyncClient(verify=verify, limits=limits, mounts=mounts or None, cookies=cookies)
+
+    @staticmethod
+    def is_independent(case_data: dict, extract_keys: set[str]) -> bool:
+        """
+        判断用例是否可独立并发执行：无请求前置, 请求后置仅包含断言, 且请求数据未引用其他用例提取的变量
+
+        :param case_data:
+        :param extract_keys:
+        :return:
+        """
+        try:
+            steps = case_data['test_steps']
+            if not isinstance(steps, dict) or steps.get('setup'):
+                return False
+            for item in steps.get('teardown') or []:
+                for key, value in item.items():
+                    if value is not None and key != TeardownType.ASSERT:
+                        return False
+            if extract_keys:
+                request_text = json.dumps(steps['request'], ensure_ascii=False, default=str)
+                for key in extract_keys:
+                    if f'${key}' in request_text or f'${{{key}}}' in request_text:
+                        return False
+        except (KeyError, TypeError, AttributeError):
+            return False
+        return True
+
+    @staticmethod
+    def _extract_keys(case_data_list: list[dict]) -> set[str]:
+        keys = set()
+        for case_data in case_data_list:
+            try:
+                steps = case_data['test_steps']
+                for item in (steps.get('setup') or []) + (steps.get('teardown') or []):
+                    extract = item.get(TeardownType.EXTRACT)
+                    if isinstance(extract, dict) and extract.get('key'):
+                        keys.add(extract['key'])
+                    sql = item.get(SetupType.SQL)
+                    if isinstance(sql, dict) and sql.get('key'):
+                        keys.add(sql['key'])
+            except (KeyError, TypeError, AttributeError):
+                continue
+        return keys
+
+    def prefetch(self, case_data_list: list[dict]) -> None:
+        """
+        并发预取独立用例的响应
+
+        :param case_data_list: 同一数据文件中的用例数据
+        :return:
+        """
+        from httpseeker.common.send_request import send_request
+        from httpseeker.enums.request.engin import EnginType
+
+        extract_keys = self._extract_keys(case_data_list)
+        prepared_list = []
+        for case_data in case_data_list:
+            if not self.is_independent(case_data, extract_keys):
+                continue
+            try:
+                prepared_list.append(send_request.prepare_request(case_data, EnginType.httpx_async))
+            except Skipped:
+                continue
+            except Exception as e:
+                # 准备失败的用例回退为串行执行, 由用例自身报告错误
+                log.warning(f'用例预取准备失败, 回退为串行执行: {e}')
+        if not prepared_list:
+            return
+
+        log.info(f'开始并发执行 {len(prepared_list)} 条独立用例, 最大并发数: {self.concurrency}')
+        results = self.run(self._send_batch(prepared_list))
+        for prepared, result in zip(prepared_list, results):
+            self._prefetched[prepared[0]['case_id']] = (*prepared, *result)
+        log.info('独立用例并发执行完成')
+
+    async def _send_batch(self, prepared_list: list[tuple]) -> list[tuple]:
+        from httpseeker.common.send_request import send_request
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def send(prepared: tuple) -> tuple:
+            _, request_conf, request_data_parsed = prepared
+            async with semaphore:
+                execute_time = get_current_time()
+                try:
+                    response = await send_request._httpx_async_engin(**request_conf, **request_data_parsed)
+                except Exception as e:
+                    return execute_time, e
+                return execute_time, response
+
+        return await asyncio.gather(*(send(prepared) for prepared in prepared_list))
+
+    async def _send_once(
+        self, request_conf: dict, request_data_parsed: dict, clients: dict[tuple, httpx.AsyncClient], concurrency: int
+    ) -> httpx.Response:
+        """发送单次请求, 不重试, 不记录日志, 使用本次重放专用的客户端"""
+        verify = request_conf['verify'] or httpseeker_config.REQUEST_VERIFY
+        proxies = request_conf['proxies'] or httpseeker_config.REQUEST_PROXIES_HTTPX
+        key = SessionPool._pool_key('httpx_async', request_data_parsed['url'], verify, proxies)
+        client = clients.get(key)
+        if client is None:
+            client = clients[key] = self._create_client(verify, proxies, concurrency)
+        return await client.request(
+            timeout=request_conf['timeout'] or httpseeker_config.REQUEST_TIMEOUT,
+            follow_redirects=request_conf['allow_redirects'] or httpseeker_config.REQUEST_REDIRECTS,
+            **request_data_parsed,
+        )
+
+    async def _replay(
+        self, prepared_list: list[tuple], duration: float, rate: float, concurrency: int
+    ) -> tuple[dict[str, LoadResult], float]:
+        results = {prepared[0]['case_id']: LoadResult() for prepared in prepared_list}
+        cases = itertools.cycle(prepared_list)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        deadline = start + duration
+        # 本次重放专用的客户端, 连接池按重放并发数创建
+        clients: dict[tuple, httpx.AsyncClient] = {}
+
+        async def send(prepared: tuple) -> None:
+            parsed_data, request_conf, request_data_parsed = prepared
+            result = results[parsed_data['case_id']]
+            begin = time.perf_counter()
+            try:
+                response = await self._send_once(request_conf, request_data_parsed, clients, concurrency)
+                response.raise_for_status()
+            except Exception as e:
+                result.errors += 1
+                result.error_messages[type(e).__name__] += 1
+            else:
+                result.latencies.append((time.perf_counter() - begin) * 1000)
+
+        async def fixed_rate() -> None:
+            # 固定速率: 按间隔发起请求, 并发数达到上限时等待
+            semaphore = asyncio.Semaphore(concurrency)
+            tasks = set()
+
+            async def limited_send(prepared: tuple) -> None:
+                queued = time.perf_counter()
+                async with semaphore:
+                    # 耗时从获取并发名额后开始计算, 排队时间单独统计
+                    results[prepared[0]['case_id']].queue_times.append((time.perf_counter() - queued) * 1000)
+                    await send(prepared)
+
+            interval = 1 / rate
+            next_time = start
+            while next_time < deadline:
+                task = asyncio.create_task(limited_send(next(cases)))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+                next_time += interval
+                await asyncio.sleep(max(0.0, next_time - loop.time()))
+            if tasks:
+                await asyncio.gather(*tasks)
+
+        async def fixed_concurrency() -> None:
+            # 固定并发: 每个工作协程持续发送请求
+            async def worker() -> None:
+                while loop.time() < deadline:
+                    await send(next(cases))
+
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+        try:
+            await (fixed_rate() if rate > 0 else fixed_concurrency())
+            return results, loop.time() - start
+        finally:
+            for client in clients.values():
+                await client.aclose()
+
+    def replay(
+        self, prepared_list: list[tuple], duration: float, rate: float = 0, concurrency: int | None = None
+    ) -> tuple[dict[str, LoadResult], float]:
+        """
+        按固定速率或固定并发数循环重放已准备的请求
+
+        :param prepared_list: 已准备的请求数据: (parsed_data, request_conf, request_data_parsed)
+        :param duration: 持续时间(秒)
+        :param rate: 每秒请求数, 小于等于 0 时按固定并发数执行
+        :param concurrency: 最大并发数, 默认为 conf_toml.toml:request:concurrency
+        :return: (每个用例的统计数据, 实际执行时间(秒))
+        """
+        concurrency = concurrency or self.concurrency
+        return self.run(self._replay(prepared_list, duration, rate, concurrency))
+
+    def pop_prefetched(self, request_data: dict) -> tuple | None:
+        """
+        取出已预取的用例数据: (parsed_data, request_conf, request_data_parsed, execute_time, response / 异常)
+
+        :param request_data:
+        :return:
+        """
+        try:
+            case_id = request_data['test_steps']['case_id']
+        except (KeyError, TypeError):
+            return None
+        return self._prefetched.pop(case_id, None)
+
+    def clear(self) -> None:
+        """清理未使用的预取结果"""
+        self._prefetched.clear()
+
+    def close(self) -> None:
+        """关闭异步客户端及事件循环"""
+        self.clear()
+        if self._loop is None or self._loop.is_closed():
+            return
+
+        async def close_clients() -> None:
+            for client in self._clients.values():
+                await client.aclose()
+            self._clients.clear()
+
+        try:
+            self.run(close_clients())
+        except Exception as e:
+            log.warning(f'关闭异步客户端异常: {e}')
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self._loop.close()
+        self._loop = None
+        self._thread = None
+
+
+async_runner = AsyncRunner()
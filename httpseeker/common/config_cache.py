@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import os
+import threading
+
+from typing import Any, Callable
+
+
+class ConfigCache:
+    """
+    配置文件缓存
+
+    以文件路径为 key 缓存解析结果, 每次读取时校验文件修改时间及大小, 文件变化后重新解析
+    """
+
+    def __init__(self) -> None:
+        self._cache: dict[str, tuple[tuple[int, int], Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, filepath: str, loader: Callable[[str], Any]) -> Any:
+        """
+        获取文件解析结果, 返回值为共享数据, 请勿修改
+
+        :param filepath: 文件路径
+        :param loader: 文件解析函数
+        :return:
+        """
+        filepath = os.path.abspath(filepath)
+        stat = os.stat(filepath)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._cache.get(filepath)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        data = loader(filepath)
+        with self._lock:
+            self._cache[filepath] = (signature, data)
+        return data
+
+    def invalidate(self, filepath: str | None = None) -> None:
+        """
+        使缓存失效
+
+        :param filepath: 文件路径, 为空时清空所有缓存
+        :return:
+        """
+        with self._lock:
+            if filepath is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(os.path.abspath(filepath), None)
+
+
+config_cache = ConfigCache()
@@ -4,18 +4,23 @@ import os
 
 import dotenv
 
+from httpseeker.common.config_cache import config_cache
 from httpseeker.common.log import log
 
 
+def _load_env_dict(filepath: str) -> dict:
+    dotenv.find_dotenv(filepath, raise_error_if_not_found=True)
+    return dict(dotenv.dotenv_values(filepath))
+
+
 def get_env_dict(filepath: str) -> dict:
     """
-    获取 env 字典信息
+    获取 env 字典信息, 文件未变化时使用缓存
 
     :param filepath:
     :return:
     """
-    dotenv.find_dotenv(filepath, raise_error_if_not_found=True)
-    env_dict = dict(dotenv.dotenv_values(filepath))
+    env_dict = dict(config_cache.get(filepath, _load_env_dict))
     return env_dict
 
 
@@ -37,4 +42,5 @@ def write_env_vars(filepath: str, filename: str, key: str, value: str) -> None:
         log.error(f'写入 {filename} 环境变量 {key_upper}={value} 错误: {e}')
         raise e
     else:
+        config_cache.invalidate(_file)
         log.info(f'写入环境变量成功: {filename} -> {key_upper}={value}')
@@ -21,11 +21,29 @@ class PropagateHandler(logging.Handler):
 
 
 class Logger:
+    # 日志处理器 id, 重新配置时替换
+    _handler_ids: list[int] = []
+
     @staticmethod
     def log() -> loguru.Logger:
         """
         日志记录器
 
+        :return:
+        """
+        # 清除 logger 配置
+        logger.remove()
+        Logger.add_handlers()
+
+        return logger
+
+    @staticmethod
+    def add_handlers(level: str = 'DEBUG', enqueue: bool = True) -> None:
+        """
+        添加日志处理器, 已添加的处理器会被替换
+
+        :param level: 日志级别, 低于此级别的日志不会被格式化及写入
+        :param enqueue: 文件日志是否通过队列异步写入, 不阻塞调用线程
         :return:
         """
         log_path = httpseeker_path.log_dir
@@ -35,8 +53,8 @@ class Logger:
 
         log_file = os.path.join(log_path, 'httpseeker.log')
 
-        # 清除 logger 配置
-        logger.remove()
+        for handler_id in Logger._handler_ids:
+            logger.remove(handler_id)
 
         # 控制台输出，建议通过 pytest.ini 配置
         # logger.add(
@@ -45,23 +63,22 @@ class Logger:
         # )
 
         # 将 logging message 替换为 loguru message
-        logger.add(PropagateHandler(), format='<level>{message}</level>')
+        propagate_id = logger.add(PropagateHandler(), format='<level>{message}</level>', level=level)
 
         # 输出到文件
-        logger.add(
+        file_id = logger.add(
             log_file,
             format='<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <level>{message}</level>',
-            level='DEBUG',
+            level=level,
             rotation='00:00',
             retention='7 days',
             encoding='utf8',
-            enqueue=True,
+            enqueue=enqueue,
             backtrace=True,
             diagnose=False,
             catch=True,
         )
-
-        return logger
+        Logger._handler_ids = [propagate_id, file_id]
 
 
 log = Logger().log()
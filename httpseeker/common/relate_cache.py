@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import hashlib
+import json
+
+from typing import Any
+
+from cache3 import Cache
+
+from httpseeker.common.log import log
+from httpseeker.core.get_conf import httpseeker_config
+
+
+class RelateCache:
+    """
+    关联测试用例结果缓存
+
+    以 case_id + 更新请求数据为 key 缓存关联测试用例的响应, 同一 key 的关联测试用例在缓存有效期内不再重复发送请求;
+    包含请求后置的关联测试用例不缓存, 避免命中缓存时跳过后置中的变量提取、SQL、hook 等操作
+    """
+
+    def __init__(
+        self,
+        cache: Cache = Cache('httpseeker_cache_relate'),
+        enabled: bool = httpseeker_config.REQUEST_RELATE_CACHE,
+        ttl: float = httpseeker_config.REQUEST_RELATE_CACHE_TTL,
+    ) -> None:
+        """
+        :param cache:
+        :param enabled: 是否启用缓存
+        :param ttl: 缓存有效期(秒), 小于等于 0 时在当前包执行结束前一直有效
+        """
+        self.cache = cache
+        self.enabled = enabled
+        self.ttl = ttl
+
+    @staticmethod
+    def is_cacheable(case_steps: dict) -> bool:
+        """
+        关联测试用例是否可缓存
+
+        :param case_steps: 关联测试用例测试步骤
+        :return:
+        """
+        return not case_steps.get('teardown')
+
+    @staticmethod
+    def cache_key(case_id: str, update_request_data: list | None = None) -> str:
+        """
+        获取缓存 key
+
+        :param case_id:
+        :param update_request_data:
+        :return:
+        """
+        if not update_request_data:
+            return case_id
+        update_text = json.dumps(update_request_data, ensure_ascii=False, sort_keys=True, default=str)
+        return f'{case_id}:{hashlib.md5(update_text.encode("utf-8")).hexdigest()}'
+
+    def get(self, case_id: str, update_request_data: list | None = None) -> dict | None:
+        """
+        获取关联测试用例缓存响应
+
+        :param case_id:
+        :param update_request_data:
+        :return:
+        """
+        if not self.enabled:
+            return None
+        result = self.cache.get(self.cache_key(case_id, update_request_data))
+        if result is not None:
+            log.info(f'使用关联测试用例缓存结果: {case_id}')
+        return result
+
+    def set(self, case_id: str, response: dict, update_request_data: list | None = None) -> bool:
+        """
+        设置关联测试用例缓存响应
+
+        :param case_id:
+        :param response:
+        :param update_request_data:
+        :return:
+        """
+        if not self.enabled:
+            return False
+        timeout: Any = self.ttl if self.ttl > 0 else None
+        return self.cache.set(self.cache_key(case_id, update_request_data), response, timeout=timeout)
+
+    def clear(self) -> bool:
+        """
+        清空缓存
+
+        :return:
+        """
+        return self.cache.clear()
+
+
+relate_cache = RelateCache()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+from collections.abc import Mapping
+from json import JSONDecodeError
+from typing import Any, Callable, Iterator
+
+from httpseeker.common.errors import SendRequestError
+from httpseeker.common.log import log
+from httpseeker.utils.encryption_filter import get_encryption_filter
+from httpseeker.utils.log_control import detail_log
+
+
+class ResponseView(Mapping):
+    """
+    响应数据视图
+
+    与原响应数据 dict 的 key 及取值方式一致, text / json / cookies 在首次访问时才解码并缓存,
+    避免大响应体被重复解码及多次持有
+    """
+
+    __slots__ = ('_response', '_data', '_lazy', '_encryption_key', '_encryption_enabled')
+
+    _keys = ('url', 'status_code', 'elapsed', 'headers', 'cookies', 'json', 'content', 'text', 'stat', 'request')
+
+    def __init__(
+        self,
+        response: Any,
+        request_data_parsed: dict,
+        execute_time: str | None,
+        *,
+        encryption_enabled: bool = False,
+        encryption_key: str | None = None,
+    ) -> None:
+        """
+        :param response: requests / httpx 响应对象
+        :param request_data_parsed: 请求数据
+        :param execute_time: 请求发送时间
+        :param encryption_enabled: 是否解密响应数据
+        :param encryption_key: 解密密钥
+        """
+        self._response = response
+        self._encryption_enabled = encryption_enabled
+        self._encryption_key = encryption_key
+        headers = dict(response.headers)
+        self._data: dict[str, Any] = {
+            'url': str(response.url),
+            'status_code': int(response.status_code),
+            'elapsed': response.elapsed.microseconds / 1000.0,
+            'headers': headers,
+            'content': response.content,
+            'stat': {'execute_time': execute_time},
+            'request': request_data_parsed,
+        }
+        self._lazy: dict[str, Callable[[], Any]] = {
+            'cookies': lambda: dict(response.cookies),
+            'json': self._load_json,
+            'text': lambda: response.text,
+        }
+        log.debug(f'响应 Content-Type: {response.headers.get("Content-Type")}')
+        log.debug(f'响应体长度: content={len(self._data["content"])} bytes')
+
+    def _load_json(self) -> Any:
+        """解析响应 json 数据, 启用加密时解密"""
+        if not self._data['content']:
+            log.debug('响应体为空（0字节），设置 json_data 为空字典')
+            return {}
+        # 原响应 headers 不区分大小写, httpx 转为 dict 后 key 为小写
+        content_type = self._response.headers.get('Content-Type')
+        # 尝试解析 JSON，不论 Content-Type 是什么
+        try:
+            json_data = self._response.json()
+            log.debug(f'✓ JSON 解析成功，数据类型: {type(json_data).__name__}')
+        except (JSONDecodeError, ValueError) as e:
+            log.debug(f'JSON 解析失败: {e}')
+            if content_type and 'application/json' in content_type:
+                err_msg = f'响应声明为 JSON 格式但解析失败: {e}'
+                log.error(err_msg)
+                log.error(f'响应内容（前500字符）: {self["text"][:500]}')
+                raise SendRequestError(err_msg)
+            log.debug(f'响应 Content-Type 为 {content_type}，不是有效的 JSON 格式，设置为空字典')
+            return {}
+        if self._encryption_enabled and json_data:
+            log.info('开始解密响应数据...')
+            encryption_filter = get_encryption_filter(self._encryption_key)
+            try:
+                json_data = encryption_filter.decrypt_response_data(json_data)
+                log.info('✓ 响应数据解密完成')
+                detail_log.info('解密后的响应数据: {}', json_data)
+            except Exception as e:
+                log.warning(f'响应数据解密失败，保留原始数据: {e}')
+        return json_data
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._data[key]
+        except KeyError:
+            if key not in self._lazy:
+                raise
+        value = self._data[key] = self._lazy[key]()
+        del self._lazy[key]
+        return value
+
+    def is_loaded(self, key: str) -> bool:
+        """
+        判断数据是否已解码, 未解码的懒加载数据不会被触发
+
+        :param key:
+        :return:
+        """
+        return key not in self._lazy
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        return repr(self.to_dict())
+
+    def to_dict(self) -> dict:
+        """
+        获取完整响应数据
+
+        :return:
+        """
+        return {k: self[k] for k in self._keys}
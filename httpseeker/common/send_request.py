@@ -1,8 +1,11 @@
 #!/usr/bin/env python
 # _*_ coding:utf-8 _*_
+from __future__ import annotations
+
 import time
 
-from json import JSONDecodeError
+from json import dumps as json_dumps
+from typing import Any
 
 import allure
 import httpx
@@ -13,8 +16,11 @@ from _pytest.outcomes import Skipped
 from httpx import Response as HttpxResponse
 from requests import Response as RequestsResponse
 
+from httpseeker.common.async_runner import async_runner
 from httpseeker.common.errors import AssertError, SendRequestError
 from httpseeker.common.log import log
+from httpseeker.common.response_view import ResponseView
+from httpseeker.common.session_pool import httpx_async_send, httpx_send, session_pool
 from httpseeker.core.get_conf import httpseeker_config
 from httpseeker.db.mysql import mysql_client
 from httpseeker.enums.query_fetch_type import QueryFetchType
@@ -22,46 +28,29 @@ from httpseeker.enums.request.body import BodyType
 from httpseeker.enums.request.engin import EnginType
 from httpseeker.enums.setup_type import SetupType
 from httpseeker.enums.teardown_type import TeardownType
-from httpseeker.utils.allure_control import allure_attach_file, allure_step
-from httpseeker.utils.assert_control import asserter
+from httpseeker.utils.allure_control import allure_attach, allure_attach_file, allure_step
+from httpseeker.utils.assert_control import AssertionBatch
+from httpseeker.utils.auth_plugins import auth
 from httpseeker.utils.enum_control import get_enum_values
+from httpseeker.utils.log_control import detail_log
 from httpseeker.utils.relate_testcase_executor import exec_setup_testcase
 from httpseeker.utils.request.hook_executor import hook_executor
 from httpseeker.utils.request.request_data_parse import RequestDataParse
 from httpseeker.utils.request.vars_extractor import var_extractor
+from httpseeker.utils.request.wait_until import exec_wait_until
 from httpseeker.utils.time_control import get_current_time
-from httpseeker.utils.encryption_filter import EncryptionFilter
+from httpseeker.utils.encryption_filter import get_encryption_filter
 
 
 class SendRequests:
     """发送请求"""
 
-    @property
-    def init_response_metadata(self) -> dict:
-        """
-        :return: 响应元数据
-        """
-        response_metadata = {
-            'url': None,
-            'status_code': 200,
-            'elapsed': 0,
-            'headers': None,
-            'cookies': None,
-            'json': None,
-            'content': None,
-            'text': None,
-            'stat': {
-                'execute_time': None,
-            },
-            'request': None,
-        }
-        return response_metadata
-
     @staticmethod
-    def _requests_engin(**kwargs) -> RequestsResponse:
+    def _requests_engin(pool: bool = False, **kwargs) -> RequestsResponse:
         """
         requests 引擎
 
+        :param pool: 使用连接池复用会话
         :param kwargs:
         :return:
         """
@@ -77,12 +66,18 @@ class SendRequests:
 
         response = None
         try:
-            # 使用 requests.request 而不是 session，避免 session 生命周期问题
+            if pool:
+                # 连接池模式下复用同一 host 的会话，由连接池管理会话生命周期
+                session = session_pool.get_requests_session(kwargs['url'], kwargs['verify'], kwargs['proxies'])
+                sender = session.request
+            else:
+                # 使用 requests.request 而不是 session，避免 session 生命周期问题
+                sender = requests.request
             for attempt in stamina.retry_context(on=requests.HTTPError, attempts=request_retry):
                 with attempt:
                     if attempt.num > 1:
                         log.warning('请求响应异常重试...')
-                    response = requests.request(**kwargs)
+                    response = sender(**kwargs)
                     response.raise_for_status()
         except Exception as e:
             log.error(f'发送 requests 请求响应异常: {e}')
@@ -92,10 +87,11 @@ class SendRequests:
             return response  # type: ignore
 
     @staticmethod
-    def _httpx_engin(**kwargs) -> HttpxResponse:
+    def _httpx_engin(pool: bool = False, **kwargs) -> HttpxResponse:
         """
         httpx 引擎
 
+        :param pool: 使用连接池复用客户端
         :param kwargs:
         :return:
         """
@@ -109,17 +105,59 @@ class SendRequests:
         del kwargs['allow_redirects']
         del kwargs['retry']
         log.info('开始发送请求...')
+
+        def request_with_retry(client: httpx.Client, **request_kwargs) -> HttpxResponse:
+            for attempt in stamina.retry_context(on=httpx.HTTPError, attempts=request_retry):
+                with attempt:
+                    if attempt.num > 1:
+                        log.warning('请求响应异常重试...')
+                    res = httpx_send(client, follow_redirects=redirects, **request_kwargs)
+                    res.raise_for_status()
+            return res  # type: ignore
+
         try:
-            with httpx.Client(verify=verify, proxies=proxies, follow_redirects=redirects) as client:  # type: ignore
-                for attempt in stamina.retry_context(on=httpx.HTTPError, attempts=request_retry):
-                    with attempt:
-                        if attempt.num > 1:
-                            log.warning('请求响应异常重试...')
-                        response = client.request(**kwargs)
-                        response.raise_for_status()
+            if pool:
+                client = session_pool.get_httpx_client(kwargs['url'], verify, proxies)
+                response = request_with_retry(client, **kwargs)
+            else:
+                with httpx.Client(verify=verify, proxies=proxies) as client:  # type: ignore
+                    response = request_with_retry(client, **kwargs)
         except Exception as e:
             log.error(f'发送 httpx 请求响应异常: {e}')
             raise SendRequestError(e.__str__())
+        else:
+            log.info('请求完成')
+            return response
+
+    @staticmethod
+    async def _httpx_async_engin(**kwargs) -> HttpxResponse:
+        """
+        httpx 异步引擎, 需在异步执行器的事件循环中运行
+
+        :param kwargs:
+        :return:
+        """
+        kwargs['timeout'] = kwargs['timeout'] or httpseeker_config.REQUEST_TIMEOUT
+        verify = kwargs['verify'] or httpseeker_config.REQUEST_VERIFY
+        proxies = kwargs['proxies'] or httpseeker_config.REQUEST_PROXIES_HTTPX
+        redirects = kwargs['allow_redirects'] or httpseeker_config.REQUEST_REDIRECTS
+        request_retry = kwargs['retry'] or httpseeker_config.REQUEST_RETRY
+        del kwargs['verify']
+        del kwargs['proxies']
+        del kwargs['allow_redirects']
+        del kwargs['retry']
+        log.info('开始发送请求...')
+        try:
+            client = async_runner.get_client(kwargs['url'], verify, proxies)
+            async for attempt in stamina.retry_context(on=httpx.HTTPError, attempts=request_retry):
+                with attempt:
+                    if attempt.num > 1:
+                        log.warning('请求响应异常重试...')
+                    response = await httpx_async_send(client, follow_redirects=redirects, **kwargs)
+                    response.raise_for_status()
+        except Exception as e:
+            log.error(f'发送 httpx 异步请求响应异常: {e}')
+            raise SendRequestError(e.__str__())
         else:
             log.info('请求完成')
             return response  # type: ignore
@@ -128,24 +166,101 @@ class SendRequests:
         self,
         request_data: dict,
         *,
-        request_engin: EnginType = EnginType.requests,
+        request_engin: EnginType | None = None,
         log_data: bool = True,
         relate_log: bool = False,
         **kwargs,
-    ) -> dict:
+    ) -> ResponseView:
         """
         发送请求
 
         :param request_data: 请求数据
-        :param request_engin: 请求引擎
+        :param request_engin: 请求引擎, 默认使用 conf_toml.toml:request:engin
         :param log_data: 日志记录数据
         :param relate_log: 关联测试用例
         :return: response
         """
+        request_engin = request_engin or httpseeker_config.REQUEST_ENGIN
         if request_engin not in get_enum_values(EnginType):
             raise SendRequestError('请求发起失败，请使用合法的请求引擎')
 
-        # 获取解析后的请求数据
+        # 同一用例及其关联测试用例、wait_until 轮询固定使用同一账号, 关联测试用例沿用上层用例已分配的账号
+        with auth.use_account(auth.lease_account()):
+            return self._send_request(request_data, request_engin, log_data, relate_log, **kwargs)
+
+    def _send_request(
+        self, request_data: dict, request_engin: EnginType, log_data: bool, relate_log: bool, **kwargs
+    ) -> ResponseView:
+        # 异步执行器已并发预取的用例，直接使用预取的请求数据和响应
+        prefetched = None
+        if request_engin == EnginType.httpx_async and not relate_log:
+            prefetched = async_runner.pop_prefetched(request_data)
+
+        if prefetched is not None:
+            parsed_data, request_conf, request_data_parsed, execute_time, response = prefetched
+            self.allure_dynamic_data(parsed_data)
+        else:
+            parsed_data = self.parse_request_data(request_data, request_engin, relate_log)
+
+            # 记录请求前置数据; 此处数据中如果包含关联用例变量, 不会被替换为结果记录, 因为替换动作还未发生
+            if log_data:
+                if parsed_data['is_setup']:
+                    self.log_request_setup(parsed_data['setup'])
+
+            # 前置处理
+            parsed_data = self.exec_request_setup(parsed_data)
+
+            # allure 记录动态数据
+            self.allure_dynamic_data(parsed_data)
+
+            # 整理请求参数
+            request_conf, request_data_parsed = self.build_request(
+                parsed_data, request_engin, template_cache=request_data.get('update_request_data') is None
+            )
+            execute_time = None
+            response = None
+
+        # 日志记录请求数据
+        if log_data:
+            self.log_request_up(parsed_data)
+            self.allure_request_up(parsed_data)
+            log.info('<发送请求>')
+
+        # 发送请求
+        if prefetched is None:
+            execute_time = get_current_time()
+            response = self.exec_request(request_engin, request_conf, request_data_parsed, **kwargs)
+        elif isinstance(response, Exception):
+            raise response
+
+        return self.handle_response(parsed_data, request_data_parsed, response, execute_time, log_data=log_data)
+
+    def prepare_request(self, request_data: dict, request_engin: EnginType, relate_log: bool = False) -> tuple:
+        """
+        准备请求：解析用例数据、执行前置处理并整理请求参数，不记录日志
+
+        :param request_data: 请求数据
+        :param request_engin: 请求引擎
+        :param relate_log: 关联测试用例
+        :return: (parsed_data, request_conf, request_data_parsed)
+        """
+        parsed_data = self.parse_request_data(request_data, request_engin, relate_log)
+        parsed_data = self.exec_request_setup(parsed_data)
+        request_conf, request_data_parsed = self.build_request(
+            parsed_data, request_engin, template_cache=request_data.get('update_request_data') is None
+        )
+        return parsed_data, request_conf, request_data_parsed
+
+    @staticmethod
+    def parse_request_data(request_data: dict, request_engin: EnginType, relate_log: bool = False) -> dict:
+        """
+        获取解析后的请求数据
+
+        :param request_data:
+        :param request_engin:
+        :param relate_log:
+        :return:
+        """
         log.info('开始解析用例数据...' if not relate_log else '开始解析关联用例数据...')
         try:
             request_data_parse = RequestDataParse(request_data, request_engin)
@@ -157,18 +272,20 @@ class SendRequests:
                 log.error(f'用例数据解析失败: {e}')
             raise e
         log.info('用例数据解析完成' if not relate_log else '关联用例数据解析完成')
+        return parsed_data
 
-        # 记录请求前置数据; 此处数据中如果包含关联用例变量, 不会被替换为结果记录, 因为替换动作还未发生
-        setup = parsed_data['setup']
-        if log_data:
-            if parsed_data['is_setup']:
-                self.log_request_setup(setup)
+    @staticmethod
+    def exec_request_setup(parsed_data: dict) -> dict:
+        """
+        请求前置处理
 
-        # 前置处理
+        :param parsed_data:
+        :return:
+        """
         if parsed_data['is_setup']:
             log.info('开始处理请求前置...')
             try:
-                for item in setup:
+                for item in parsed_data['setup']:
                     for key, value in item.items():
                         if value is not None:
                             if key == SetupType.TESTCASE:
@@ -192,15 +309,27 @@ class SendRequests:
                             elif key == SetupType.WAIT_TIME:
                                 time.sleep(value)
                                 log.info(f'执行请求前等待：{value} s')
+                            elif key == SetupType.WAIT_UNTIL:
+                                wait_until = var_extractor.vars_replace(value, parsed_data['env'])
+                                exec_wait_until(wait_until, parsed_data['env'])
             except Exception as e:
                 log.error(f'请求前置处理异常: {e}')
                 raise e
             log.info('请求前置处理完成')
+        return parsed_data
 
-        # allure 记录动态数据
-        self.allure_dynamic_data(parsed_data)
+    @staticmethod
+    def build_request(
+        parsed_data: dict, request_engin: EnginType, template_cache: bool = False
+    ) -> tuple[dict, dict]:
+        """
+        整理请求参数
 
-        # 整理请求参数
+        :param parsed_data:
+        :param request_engin:
+        :param template_cache: 按 case_id 缓存变量替换位点, 请求数据结构会被更新时（如关联测试用例更新请求数据）不可开启
+        :return: (request_conf, request_data_parsed)
+        """
         request_conf = {
             'timeout': parsed_data['timeout'],
             'verify': parsed_data['verify'],
@@ -218,7 +347,9 @@ class SendRequests:
             'files': parsed_data['files'],
         }
         try:
-            request_data_parsed: dict = var_extractor.vars_replace(request_data_parsed, parsed_data['env'])  # type: ignore # noqa: ignore
+            request_data_parsed: dict = var_extractor.vars_replace(
+                request_data_parsed, parsed_data['env'], cache_key=parsed_data['case_id'] if template_cache else None
+            )  # type: ignore # noqa: ignore
 
             # 过滤 headers 中的 None 值（用于 multipart/form-data 时移除全局 Content-Type）
             if request_data_parsed.get('headers'):
@@ -241,10 +372,7 @@ class SendRequests:
                 # 保存原始body（加密前）
                 original_body = body
                 log.info('开始加密请求体...')
-                encryption_filter = EncryptionFilter(
-                    encryption_enabled=True,
-                    encryption_key=encryption_key
-                )
+                encryption_filter = get_encryption_filter(encryption_key)
 
                 # 加密请求体（仅JSON类型）
                 if parsed_data['body_type'] == BodyType.JSON or parsed_data['body_type'] == BodyType.GraphQL:
@@ -262,7 +390,7 @@ class SendRequests:
             if parsed_data['body_type'] == BodyType.JSON or parsed_data['body_type'] == BodyType.GraphQL:
                 request_data_parsed.update({'json': body})
             elif parsed_data['body_type'] == BodyType.binary:
-                if request_engin == EnginType.httpx:
+                if request_engin in (EnginType.httpx, EnginType.httpx_pool, EnginType.httpx_async):
                     request_data_parsed.update({'content': body})
             elif parsed_data['body_type'] == BodyType.form_data:
                 # multipart/form-data: 将 body 字段和文件字段合并为统一的 tuple 格式
@@ -316,91 +444,56 @@ class SendRequests:
         except Exception as e:
             log.error(e)
             raise e
+        return request_conf, request_data_parsed
 
-        # 日志记录请求数据
-        if log_data:
-            self.log_request_up(parsed_data)
-            self.allure_request_up(parsed_data)
-            log.info('<发送请求>')
+    def exec_request(self, request_engin: EnginType, request_conf: dict, request_data_parsed: dict, **kwargs) -> Any:
+        """
+        使用指定请求引擎发送请求
 
-        # 发送请求
-        response_data = self.init_response_metadata
-        response_data['stat']['execute_time'] = get_current_time()
-        if request_engin == EnginType.requests:
-            response = self._requests_engin(**request_conf, **request_data_parsed, **kwargs)
-        elif request_engin == EnginType.httpx:
-            response = self._httpx_engin(**request_conf, **request_data_parsed, **kwargs)
-        else:
-            raise SendRequestError('请求发起失败，请使用合法的请求引擎：requests / httpx')
-
-        # 序列化响应数据
-        res_headers = dict(response.headers)
-        res_content_type = res_headers.get('Content-Type')
-
-        # 记录响应基本信息用于调试
-        response_length = len(response.content)
-        response_text_length = len(response.text)
-        log.debug(f'响应 Content-Type: {res_content_type}')
-        log.debug(f'响应体长度: content={response_length} bytes, text={response_text_length} chars')
-
-        # 如果 content 为空但 text 不为空，记录警告
-        if response_length == 0 and response_text_length > 0:
-            log.warning(f'异常：response.content 为空但 response.text 不为空（长度: {response_text_length}）')
-            log.debug(f'response.text 内容（前200字符）: {response.text[:200]}')
-
-        # 检查响应体是否为空（基于 content 而不是 text，避免编码问题）
-        if response_length == 0 and response_text_length == 0:
-            log.debug('响应体为空（0字节），设置 json_data 为空字典')
-            json_data = {}
+        :param request_engin:
+        :param request_conf:
+        :param request_data_parsed:
+        :param kwargs:
+        :return:
+        """
+        if request_engin in (EnginType.requests, EnginType.requests_pool):
+            pool = request_engin == EnginType.requests_pool
+            response = self._requests_engin(pool, **request_conf, **request_data_parsed, **kwargs)
+        elif request_engin in (EnginType.httpx, EnginType.httpx_pool):
+            pool = request_engin == EnginType.httpx_pool
+            response = self._httpx_engin(pool, **request_conf, **request_data_parsed, **kwargs)
+        elif request_engin == EnginType.httpx_async:
+            response = async_runner.run(self._httpx_async_engin(**request_conf, **request_data_parsed, **kwargs))
         else:
-            # 尝试解析 JSON，不论 Content-Type 是什么
-            try:
-                json_data = response.json()
-                log.debug(f'✓ JSON 解析成功，数据类型: {type(json_data).__name__}')
-                if res_content_type and 'application/json' not in res_content_type:
-                    log.debug(f'注意: Content-Type 为 {res_content_type}，但成功解析为 JSON')
-            except (JSONDecodeError, ValueError) as e:
-                # JSON 解析失败
-                log.debug(f'JSON 解析失败: {e}')
-                if res_content_type and 'application/json' in res_content_type:
-                    # 如果声明是 JSON 但解析失败，这是错误
-                    err_msg = f'响应声明为 JSON 格式但解析失败: {e}'
-                    log.error(err_msg)
-                    log.error(f'响应内容（前500字符）: {response.text[:500]}')
-                    raise SendRequestError(err_msg)
-                else:
-                    # 不是 JSON 格式，设置为空字典
-                    json_data = {}
-                    log.debug(f'响应 Content-Type 为 {res_content_type}，不是有效的 JSON 格式，设置为空字典')
-
-        # 解密处理：如果启用加密且响应中包含加密数据
-        encryption_enabled = parsed_data.get('encryption_enabled', False)
-        encryption_key = parsed_data.get('encryption_key')
-
-        if encryption_enabled and json_data:
-            log.info('开始解密响应数据...')
-            encryption_filter = EncryptionFilter(
-                encryption_enabled=True,
-                encryption_key=encryption_key
-            )
+            raise SendRequestError(f'请求发起失败，请使用合法的请求引擎：{" / ".join(get_enum_values(EnginType))}')
+        return response
 
-            try:
-                json_data = encryption_filter.decrypt_response_data(json_data)
-                log.info('✓ 响应数据解密完成')
-                log.info(f'解密后的响应数据: {json_data}')
-            except Exception as e:
-                log.warning(f'响应数据解密失败，保留原始数据: {e}')
-
-        # 记录响应数据
-        response_data['url'] = str(response.url)
-        response_data['status_code'] = int(response.status_code)
-        response_data['elapsed'] = response.elapsed.microseconds / 1000.0
-        response_data['headers'] = res_headers
-        response_data['cookies'] = dict(response.cookies)
-        response_data['json'] = json_data
-        response_data['content'] = response.content
-        response_data['text'] = response.text
-        response_data['request'] = request_data_parsed
+    def handle_response(
+        self,
+        parsed_data: dict,
+        request_data_parsed: dict,
+        response: Any,
+        execute_time: str | None,
+        *,
+        log_data: bool = True,
+    ) -> ResponseView:
+        """
+        处理请求响应：序列化响应数据、解密、记录日志并执行请求后置
+
+        :param parsed_data:
+        :param request_data_parsed:
+        :param response:
+        :param execute_time:
+        :param log_data:
+        :return:
+        """
+        response_data = ResponseView(
+            response,
+            request_data_parsed,
+            execute_time,
+            encryption_enabled=parsed_data.get('encryption_enabled', False),
+            encryption_key=parsed_data.get('encryption_key'),
+        )
 
         # 日志记录响应数据
         teardown = parsed_data['teardown']
@@ -413,6 +506,7 @@ class SendRequests:
         # 后置处理
         if parsed_data['is_teardown']:
             log.info('开始处理请求后置...')
+            assertion_batch = AssertionBatch(response_data, soft=httpseeker_config.REQUEST_SOFT_ASSERT)
             try:
                 for item in teardown:
                     for key, value in item.items():
@@ -435,16 +529,24 @@ class SendRequests:
                                 var_extractor.teardown_var_extract(response_data, value, parsed_data['env'])
                             if key == TeardownType.ASSERT:
                                 assert_text = var_extractor.vars_replace(value, env=parsed_data['env'])
-                                asserter.exec_asserter(response_data, assert_text)
+                                assertion_batch.exec_asserter(assert_text)
                             elif key == TeardownType.WAIT_TIME:
                                 log.info(f'执行请求后等待：{value} s')
                                 time.sleep(value)
+                            elif key == TeardownType.WAIT_UNTIL:
+                                wait_until = var_extractor.vars_replace(value, parsed_data['env'])
+                                exec_wait_until(wait_until, parsed_data['env'])
             except AssertionError as e:
                 log.error(f'断言失败: {e}')
-                raise AssertError(f'断言失败: {e}')
+                error = AssertError(f'断言失败: {e}')
+                # 后置处理异常中断时, 已收集的软断言失败附加到原异常上报
+                assertion_batch.attach_failures(error)
+                raise error
             except Exception as e:
                 log.error(f'请求后置处理异常: {e}')
+                assertion_batch.attach_failures(e)
                 raise e
+            assertion_batch.raise_failures()
             log.info('请求后置处理完成')
 
         return response_data
@@ -454,17 +556,20 @@ class SendRequests:
         for item in setup:
             for key, value in item.items():
                 if key == SetupType.TESTCASE:
-                    log.info(f'前置 setup_testcase: {value}')
+                    detail_log.info('前置 setup_testcase: {}', value)
                     self.allure_request_setup({'setup_testcase': value})
                 elif key == SetupType.SQL:
-                    log.info(f'前置 setup_sql: {value}')
+                    detail_log.info('前置 setup_sql: {}', value)
                     self.allure_request_setup({'setup_sql': value})
                 elif key == SetupType.HOOK:
-                    log.info(f'前置 setup_hook: {value}')
+                    detail_log.info('前置 setup_hook: {}', value)
                     self.allure_request_setup({'setup_hook': value})
                 elif key == SetupType.WAIT_TIME:
-                    log.info(f'前置 setup_wait_time: {value}')
+                    detail_log.info('前置 setup_wait_time: {}', value)
                     self.allure_request_setup({'setup_wait_time': value})
+                elif key == SetupType.WAIT_UNTIL:
+                    detail_log.info('前置 setup_wait_until: {}', value)
+                    self.allure_request_setup({'setup_wait_until': value})
 
     @staticmethod
     def log_request_up(parsed_data: dict) -> None:
@@ -477,38 +582,41 @@ class SendRequests:
         log.info('<请求参数>')
         log.info(f'请求 method: {parsed_data["method"]}')
         log.info(f'请求 url: {parsed_data["url"]}')
-        log.info(f'请求 params: {parsed_data["params"]}')
-        log.info(f'请求 headers: {parsed_data["headers"]}')
+        detail_log.info('请求 params: {}', parsed_data['params'])
+        detail_log.info('请求 headers: {}', parsed_data['headers'])
         log.info(f'请求 body_type：{parsed_data["body_type"]}')
 
         # 如果存在原始body（说明进行了加密），则分别打印加密前后的body
         if parsed_data.get('original_body') is not None:
-            log.info(f'请求 body（加密前）：{parsed_data["original_body"]}')
-            log.info(f'请求 body（加密后）：{parsed_data["body"]}')
+            detail_log.info('请求 body（加密前）：{}', parsed_data['original_body'])
+            detail_log.info('请求 body（加密后）：{}', parsed_data['body'])
         else:
-            log.info(f'请求 body：{parsed_data["body"]}')
+            detail_log.info('请求 body：{}', parsed_data['body'])
 
-        log.info(f'请求 files: {parsed_data["files_no_parse"]}')
+        detail_log.info('请求 files: {}', parsed_data['files_no_parse'])
 
     def log_request_teardown(self, teardown: list) -> None:
         log.info('<请求后置>')
         for item in teardown:
             for key, value in item.items():
                 if key == TeardownType.SQL:
-                    log.info(f'后置 teardown_sql: {value}')
+                    detail_log.info('后置 teardown_sql: {}', value)
                     self.allure_request_teardown({'teardown_sql': value})
                 elif key == TeardownType.HOOK:
-                    log.info(f'后置 teardown_hook: {value}')
+                    detail_log.info('后置 teardown_hook: {}', value)
                     self.allure_request_teardown({'teardown_hook': value})
                 elif key == TeardownType.EXTRACT:
-                    log.info(f'后置 teardown_extract: {value}')
+                    detail_log.info('后置 teardown_extract: {}', value)
                     self.allure_request_teardown({'teardown_extract': value})
                 elif key == TeardownType.ASSERT:
-                    log.info(f'后置 teardown_assert: {value}')
+                    detail_log.info('后置 teardown_assert: {}', value)
                     self.allure_request_teardown({'teardown_assert': value})
                 elif key == TeardownType.WAIT_TIME:
-                    log.info(f'后置 teardown_wait_time: {value}')
+                    detail_log.info('后置 teardown_wait_time: {}', value)
                     self.allure_request_teardown({'teardown_wait_time': value})
+                elif key == TeardownType.WAIT_UNTIL:
+                    detail_log.info('后置 teardown_wait_until: {}', value)
+                    self.allure_request_teardown({'teardown_wait_until': value})
 
     @staticmethod
     def log_request_down(response_data: dict) -> None:
@@ -549,15 +657,16 @@ class SendRequests:
         allure_step('请求后置', teardown_log)
 
     @staticmethod
-    def allure_request_down(response_data: dict) -> None:
-        allure_step(
-            '响应数据',
-            {
-                'status_code': response_data['status_code'],
-                'elapsed': response_data['elapsed'],
-                'json': response_data['json'],
-            },
-        )
+    def allure_request_down(response_data: ResponseView) -> None:
+        # 响应 json 未被读取时附加原始响应体, 避免仅为报告解码及解密响应数据
+        json_loaded = response_data.is_loaded('json')
+        data = {'status_code': response_data['status_code'], 'elapsed': response_data['elapsed']}
+        if json_loaded:
+            data['json'] = response_data['json']
+        with allure.step('响应数据'):
+            allure_attach(json_dumps(data, ensure_ascii=False, indent=2), name='JSON Serialize')
+            if not json_loaded:
+                allure_attach(response_data['content'], name='响应内容', attachment_type='TEXT')
 
     @staticmethod
     def allure_dynamic_data(parsed_data: dict) -> None:
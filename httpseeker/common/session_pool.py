@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import threading
+import time
+
+from http.cookiejar import Cookie, CookieJar, DefaultCookiePolicy
+from typing import Any
+from urllib.parse import urlsplit
+
+import httpx
+import requests
+
+from requests.adapters import HTTPAdapter
+
+from httpseeker.common.log import log
+from httpseeker.core.get_conf import httpseeker_config
+
+
+class RejectCookiePolicy(DefaultCookiePolicy):
+    """拒绝保存响应 cookie 的策略"""
+
+    def set_ok(self, cookie: Cookie, request: Any) -> bool:
+        return False
+
+
+def _redirect_request(
+    response: httpx.Response, cookies: httpx.Cookies, history: list, max_redirects: int
+) -> httpx.Request:
+    """
+    获取重定向请求, 重定向响应设置的 cookie 保存在请求自身的 cookie jar 中
+
+    :param response: 重定向响应
+    :param cookies: 请求自身的 cookie jar
+    :param history: 重定向历史响应
+    :param max_redirects: 最大重定向次数
+    :return:
+    """
+    if len(history) >= max_redirects:
+        raise httpx.TooManyRedirects('Exceeded maximum allowed redirects.', request=response.request)
+    cookies.extract_cookies(response)
+    request = response.next_request
+    cookies.set_cookie_header(request)
+    history.append(response)
+    return request
+
+
+def httpx_send(client: httpx.Client, *, follow_redirects: bool, cookies: Any = None, **kwargs) -> httpx.Response:
+    """
+    使用共享客户端发送 httpx 请求
+
+    cookie 仅保存在请求自身的 cookie jar 中, 不写入共享客户端, 重定向过程中设置的 cookie 在同一请求内有效
+
+    :param client:
+    :param follow_redirects:
+    :param cookies: 请求 cookie
+    :param kwargs: 请求参数
+    :return:
+    """
+    jar = httpx.Cookies(cookies)
+    history: list[httpx.Response] = []
+    request = client.build_request(cookies=jar, **kwargs)
+    while True:
+        response = client.send(request, follow_redirects=False)
+        if not follow_redirects or response.next_request is None:
+            response.history = history
+            return response
+        request = _redirect_request(response, jar, history, client.max_redirects)
+
+
+async def httpx_async_send(
+    client: httpx.AsyncClient, *, follow_redirects: bool, cookies: Any = None, **kwargs
+) -> httpx.Response:
+    """
+    使用共享异步客户端发送 httpx 请求, 同 httpx_send
+
+    :param client:
+    :param follow_redirects:
+    :param cookies: 请求 cookie
+    :param kwargs: 请求参数
+    :return:
+    """
+    jar = httpx.Cookies(cookies)
+    history: list[httpx.Response] = []
+    request = client.build_request(cookies=jar, **kwargs)
+    while True:
+        response = await client.send(request, follow_redirects=False)
+        if not follow_redirects or response.next_request is None:
+            response.history = history
+            return response
+        request = _redirect_request(response, jar, history, client.max_redirects)
+
+
+class SessionPool:
+    """
+    请求会话连接池
+
+    按 (scheme, host, verify, proxies) 复用 requests.Session / httpx.Client,
+    避免每个用例都重新建立 TCP + TLS 连接;
+    会话在用例及账号之间共享, cookie jar 拒绝保存响应 cookie, cookie 由每个请求单独传入,
+    httpx 请求需通过 httpx_send 发送
+    """
+
+    def __init__(
+        self,
+        maxsize: int = httpseeker_config.REQUEST_POOL_MAXSIZE,
+        keepalive: float = httpseeker_config.REQUEST_POOL_KEEPALIVE,
+    ) -> None:
+        """
+        :param maxsize: 每个会话的最大连接数
+        :param keepalive: 空闲会话保活时间(秒), 超时后重建会话, 小于等于 0 时不过期
+        """
+        self.maxsize = maxsize
+        self.keepalive = keepalive
+        self._sessions: dict[tuple, list[Any]] = {}  # key: [session, last_used]
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _pool_key(engin: str, url: str, verify: Any, proxies: dict | None) -> tuple:
+        """
+        获取连接池 key
+
+        :param engin:
+        :param url:
+        :param verify:
+        :param proxies:
+        :return:
+        """
+        split_url = urlsplit(url)
+        proxies_key = tuple(sorted((k, v) for k, v in proxies.items())) if proxies else ()
+        return engin, split_url.scheme, split_url.netloc, verify, proxies_key
+
+    def _is_expired(self, last_used: float) -> bool:
+        return self.keepalive > 0 and time.monotonic() - last_used > self.keepalive
+
+    def _get_or_create(self, key: tuple, factory: Any) -> Any:
+        with self._lock:
+            cached = self._sessions.get(key)
+            if cached is not None:
+                session, last_used = cached
+                if not self._is_expired(last_used):
+                    cached[1] = time.monotonic()
+                    return session
+                log.debug(f'连接池会话空闲超时, 重建会话: {key[1]}://{key[2]}')
+                session.close()
+            session = factory()
+            self._sessions[key] = [session, time.monotonic()]
+            return session
+
+    def get_requests_session(self, url: str, verify: Any, proxies: dict | None) -> requests.Session:
+        """
+        获取 requests 会话
+
+        :param url:
+        :param verify:
+        :param proxies:
+        :return:
+        """
+
+        def factory() -> requests.Session:
+            session = requests.Session()
+            # 重定向过程中的 cookie 保存在请求自身的 cookie jar 中, 不受影响
+            session.cookies.set_policy(RejectCookiePolicy())
+            adapter = HTTPAdapter(pool_maxsize=self.maxsize)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            return session
+
+        return self._get_or_create(self._pool_key('requests', url, verify, proxies), factory)
+
+    def get_httpx_client(self, url: str, verify: Any, proxies: dict | None) -> httpx.Client:
+        """
+        获取 httpx 客户端
+
+        :param url:
+        :param verify:
+        :param proxies:
+        :return:
+        """
+
+        def factory() -> httpx.Client:
+            limits = httpx.Limits(
+                max_connections=self.maxsize,
+                max_keepalive_connections=self.maxsize,
+                keepalive_expiry=self.keepalive if self.keepalive > 0 else None,
+            )
+            mounts = {
+                k: httpx.HTTPTransport(proxy=v, verify=verify, limits=limits) for k, v in (proxies or {}).items() if v
+            }
+            cookies = CookieJar(policy=RejectCookiePolicy())
+            return httpx.Client(verify=verify, limits=limits, mounts=mounts or None, cookies=cookies)
+
+        return self._get_or_create(self._pool_key('httpx', url, verify, proxies), factory)
+
+    def close(self) -> None:
+        """关闭所有会话"""
+        with self._lock:
+            for session, _ in self._sessions.values():
+                try:
+                    session.close()
+                except Exception as e:
+                    log.warning(f'关闭连接池会话异常: {e}')
+            self._sessions.clear()
+
+
+session_pool = SessionPool()
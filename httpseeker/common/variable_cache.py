@@ -7,6 +7,7 @@ from typing import Any
 from cache3 import Cache
 
 from httpseeker.common.log import log
+from httpseeker.utils.log_control import detail_log
 
 
 class VariableCache:
@@ -37,7 +38,7 @@ class VariableCache:
         """
         result = self.cache.set(key, value, **kwargs)
         if result:
-            log.info(f'设置临时变量 -> {key}={value}')
+            detail_log.info('设置临时变量 -> {}={}', key, value)
         return result
 
     def delete(self, key: str, **kwargs) -> bool:
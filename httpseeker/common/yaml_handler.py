@@ -11,6 +11,7 @@ import yaml
 
 from ruamel.yaml import YAML
 
+from httpseeker.common.config_cache import config_cache
 from httpseeker.common.log import log
 from httpseeker.core.path_conf import httpseeker_path
 from httpseeker.utils.time_control import get_current_time
@@ -94,6 +95,15 @@ def write_yaml_report(
         log.info(f'写入测试报告成功: {filename}')
 
 
+def read_yaml_vars() -> dict[str, Any]:
+    """
+    读取 yaml 全局变量, 文件未变化时使用缓存, 返回值为共享数据, 请勿修改
+
+    :return:
+    """
+    return config_cache.get(os.path.join(httpseeker_path.global_var_dir, 'global_vars.yaml'), read_yaml)
+
+
 def write_yaml_vars(data: dict) -> None:
     """
     写入 yaml 全局变量
@@ -112,4 +122,5 @@ def write_yaml_vars(data: dict) -> None:
     except Exception as e:
         log.error(f'写入 global_vars.yaml 全局变量 {data} 错误: {e}')
     else:
+        config_cache.invalidate(_file)
         log.info(f'写入全局变量成功: global_vars.yaml -> {data}')
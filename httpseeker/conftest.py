@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+import os
 import sys
 import time
 import warnings
@@ -12,16 +13,32 @@ import pytest
 warnings.filterwarnings('ignore', category=DeprecationWarning, module=r'py\._xmlgen')
 from py._xmlgen import html
 
+from httpseeker.common.async_runner import async_runner
 from httpseeker.common.log import log
+from httpseeker.common.relate_cache import relate_cache
+from httpseeker.common.session_pool import session_pool
 from httpseeker.common.variable_cache import variable_cache
 from httpseeker.common.yaml_handler import write_yaml_report
 from httpseeker.core.get_conf import httpseeker_config
+from httpseeker.enums.request.engin import EnginType
+from httpseeker.utils.case_graph import get_case_groups
+from httpseeker.utils.log_control import configure_log, detail_log
+from httpseeker.utils.yaml_collector import YamlCaseModule, is_case_data_file
 
-from httpseeker.auto_register_and_recharge import AutoRegisterAndRecharge  # 修改成你的实际引用路径
+from httpseeker.auto_register_and_recharge import (  # 修改成你的实际引用路径
+    AutoRegisterAndRecharge,
+    BatchRegisterAndRecharge,
+)
 
 
 def main():
     """主函数"""
+    # AUTO_REGISTER_BATCH 大于 0 时批量注册账号并写入账号池文件
+    import os
+    batch = int(os.environ.get('AUTO_REGISTER_BATCH', '0') or 0)
+    if batch > 0:
+        workers = int(os.environ.get('AUTO_REGISTER_WORKERS', '10') or 10)
+        return len(BatchRegisterAndRecharge(batch, workers).run()) == batch
     automation = AutoRegisterAndRecharge()
     success = automation.run()
     return success   # 不再使用 sys.exit
@@ -46,7 +63,11 @@ def pytest_sessionstart(session):
 
 @pytest.fixture(scope='session', autouse=True)
 def session_fixture(tmp_path_factory):
-    pass
+    yield
+    # 关闭连接池会话
+    session_pool.close()
+    # 关闭异步执行器
+    async_runner.close()
 
 
 @pytest.fixture(scope='package', autouse=True)
@@ -56,11 +77,38 @@ def package_fixture():
     log.info('')
     # 清理临时变量
     variable_cache.clear()
+    # 清理关联测试用例结果缓存
+    relate_cache.clear()
+
+
+def get_prefetch_case_data(items, module):
+    """
+    获取可预取的用例数据, 跳过使用 skip / skipif 标记的用例
+
+    :param items: 收集的测试用例
+    :param module: 当前测试模块
+    :return:
+    """
+    case_data_list = []
+    for item in items:
+        if item.module is not module or item.get_closest_marker('skip') or item.get_closest_marker('skipif'):
+            continue
+        callspec = getattr(item, 'callspec', None)
+        if callspec is not None and isinstance(callspec.params.get('case_data'), dict):
+            case_data_list.append(callspec.params['case_data'])
+    return case_data_list
 
 
 @pytest.fixture(scope='module', autouse=True)
-def module_fixture():
-    pass
+def module_fixture(request):
+    # 并行执行时每个 worker 都会收集全部用例, 无法确定当前 worker 将执行哪些用例, 不进行预取
+    if httpseeker_config.REQUEST_ENGIN != EnginType.httpx_async or os.environ.get('PYTEST_XDIST_WORKER'):
+        yield
+        return
+    # 异步引擎: 并发预取当前数据文件中的独立用例
+    async_runner.prefetch(get_prefetch_case_data(request.session.items, request.module))
+    yield
+    async_runner.clear()
 
 
 @pytest.fixture(scope='class', autouse=True)
@@ -70,6 +118,8 @@ def class_fixture():
 
 @pytest.fixture(scope='function', autouse=True)
 def function_fixture(request):
+    # 丢弃上一个用例之外残留的详情日志
+    detail_log.discard()
     log.info('')  # 预留空行
     log.info(f'🔥 Running: {request.function.__name__}')
 
@@ -80,6 +130,33 @@ def function_fixture(request):
     request.addfinalizer(testcase_end)
 
 
+def pytest_addoption(parser):
+    """
+    添加命令行参数
+
+    :param parser:
+    :return:
+    """
+    parser.addoption(
+        '--yaml-collect',
+        action='store_true',
+        default=False,
+        help='直接从用例数据文件（YAML/JSON）收集测试用例, 无需生成测试用例文件',
+    )
+
+
+def pytest_collect_file(file_path, parent):
+    """
+    收集用例数据文件
+
+    :param file_path:
+    :param parent:
+    :return:
+    """
+    if parent.config.getoption('yaml_collect') and is_case_data_file(file_path):
+        return YamlCaseModule.from_parent(parent, path=file_path)
+
+
 def pytest_configure(config):
     """
     pytest配置
@@ -87,6 +164,9 @@ def pytest_configure(config):
     :param config:
     :return:
     """
+    # 按配置重新添加日志处理器
+    configure_log()
+
     # 元信息配置
     metadata = config.pluginmanager.getplugin('metadata')
     if metadata:
@@ -158,6 +238,11 @@ def pytest_runtest_makereport(item, call):
     """
     outcome = yield
     report = outcome.get_result()
+    # 静默模式下用例失败时输出缓存的请求/响应详情, 用例结束时丢弃
+    if report.failed:
+        detail_log.flush()
+    if report.when == 'teardown':
+        detail_log.discard()
     # 获取用例描述
     if getattr(item.function, '__doc__', None) is None:
         report.description = str(item.function.__name__)
@@ -165,17 +250,29 @@ def pytest_runtest_makereport(item, call):
         report.description = str(item.function.__doc__)
 
 
-def pytest_collection_modifyitems(items):
+def pytest_collection_modifyitems(config, items):
     """
     更新收集的测试用例配置
 
+    :param config:
     :param items:
     :return:
     """
+    # 并行执行时, 按用例依赖图分组, 保证存在关联关系的用例分配到同一进程
+    case_groups = get_case_groups() if config.pluginmanager.hasplugin('xdist') else {}
     # item表示每个用例
     for item in items:
         item.name = item.name.encode('utf-8').decode('unicode_escape')
         item._nodeid = item.nodeid.encode('utf-8').decode('unicode_escape')
+        if case_groups:
+            callspec = getattr(item, 'callspec', None)
+            case_data = callspec.params.get('case_data') if callspec is not None else None
+            try:
+                group = case_groups.get(case_data['test_steps']['case_id'])
+            except (KeyError, TypeError):
+                group = None
+            if group is not None:
+                item.add_marker(pytest.mark.xdist_group(name=group))
 
 
 def pytest_terminal_summary(terminalreporter, exitstatus, config):
@@ -133,6 +133,26 @@ class HttpSeekerConfig:
             }
             self.REQUEST_RETRY = glom(self.settings, 'request.retry')
 
+            # 请求引擎及连接池（可选配置，提供默认值）
+            self.REQUEST_ENGIN = glom(self.settings, 'request.engin', default='requests')
+            self.REQUEST_POOL_MAXSIZE = glom(self.settings, 'request.pool.maxsize', default=10)
+            self.REQUEST_POOL_KEEPALIVE = glom(self.settings, 'request.pool.keepalive', default=5)
+            self.REQUEST_CONCURRENCY = glom(self.settings, 'request.concurrency', default=10)
+            self.REQUEST_RELATE_CACHE = glom(self.settings, 'request.relate_cache', default=False)
+            self.REQUEST_RELATE_CACHE_TTL = glom(self.settings, 'request.relate_cache_ttl', default=0)
+            self.REQUEST_SOFT_ASSERT = glom(self.settings, 'request.soft_assert', default=False)
+            self.REQUEST_JSONSCHEMA_FORMAT_CHECK = glom(self.settings, 'request.jsonschema_format_check', default=False)
+
+            # 授权 token 缓存（可选配置，提供默认值）
+            self.AUTH_REFRESH_AHEAD = glom(self.settings, 'auth.refresh_ahead', default=60)
+            self.AUTH_LOCK_TIMEOUT = glom(self.settings, 'auth.lock_timeout', default=30)
+
+            # 日志
+            self.LOG_LEVEL = glom(self.settings, 'log.level', default='DEBUG')
+            self.LOG_MAX_FIELD_LENGTH = glom(self.settings, 'log.max_field_length', default=2000)
+            self.LOG_QUIET = glom(self.settings, 'log.quiet', default=False)
+            self.LOG_ENQUEUE = glom(self.settings, 'log.enqueue', default=True)
+
             # 谷歌验证码密钥（可选配置，提供默认值）
             self.GOOGLE_AUTH_KEYS = {}
             if 'google_auth' in self.settings:
@@ -28,6 +28,11 @@ class HttpSeekerPathConfig:
         """用例数据路径"""
         return os.path.join(self.project_dir, 'data', 'test_data')
 
+    @property
+    def case_cache_dir(self) -> str:
+        """测试用例数据解析缓存路径"""
+        return os.path.join(self.project_dir, 'data', '.case_cache')
+
     @property
     def _report_dir(self) -> str:
         """测试报告路径"""
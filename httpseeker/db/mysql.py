@@ -17,6 +17,7 @@ from httpseeker.core.get_conf import httpseeker_config
 from httpseeker.enums.query_fetch_type import QueryFetchType
 from httpseeker.enums.sql_type import SqlType
 from httpseeker.utils.enum_control import get_enum_values
+from httpseeker.utils.log_control import detail_log
 from httpseeker.utils.request.vars_recorder import record_variables
 
 
@@ -95,7 +96,7 @@ class MysqlDB:
             log.error(f'执行 SQL 失败: {e}')
             raise e
         else:
-            log.info(f'执行 SQL 成功: {query_data}')
+            detail_log.info('执行 SQL 成功: {}', query_data)
             if not query_data:
                 return None
             try:
@@ -2,15 +2,22 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
-from typing import Any
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
 
 from redis import AuthenticationError, Redis
 
 from httpseeker.common.log import log
 from httpseeker.core.get_conf import httpseeker_config
 
+if TYPE_CHECKING:
+    from redis.lock import Lock
+
 
 class RedisDB:
+    # 批量操作每批 key 数量
+    batch_size = 500
+
     def __init__(self) -> None:
         self._client = None
         self._enabled = False
@@ -18,7 +25,7 @@ class RedisDB:
         self.token_prefix = f'{self.prefix}:token'
         self.cookie_prefix = f'{self.prefix}:cookie'
         self.case_data_prefix = f'{self.prefix}:case_data'
-        self.case_id_file_prefix = f'{self.prefix}:case_id_file'
+        self.case_registry_key = f'{self.prefix}:case_registry'
 
         # 只有配置了有效的 Redis 连接信息才初始化客户端
         if all([
@@ -72,6 +79,71 @@ class RedisDB:
                 log.warning(f'获取 redis 数据 {name} 失败, 此数据不存在')
         return data
 
+    @classmethod
+    def _chunks(cls, items: Iterable) -> Iterator[list]:
+        chunk = []
+        for item in items:
+            chunk.append(item)
+            if len(chunk) >= cls.batch_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def mget(self, keys: list) -> list:
+        """
+        批量获取 redis 数据
+
+        :param keys:
+        :return: 与 keys 顺序一致, 不存在的 key 对应 None
+        """
+        if not self._enabled or not self._client:
+            return [None] * len(keys)
+        data = []
+        for chunk in self._chunks(keys):
+            data.extend(self._client.mget(chunk))
+        return data
+
+    def mset(self, mapping: dict) -> None:
+        """
+        批量设置 redis 数据, 使用 pipeline 分批发送
+
+        :param mapping:
+        :return:
+        """
+        if not self._enabled or not self._client or not mapping:
+            return
+        pipe = self._client.pipeline(transaction=False)
+        for chunk in self._chunks(mapping.items()):
+            pipe.mset(dict(chunk))
+        pipe.execute()
+
+    def hset(self, name: str, mapping: dict) -> None:
+        """
+        设置 redis hash 数据
+
+        :param name:
+        :param mapping:
+        :return:
+        """
+        if not self._enabled or not self._client or not mapping:
+            return
+        pipe = self._client.pipeline(transaction=False)
+        for chunk in self._chunks(mapping.items()):
+            pipe.hset(name, mapping=dict(chunk))
+        pipe.execute()
+
+    def hgetall(self, name: str) -> dict:
+        """
+        获取 redis hash 所有数据
+
+        :param name:
+        :return:
+        """
+        if not self._enabled or not self._client:
+            return {}
+        return self._client.hgetall(name)
+
     def get_prefix(self, prefix: str) -> list:
         """
         获取 redis 符合前缀的数据
@@ -82,10 +154,8 @@ class RedisDB:
         if not self._enabled or not self._client:
             return []
         data = []
-        for key in self._client.scan_iter(match=f'{prefix}*'):
-            value = self._client.get(key)
-            if value:
-                data.append(value)
+        for keys in self._chunks(self._client.scan_iter(match=f'{prefix}*', count=self.batch_size)):
+            data.extend(value for value in self._client.mget(keys) if value)
         return data
 
     def set(self, key: Any, value: Any, **kwargs) -> None:
@@ -123,6 +193,30 @@ class RedisDB:
             return
         self._client.delete(*keys)
 
+    def ttl(self, key: Any) -> int:
+        """
+        获取 redis key 剩余有效期
+
+        :param key:
+        :return: 剩余秒数, key 不存在时为 -2, 未设置有效期时为 -1
+        """
+        if not self._enabled or not self._client:
+            return -2
+        return self._client.ttl(key)
+
+    def lock(self, name: str, timeout: float = 30, blocking_timeout: float | None = None) -> Lock | nullcontext:
+        """
+        获取 redis 分布式锁, redis 未启用时返回空上下文
+
+        :param name: 锁名称
+        :param timeout: 锁自动释放时间(秒)
+        :param blocking_timeout: 等待获取锁的最长时间(秒), 为空时一直等待
+        :return:
+        """
+        if not self._enabled or not self._client:
+            return nullcontext()
+        return self._client.lock(f'{self.prefix}:lock:{name}', timeout=timeout, blocking_timeout=blocking_timeout)
+
     def rset(self, key: Any, value: Any, **kwargs) -> None:
         """
         重置设置 redis 数据
@@ -148,12 +242,11 @@ class RedisDB:
         """
         if not self._enabled or not self._client:
             return
-        for key in self._client.scan_iter(match=f'{prefix}*'):
-            if not exclude:
-                self.delete(key)
-            else:
-                if not key.startswith(exclude):
-                    self.delete(key)
+        keys = self._client.scan_iter(match=f'{prefix}*', count=self.batch_size)
+        if exclude:
+            keys = (key for key in keys if not key.startswith(exclude))
+        for chunk in self._chunks(keys):
+            self._client.unlink(*chunk)
 
     @property
     def is_enabled(self) -> bool:
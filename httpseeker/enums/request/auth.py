@@ -9,3 +9,8 @@ class AuthType(StrEnum):
     COOKIE = 'header_cookie'
     TK = 'tk'  # 自定义token认证，请求头字段名为tk
     AUTHORIZATION = 'authorization'  # Authorization头认证，不带Bearer前缀
+
+
+class AccountStrategy(StrEnum):
+    ROUND_ROBIN = 'round_robin'  # 每个用例轮流使用账号池中的账号
+    AFFINITY = 'affinity'  # 同一 xdist worker / 线程固定使用同一账号
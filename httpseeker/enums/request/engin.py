@@ -5,4 +5,7 @@ from httpseeker.enums import StrEnum
 
 class EnginType(StrEnum):
     requests = 'requests'
+    requests_pool = 'requests_pool'  # 连接池复用 requests.Session
     httpx = 'httpx'
+    httpx_pool = 'httpx_pool'  # 连接池复用 httpx.Client
+    httpx_async = 'httpx_async'  # httpx.AsyncClient, 支持同一数据文件内独立用例并发执行
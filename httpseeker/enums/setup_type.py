@@ -8,3 +8,4 @@ class SetupType(StrEnum):
     SQL = 'sql'
     HOOK = 'hook'
     WAIT_TIME = 'wait_time'
+    WAIT_UNTIL = 'wait_until'
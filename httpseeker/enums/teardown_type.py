@@ -9,3 +9,4 @@ class TeardownType(StrEnum):
     EXTRACT = 'extract'
     ASSERT = 'assert'
     WAIT_TIME = 'wait_time'
+    WAIT_UNTIL = 'wait_until'
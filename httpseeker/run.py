@@ -21,6 +21,7 @@ from httpseeker.core.get_conf import httpseeker_config
 from httpseeker.core.path_conf import httpseeker_path
 from httpseeker.db.redis import redis_client
 from httpseeker.utils.case_auto_generator import auto_generate_testcases
+from httpseeker.utils.case_graph import case_graph_verify
 from httpseeker.utils.request import case_data_parse as case_data
 from httpseeker.utils.send_report.dingding import DingDing
 from httpseeker.utils.send_report.email import SendEmail
@@ -43,13 +44,19 @@ def startup(
     strict_markers: bool,
     capture: bool,
     disable_warnings: bool,
+    parallel: bool | int = False,
+    yaml_collect: bool = False,
     **kwargs,
 ) -> None:
     """运行启动程序"""
 
     run_args = [log_level]
 
-    default_case_path = os.sep.join([httpseeker_path.testcase_dir, httpseeker_config.PROJECT_NAME])
+    if yaml_collect:
+        default_case_path = os.sep.join([httpseeker_path.case_data_dir, httpseeker_config.PROJECT_NAME])
+        run_args.append('--yaml-collect')
+    else:
+        default_case_path = os.sep.join([httpseeker_path.testcase_dir, httpseeker_config.PROJECT_NAME])
     if case_path:
         if '::' not in case_path:
             raise ValueError(
@@ -99,6 +106,14 @@ def startup(
     if disable_warnings:
         run_args.append('--disable-warnings')
 
+    if parallel:
+        import importlib.util
+
+        if importlib.util.find_spec('xdist') is None:
+            log.warning('未安装 pytest-xdist, 无法并行执行, 已回退为串行执行')
+        else:
+            run_args.extend((f'-n={"auto" if parallel is True else parallel}', '--dist=loadgroup'))
+
     if len(args) > 0:
         for i in args:
             if i not in run_args:
@@ -218,6 +233,8 @@ def run(
     strict_markers: bool = False,
     capture: bool = True,
     disable_warnings: bool = True,
+    parallel: bool | int = False,
+    yaml_collect: bool = False,
     # config files
     global_env: str | None = None,
     conf_path: str | None = None,
@@ -244,6 +261,8 @@ def run(
     :param strict_markers: markers 严格模式, 对于设置 marker 装饰器的用例, 如果 marker 未在 pytest.ini 注册, 用例将报错
     :param capture: 避免在使用输出模式为"v"和"s"时，html报告中的表格日志为空的情况, 默认开启
     :param disable_warnings: 关闭控制台警告信息, 默认开启
+    :param parallel: 按用例依赖图分组并行执行（需安装 pytest-xdist）, True 为自动进程数, 也可指定进程数, 默认关闭
+    :param yaml_collect: 直接从用例数据文件收集测试用例, 无需生成测试用例文件, 默认关闭
     :param global_env: 指定全局环境变量文件名，会覆盖 conf_toml.toml 中的配置
     :param conf_path: 指定配置文件路径，默认使用 httpseeker/core/conf_toml.toml
     :param auth_path: 指定认证配置文件路径，默认使用 httpseeker/core/Dz_like_bofa_h5.yaml
@@ -299,7 +318,8 @@ def run(
         case_data.clean_cache_data(clean_cache)
         case_data.case_data_init(pydantic_verify)
         case_data.case_id_unique_verify()
-        if testcase_generate:
+        case_graph_verify()
+        if testcase_generate and not yaml_collect:
             if not testcase_re_generation:
                 auto_generate_testcases()
             else:
@@ -318,6 +338,8 @@ def run(
             strict_markers=strict_markers,
             capture=capture,
             disable_warnings=disable_warnings,
+            parallel=parallel,
+            yaml_collect=yaml_collect,
             **kwargs,
         )
     except Exception as e:
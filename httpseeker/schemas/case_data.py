@@ -75,11 +75,26 @@ class SetupSqlData(BaseModel):
     jsonpath: str
 
 
+class WaitUntilData(BaseModel):
+    testcase: str | None = None
+    sql: str | None = None
+    fetch: QueryFetchType | None = None
+    hook: str | None = None
+    jsonpath: str | None = None
+    type: str | None = None
+    value: Any = None
+    timeout: float | None = None
+    interval: float | None = None
+    backoff: float | None = None
+    max_interval: float | None = None
+
+
 class StepsSetUpData(BaseModel):
     testcase: str | SetupTestCaseData | None = None
     sql: str | SetupSqlData | None = None
     hook: str | None = None
     wait_time: int | None = None
+    wait_until: WaitUntilData | None = None
 
 
 class TeardownExtractData(BaseModel):
@@ -144,6 +159,7 @@ class StepsTearDownData(BaseModel):
         | None
     ) = Field(None, alias='assert')
     wait_time: int | None = None
+    wait_until: WaitUntilData | None = None
 
 
 class Steps(BaseModel):
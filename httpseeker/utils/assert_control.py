@@ -2,20 +2,105 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
+import ast
 import re
 
 from decimal import Decimal
-from typing import Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, NamedTuple
 
-from jsonpath import findall
-from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 
-from httpseeker.common.errors import AssertSyntaxError, JsonPathFindError
+from httpseeker.common.errors import AssertError, AssertSyntaxError, JsonPathFindError
 from httpseeker.common.log import log
 from httpseeker.db.mysql import mysql_client
 from httpseeker.enums.assert_type import AssertType
 from httpseeker.enums.sql_type import SqlType
+from httpseeker.utils.allure_control import allure_step
+from httpseeker.utils.jsonpath_control import findall
+from httpseeker.utils.schema_validator import schema_validator
+
+if TYPE_CHECKING:
+    from types import CodeType
+
+# code 断言中替代 pm.response.get(...) 取值表达式的变量名
+_PM_VALUE = '__pm_value__'
+
+
+class _PmContext:
+    """code 断言取值上下文, 即 pm.response"""
+
+    __slots__ = ('response',)
+
+    def __init__(self, response: dict) -> None:
+        self.response = response
+
+
+class _CodeAssertion(NamedTuple):
+    """编译后的 code 断言"""
+
+    use_code: str
+    value_code: CodeType
+    test_code: CodeType
+    msg_code: CodeType | None
+
+
+class _PmValueTransformer(ast.NodeTransformer):
+    """将断言中的首个 pm.response 取值表达式替换为变量, 并记录取值表达式"""
+
+    def __init__(self) -> None:
+        self.value_node: ast.expr | None = None
+
+    def visit(self, node: ast.AST) -> ast.AST:
+        if self.value_node is None and isinstance(node, ast.expr) and _pm_response_child(node) is not None:
+            self.value_node = node
+            return ast.copy_location(ast.Name(id=_PM_VALUE, ctx=ast.Load()), node)
+        return super().visit(node)
+
+
+def _is_pm_response(node: ast.expr) -> bool:
+    return (
+        isinstance(node, ast.Attribute)
+        and node.attr == 'response'
+        and isinstance(node.value, ast.Name)
+        and node.value.id == 'pm'
+    )
+
+
+def _pm_response_child(node: ast.expr) -> ast.expr | None:
+    """
+    获取取值表达式中紧随 pm.response 的节点
+
+    :param node:
+    :return: 非 pm.response 取值表达式时返回 None
+    """
+    child = None
+    while isinstance(node, (ast.Attribute, ast.Subscript, ast.Call)):
+        if _is_pm_response(node):
+            return child
+        child = node
+        node = node.func if isinstance(node, ast.Call) else node.value
+    return None
+
+
+def _is_pm_get(node: ast.expr) -> bool:
+    """取值表达式是否以 pm.response.get() 开始"""
+    child = _pm_response_child(node)
+    if not isinstance(child, ast.Attribute) or child.attr != 'get':
+        return False
+    while node is not child:
+        if isinstance(node, ast.Call) and node.func is child:
+            return True
+        node = node.func if isinstance(node, ast.Call) else node.value  # type: ignore
+    return False
+
+
+@lru_cache
+def _code_assert_namespace() -> dict[str, Any]:
+    """code 断言命名空间, 等同于 from dirty_equals import *"""
+    import dirty_equals
+
+    return {name: getattr(dirty_equals, name) for name in dirty_equals.__all__}
 
 
 class Asserter:
@@ -66,7 +151,7 @@ class Asserter:
         log.info(f'执行 code 断言：{assert_text}')
         self._exec_code_assert(response, assert_text)
 
-    def _json_asserter(self, response: dict, assert_text: dict) -> None:
+    def _json_asserter(self, response: dict, assert_text: dict, values: dict[str, list] | None = None) -> None:
         """
         **json 提取断言器**
 
@@ -87,6 +172,7 @@ class Asserter:
 
         :param response:
         :param assert_text:
+        :param values: jsonpath 取值缓存, 同一响应的断言共享
         :return:
         """
         if not isinstance(assert_text, dict):
@@ -99,7 +185,7 @@ class Asserter:
         except KeyError as e:
             raise AssertSyntaxError(f'json 断言格式错误, 请检查: {e}')
         else:
-            response_value = findall(assert_jsonpath, response)
+            response_value = self._findall(assert_jsonpath, response, values)
             if response_value:
                 log.info(f'执行 json 断言：{assert_text}')
                 self._exec_json_assert(assert_check, assert_value, assert_type, response_value[0])
@@ -165,18 +251,20 @@ class Asserter:
                 raise AssertSyntaxError('jsonschema 断言类型错误，类型必须为 "jsonschema"')
             log.info(f'执行 jsonschema 断言：{assert_text}')
             try:
-                validate(response['json'], assert_jsonschema)
+                schema_validator.validate(response['json'], assert_jsonschema)
             except ValidationError as e:
-                log.error(f'{assert_check or e}')
-                raise e
+                # 校验失败按断言失败处理, 软断言模式下与其他断言一同汇总
+                error = f'{assert_check or e.message}'
+                log.error(error)
+                raise AssertError(error) from e
 
-    @staticmethod
-    def _re_asserter(response: dict, assert_text: dict) -> None:
+    def _re_asserter(self, response: dict, assert_text: dict, values: dict[str, list] | None = None) -> None:
         """
         **正则断言器**
 
         :param response:
         :param assert_text:
+        :param values: jsonpath 取值缓存, 同一响应的断言共享
         :return:
         """
         if not isinstance(assert_text, dict):
@@ -191,7 +279,7 @@ class Asserter:
         else:
             if assert_type != 're':
                 raise AssertSyntaxError('正则断言类型错误，类型必须为 "re"')
-            response_value = findall(assert_jsonpath, response)
+            response_value = self._findall(assert_jsonpath, response, values)
             if response_value:
                 log.info(f'执行 re 断言：{assert_text}')
                 result = re.match(assert_pattern, str(response_value[0]))
@@ -206,7 +294,35 @@ class Asserter:
         """
         执行 code 断言
 
+        取值表达式的结果以原始值参与断言, 不再转为字符串后拼接到断言文本中执行, 因此:
+        字符串取值无需在断言中加引号; 转型函数作用于原始值, 如 bool(False) 为 False, int(3.5) 为 3
+
         :param response:
+        :param assert_text:
+        :return:
+        """
+        code_assertion = Asserter._compile_code_assert(assert_text)
+        try:
+            response_value = eval(code_assertion.value_code, {'pm': _PmContext(response)})
+        except Exception as e:
+            err_msg = str(e.args).replace("'", '"').replace('\\', '')
+            raise AssertSyntaxError(f'code 断言取值表达式格式错误, {code_assertion.use_code} 取值失败, 详情: {err_msg}')
+        if code_assertion.msg_code is None:
+            # stdout 作为没有自定义断言错误时的信息补充
+            # 当断言错误触发时, 如果错误信息中包含自定义错误, 此项可忽略
+            log.warning('此 code 断言未自定义错误提示信息')
+        namespace = {**_code_assert_namespace(), _PM_VALUE: response_value}
+        if not eval(code_assertion.test_code, namespace):
+            if code_assertion.msg_code is None:
+                raise AssertionError
+            raise AssertionError(eval(code_assertion.msg_code, namespace))
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _compile_code_assert(assert_text: str) -> _CodeAssertion:
+        """
+        编译 code 断言, 每个断言表达式仅解析一次
+
         :param assert_text:
         :return:
         """
@@ -216,45 +332,6 @@ class Asserter:
         if len(assert_split) < 4 or len(assert_split) > 6:
             raise AssertSyntaxError(f'code 断言取值表达式格式错误, 不符合语法规范: {assert_text}')
         else:
-
-            def exec_assertion() -> None:
-                """执行断言（闭包函数）"""
-                get_code = pm_code.split('.')[2:]
-                if len(get_code) == 1:
-                    use_code = get_code[0]
-                else:
-                    use_code = '.'.join(get_code)
-                # 如果断言有转型
-                if use_code.endswith('))'):
-                    use_code = use_code.replace('))', ')')
-                if not use_code.startswith('get('):
-                    raise AssertSyntaxError(
-                        'code 断言取值表达式格式错误, 取值表达式条件不允许, 请在首位改用 get() 方法取值'
-                    )
-                else:
-                    try:
-                        response_value = eval(f'{response}.{use_code}')
-                    except Exception as e:
-                        err_msg = str(e.args).replace("'", '"').replace('\\', '')
-                        raise AssertSyntaxError(f'code 断言取值表达式格式错误, {use_code} 取值失败, 详情: {err_msg}')
-                    else:
-                        # 执行断言
-                        py_conversion_functions_exec_re = re.compile(
-                            rf'(\b(?:{py_conversion_functions_re_str}))\((.*?)\)(?=[^)]*$)'  # noqa: ignore
-                        )
-                        format_assert_text = py_conversion_functions_exec_re.sub(
-                            lambda x: x.group(1) + f'("""{response_value}""")', assert_text
-                        )
-                        if 'pm.response.get' in format_assert_text:
-                            format_assert_text = format_assert_text.replace(pm_code, '{}', 1).format(response_value)
-                        if len(assert_split) == 4:
-                            # stdout 作为没有自定义断言错误时的信息补充
-                            # 当断言错误触发时, 如果错误信息中包含自定义错误, 此项可忽略
-                            log.warning('此 code 断言未自定义错误提示信息')
-                        if dirty_equals_assert:
-                            exec('from dirty_equals import *')
-                        exec(format_assert_text)
-
             py_conversion_functions_re_str = 'str|int|float|bool|list|tuple|set|dict'
             py_conversion_functions_pm_get_re = re.compile(rf'^({py_conversion_functions_re_str})\(pm\.response\.get')
             # 是否 dirty-equals 断言表达式
@@ -267,10 +344,6 @@ class Asserter:
                     raise AssertSyntaxError(
                         f'code 断言取值表达式格式错误, 含有不支持的 dirty-equals 断言类型 {assert_split[2]}'
                     )
-                # 处理比较值获取代码
-                pm_code = assert_split[1]
-                # 执行断言
-                exec_assertion()
             else:
                 assert_expr_type = ['==', '!=', '>', '<', '>=', '<=', 'in', 'not']
                 if assert_split[2] not in assert_expr_type:
@@ -289,11 +362,6 @@ class Asserter:
                                     raise AssertSyntaxError(
                                         f'code 断言取值表达式格式错误, 含有不支持的断言取值表达式: {assert_split[4]}'
                                     )
-                            # 如果包含自定义错误信息
-                            if len(assert_split) == 6:
-                                pm_code = assert_split[4].replace(',', '')
-                            else:
-                                pm_code = assert_split[4]
                     else:
                         # 非 dirty-equals 或 not in 断言表达式
                         if not assert_split[3].startswith('pm.response.get'):
@@ -301,12 +369,24 @@ class Asserter:
                                 raise AssertSyntaxError(
                                     f'code 断言取值表达式格式错误, 含有不支持的断言取值表达式: {assert_split[3]}'
                                 )
-                        if len(assert_split) == 5:
-                            pm_code = assert_split[3].replace(',', '')
-                        else:
-                            pm_code = assert_split[3]
-                    # 执行断言
-                    exec_assertion()
+        try:
+            statement = ast.parse(assert_text).body
+        except SyntaxError:
+            raise AssertSyntaxError(f'code 断言取值表达式格式错误, 不符合语法规范: {assert_text}')
+        if len(statement) != 1 or not isinstance(statement[0], ast.Assert):
+            raise AssertSyntaxError(f'code 断言取值表达式格式错误, 不符合语法规范: {assert_text}')
+        transformer = _PmValueTransformer()
+        test = transformer.visit(statement[0].test)
+        value_node = transformer.value_node
+        if value_node is None or not _is_pm_get(value_node):
+            raise AssertSyntaxError('code 断言取值表达式格式错误, 取值表达式条件不允许, 请在首位改用 get() 方法取值')
+        msg = statement[0].msg
+        return _CodeAssertion(
+            use_code=ast.unparse(value_node).removeprefix('pm.response.'),
+            value_code=compile(ast.Expression(value_node), '<code_assert>', 'eval'),
+            test_code=compile(ast.fix_missing_locations(ast.Expression(test)), '<code_assert>', 'eval'),
+            msg_code=compile(ast.Expression(msg), '<code_assert>', 'eval') if msg is not None else None,
+        )
 
     @staticmethod
     def _exec_json_assert(assert_check: str | None, expected_value: Any, assert_type: str, actual_value: Any) -> None:
@@ -409,12 +489,31 @@ class Asserter:
         else:
             raise ValueError(f'断言表达式格式错误, 含有不支持的断言类型: {assert_type}')
 
-    def exec_asserter(self, response: dict, assert_text: str | dict | None) -> None:
+    @staticmethod
+    def _findall(jsonpath: str, response: dict, values: dict[str, list] | None) -> list:
+        """
+        jsonpath 取值, 传入取值缓存时相同表达式仅取值一次
+
+        :param jsonpath:
+        :param response:
+        :param values:
+        :return:
+        """
+        if values is None:
+            return findall(jsonpath, response)
+        if jsonpath not in values:
+            values[jsonpath] = findall(jsonpath, response)
+        return values[jsonpath]
+
+    def exec_asserter(
+        self, response: dict, assert_text: str | dict | None, values: dict[str, list] | None = None
+    ) -> None:
         """
         根据断言内容自动选择断言器执行
 
         :param response:
         :param assert_text:
+        :param values: jsonpath 取值缓存, 同一响应的断言共享
         :return:
         """
         if isinstance(assert_text, str):
@@ -428,11 +527,81 @@ class Asserter:
             elif jsonschema:
                 self._jsonschema_asserter(response, assert_text)
             elif pattern:
-                self._re_asserter(response, assert_text)
+                self._re_asserter(response, assert_text, values)
             else:
-                self._json_asserter(response, assert_text)
+                self._json_asserter(response, assert_text, values)
         else:
             raise AssertSyntaxError(f'断言表达式格式错误: {assert_text}')
 
 
 asserter = Asserter()
+
+
+class AssertionBatch:
+    """
+    测试步骤断言批次
+
+    同一测试步骤的断言共享 jsonpath 取值结果; 软断言模式下断言失败不中断执行, 所有断言执行完成后汇总失败信息
+    """
+
+    def __init__(self, response: dict, soft: bool = False) -> None:
+        """
+        :param response: 响应数据
+        :param soft: 是否软断言
+        """
+        self.response = response
+        self.soft = soft
+        self.values: dict[str, list] = {}
+        self.failures: list[dict] = []
+
+    def exec_asserter(self, assert_text: str | dict | None) -> None:
+        """
+        执行断言
+
+        :param assert_text:
+        :return:
+        """
+        try:
+            asserter.exec_asserter(self.response, assert_text, self.values)
+        except (AssertionError, JsonPathFindError) as e:
+            if not self.soft:
+                raise e
+            error = str(e) or f'{assert_text}'
+            log.error(f'断言失败: {error}')
+            self.failures.append({'assert': assert_text, 'error': error})
+
+    def _report_failures(self) -> str | None:
+        """
+        记录软断言失败汇总
+
+        :return: 汇总信息, 不存在失败时返回 None
+        """
+        if not self.failures:
+            return None
+        allure_step(f'断言失败汇总: {len(self.failures)} 项', {'failures': self.failures})
+        summary = '; '.join(f'[{i}] {failure["error"]}' for i, failure in enumerate(self.failures, 1))
+        message = f'断言失败: 共 {len(self.failures)} 项: {summary}'
+        log.error(message)
+        return message
+
+    def raise_failures(self) -> None:
+        """
+        汇总软断言失败信息, 存在失败时抛出 AssertError
+
+        :return:
+        """
+        message = self._report_failures()
+        if message is not None:
+            raise AssertError(message)
+
+    def attach_failures(self, error: BaseException) -> None:
+        """
+        后置处理因其他异常中断时, 记录软断言失败汇总并附加到该异常, 不替换原异常
+
+        :param error: 中断后置处理的异常
+        :return:
+        """
+        message = self._report_failures()
+        # add_note 需要 Python 3.11+
+        if message is not None and hasattr(error, 'add_note'):
+            error.add_note(message)
@@ -1,23 +1,52 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+import base64
+import itertools
 import json
 import os
+import tempfile
+import threading
 import time
 
+from contextlib import contextmanager
 from functools import lru_cache
 from pathlib import Path
+from typing import Callable, Iterator
 
 import requests
 
-from jsonpath import findall
+from redis.exceptions import LockError
 
 from httpseeker.common.errors import AuthError, SendRequestError
 from httpseeker.common.log import log
 from httpseeker.common.yaml_handler import read_yaml
+from httpseeker.core.get_conf import httpseeker_config
 from httpseeker.core.path_conf import httpseeker_path
 from httpseeker.db.redis import redis_client
-from httpseeker.enums.request.auth import AuthType
+from httpseeker.enums.request.auth import AccountStrategy, AuthType
 from httpseeker.utils.enum_control import get_enum_values
+from httpseeker.utils.jsonpath_control import findall
+
+
+def get_jwt_exp(token: str) -> float | None:
+    """
+    读取 JWT token 的 exp 过期时间
+
+    Args:
+        token: token
+
+    Returns:
+        过期时间戳，非 JWT 或不包含 exp 时返回 None
+    """
+    parts = token.split('.') if isinstance(token, str) else []
+    if len(parts) != 3:
+        return None
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(parts[1] + '=' * (-len(parts[1]) % 4)))
+    except Exception:
+        return None
+    exp = payload.get('exp') if isinstance(payload, dict) else None
+    return float(exp) if isinstance(exp, (int, float)) and not isinstance(exp, bool) else None
 
 
 class AuthPlugins:
@@ -27,9 +56,20 @@ class AuthPlugins:
         self.auth_type = self.auth_data['auth_type']
         self.auth_type_verify()
         self.timeout = self.auth_data[f'{self.auth_type}']['timeout'] or 86400
+        # 账号池: 每个账号覆盖认证配置中的登录信息, 未配置时仅使用认证配置中的账号
+        self.accounts: list[dict] = self.get_accounts(self.auth_data[f'{self.auth_type}'].get('accounts'))
+        self.account_strategy = self.auth_data.get('account_strategy') or AccountStrategy.ROUND_ROBIN
+        self.account_strategy_verify()
+        self._account_counter = itertools.count()
+        self._account_local = threading.local()
         # 文件缓存目录（当 Redis 未启用时使用）
         self.cache_dir = Path(httpseeker_path.project_dir) / '.auth_cache'
         self.cache_dir.mkdir(exist_ok=True)
+        # 进程内 token 缓存: {缓存键名: (token, 过期时间戳, 有效期)}
+        self._tokens: dict[str, tuple[str, float, float]] = {}
+        self._locks: dict[str, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+        self._refreshing: set[str] = set()
 
     @lru_cache
     def get_auth_data(self) -> dict:
@@ -45,13 +85,99 @@ class AuthPlugins:
             auth_data = read_yaml(httpseeker_path.auth_conf_dir, filename='Dz_like_bofa_h5.yaml')
         return auth_data
 
+    @staticmethod
+    def get_accounts(accounts: list[dict] | str | None) -> list[dict]:
+        """
+        获取账号池
+
+        Args:
+            accounts: 账号列表，或账号池文件路径（相对路径基于认证配置目录）
+
+        Returns:
+            账号列表
+        """
+        if not accounts:
+            return []
+        if isinstance(accounts, list):
+            return accounts
+        pool_file = Path(accounts)
+        if not pool_file.is_absolute():
+            pool_file = Path(httpseeker_path.auth_conf_dir) / pool_file
+        pool = read_yaml(str(pool_file.parent), filename=pool_file.name)
+        pool_accounts = pool.get('accounts') if isinstance(pool, dict) else pool
+        if not isinstance(pool_accounts, list):
+            raise AuthError(f'账号池文件格式错误, 缺少 accounts 列表: {pool_file}')
+        return pool_accounts
+
     def auth_type_verify(self) -> None:
         """授权类型检查"""
         _allow_auth_type = get_enum_values(AuthType)
         if self.auth_type not in _allow_auth_type:
             raise AuthError(f'认证类型错误, 允许 {_allow_auth_type} 之一, 请检查认证配置文件')
 
-    def _get_file_cache(self, key: str) -> str | None:
+    def account_strategy_verify(self) -> None:
+        """账号分配策略检查"""
+        _allow_strategy = get_enum_values(AccountStrategy)
+        if self.account_strategy not in _allow_strategy:
+            raise AuthError(f'账号分配策略错误, 允许 {_allow_strategy} 之一, 请检查认证配置文件')
+
+    def lease_account(self) -> int | None:
+        """
+        从账号池中分配账号
+
+        Returns:
+            账号池索引，未配置账号池时返回 None
+        """
+        if not self.accounts:
+            return None
+        pinned = getattr(self._account_local, 'pinned', None)
+        if pinned is not None:
+            return pinned % len(self.accounts)
+        if self.account_strategy == AccountStrategy.AFFINITY:
+            worker = os.environ.get('PYTEST_XDIST_WORKER', '')
+            if worker.startswith('gw') and worker[2:].isdigit():
+                return int(worker[2:]) % len(self.accounts)
+            affinity = getattr(self._account_local, 'affinity', None)
+            if affinity is None:
+                affinity = self._account_local.affinity = next(self._account_counter)
+            return affinity % len(self.accounts)
+        return next(self._account_counter) % len(self.accounts)
+
+    @contextmanager
+    def use_account(self, account: int | None) -> Iterator[None]:
+        """
+        在当前线程中固定使用账号池中的指定账号
+
+        Args:
+            account: 账号池索引
+        """
+        previous = getattr(self._account_local, 'pinned', None)
+        self._account_local.pinned = account
+        try:
+            yield
+        finally:
+            self._account_local.pinned = previous
+
+    def get_auth_config(self, account: int | None = None) -> dict:
+        """
+        获取认证配置
+
+        Args:
+            account: 账号池索引，为空时使用认证配置中的账号
+        """
+        auth_config = self.auth_data[f'{self.auth_type}']
+        if account is None or not self.accounts:
+            return auth_config
+        return {**auth_config, **self.accounts[account % len(self.accounts)]}
+
+    def _account_cache_key(self, cache_key: str, account: int | None) -> str:
+        if account is None or not self.accounts:
+            return cache_key
+        account_config = self.get_auth_config(account)
+        ident = account_config.get('account') or account_config.get('username') or account % len(self.accounts)
+        return f'{cache_key}:{ident}'
+
+    def _get_file_cache(self, key: str) -> tuple[str | None, float]:
         """
         从文件获取缓存的 token
 
@@ -59,26 +185,27 @@ class AuthPlugins:
             key: 缓存键名
 
         Returns:
-            缓存的 token，如果不存在或过期返回 None
+            缓存的 token 及过期时间戳，如果不存在或过期 token 为 None
         """
         cache_file = self.cache_dir / f"{key}.json"
         if not cache_file.exists():
-            return None
+            return None, 0
 
         try:
             with open(cache_file, 'r', encoding='utf-8') as f:
                 cache_data = json.load(f)
 
             # 检查是否过期
-            if time.time() > cache_data.get('expire_time', 0):
+            expire_time = cache_data.get('expire_time', 0)
+            if time.time() > expire_time:
                 log.debug(f'文件缓存 {key} 已过期，将重新获取')
                 cache_file.unlink(missing_ok=True)
-                return None
+                return None, 0
 
-            return cache_data.get('value')
+            return cache_data.get('value'), expire_time
         except Exception as e:
             log.warning(f'读取文件缓存 {key} 失败: {e}')
-            return None
+            return None, 0
 
     def _set_file_cache(self, key: str, value: str, expire_seconds: int = None) -> None:
         """
@@ -99,13 +226,16 @@ class AuthPlugins:
         }
 
         try:
-            with open(cache_file, 'w', encoding='utf-8') as f:
+            # 先写入临时文件再替换, 避免其他进程读取到不完整的缓存
+            fd, tmp_file = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
                 json.dump(cache_data, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_file, cache_file)
             log.debug(f'✓ Token 已缓存到文件: {cache_file}')
         except Exception as e:
             log.warning(f'写入文件缓存 {key} 失败: {e}')
 
-    def _get_cache(self, key: str) -> str | None:
+    def _get_cache(self, key: str) -> tuple[str | None, float]:
         """
         智能获取缓存：优先使用 Redis，如果未启用则使用文件缓存
 
@@ -113,10 +243,14 @@ class AuthPlugins:
             key: 缓存键名
 
         Returns:
-            缓存的值，如果不存在返回 None
+            缓存的值及过期时间戳，如果不存在值为 None
         """
         if redis_client.is_enabled:
-            return redis_client.get(key, logging=False)
+            value = redis_client.get(key, logging=False)
+            if not value:
+                return None, 0
+            ttl = redis_client.ttl(key)
+            return value, time.time() + (ttl if ttl > 0 else self.timeout)
         else:
             return self._get_file_cache(key)
 
@@ -135,15 +269,15 @@ class AuthPlugins:
             log.info(f'Redis 未启用，使用文件缓存存储 Token')
             self._set_file_cache(key, value, expire_seconds)
 
-    def request_auth(self) -> requests.Response:
+    def request_auth(self, account: int | None = None) -> requests.Response:
         try:
-            from httpseeker.utils.encryption_filter import EncryptionFilter
+            from httpseeker.utils.encryption_filter import get_encryption_filter
 
-            url = self.auth_data[f'{self.auth_type}']['url']
-            headers = self.auth_data[f'{self.auth_type}']['headers']
+            auth_config = self.get_auth_config(account)
+            url = auth_config['url']
+            headers = dict(auth_config['headers'])
 
             # 构建请求体（支持不同的字段名）
-            auth_config = self.auth_data[f'{self.auth_type}']
             body_data = {}
 
             # 兼容不同的字段名配置
@@ -165,11 +299,7 @@ class AuthPlugins:
             # 检查是否需要加密
             encryption_enabled = auth_config.get('encryption_enabled', False)
             if encryption_enabled:
-                encryption_key = auth_config.get('encryption_key')
-                encryption_filter = EncryptionFilter(
-                    encryption_enabled=True,
-                    encryption_key=encryption_key
-                )
+                encryption_filter = get_encryption_filter(auth_config.get('encryption_key'))
                 encrypted_body, extra_headers = encryption_filter.encrypt_request_body(body_data)
                 body_data = encrypted_body
                 headers.update(extra_headers)
@@ -189,119 +319,239 @@ class AuthPlugins:
             raise SendRequestError(f'授权接口请求响应异常: {e}')
         return response
 
+    def _key_lock(self, cache_key: str) -> threading.Lock:
+        with self._locks_lock:
+            return self._locks.setdefault(cache_key, threading.Lock())
+
+    @contextmanager
+    def _shared_lock(self, cache_key: str) -> Iterator[None]:
+        """
+        跨进程登录锁：Redis 启用时使用 Redis 锁，否则使用文件锁；等待超时后不再等待，直接继续执行
+
+        Args:
+            cache_key: 缓存键名
+        """
+        timeout = httpseeker_config.AUTH_LOCK_TIMEOUT
+        if redis_client.is_enabled:
+            lock = redis_client.lock(cache_key, timeout=timeout, blocking_timeout=timeout)
+            acquired = lock.acquire()
+            if not acquired:
+                log.warning(f'等待登录锁 {cache_key} 超时，继续执行')
+            try:
+                yield
+            finally:
+                if acquired:
+                    try:
+                        lock.release()
+                    except LockError:
+                        pass
+            return
+
+        lock_file = self.cache_dir / f'{cache_key}.lock'
+        deadline = time.monotonic() + timeout
+        acquired = False
+        while not acquired:
+            try:
+                os.close(os.open(lock_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                acquired = True
+            except FileExistsError:
+                try:
+                    # 持有锁的进程异常退出时, 锁文件超时后视为失效
+                    if time.time() - lock_file.stat().st_mtime > timeout:
+                        lock_file.unlink(missing_ok=True)
+                        continue
+                except FileNotFoundError:
+                    continue
+                if time.monotonic() >= deadline:
+                    log.warning(f'等待登录锁 {cache_key} 超时，继续执行')
+                    break
+                time.sleep(0.05)
+        try:
+            yield
+        finally:
+            if acquired:
+                lock_file.unlink(missing_ok=True)
+
+    def _remember(self, cache_key: str, token: str, expire_at: float) -> str:
+        self._tokens[cache_key] = (token, expire_at, max(expire_at - time.time(), 0))
+        return token
+
+    def _load_token(self, cache_key: str, fetch: Callable[[], str], name: str, refresh: bool = False) -> str:
+        """
+        从共享缓存加载 token，不存在时获取锁后调用 fetch 获取并写入共享缓存
+
+        Args:
+            cache_key: 缓存键名
+            fetch: token 获取函数
+            name: token 名称
+            refresh: 提前刷新，仅当共享缓存中的 token 比进程内缓存更新时才直接使用
+        """
+        current_expire_at = self._tokens[cache_key][1] if refresh and cache_key in self._tokens else 0
+        token, expire_at = self._get_cache(cache_key)
+        if token and expire_at > current_expire_at + 1:
+            log.debug(f'✓ 使用缓存的 {name}')
+            return self._remember(cache_key, token, expire_at)
+        with self._shared_lock(cache_key):
+            # 等待锁期间其他进程可能已完成登录
+            token, expire_at = self._get_cache(cache_key)
+            if token and expire_at > current_expire_at + 1:
+                log.debug(f'✓ 使用缓存的 {name}')
+                return self._remember(cache_key, token, expire_at)
+            log.info(f'{"提前刷新" if refresh else "缓存中无"} {name}，开始获取...')
+            token = fetch()
+            expire_at = get_jwt_exp(token) or time.time() + self.timeout
+            expire_seconds = max(int(expire_at - time.time()), 1)
+            self._set_cache(cache_key, token, expire_seconds)
+            log.info(f'✓ {name} 获取成功并已缓存（有效期: {expire_seconds}秒）')
+            return self._remember(cache_key, token, expire_at)
+
+    def _refresh_in_background(self, cache_key: str, fetch: Callable[[], str], name: str) -> None:
+        with self._locks_lock:
+            if cache_key in self._refreshing:
+                return
+            self._refreshing.add(cache_key)
+
+        def refresh() -> None:
+            try:
+                with self._key_lock(cache_key):
+                    self._load_token(cache_key, fetch, name, refresh=True)
+            except Exception as e:
+                log.warning(f'{name} 后台刷新失败: {e}')
+            finally:
+                with self._locks_lock:
+                    self._refreshing.discard(cache_key)
+
+        threading.Thread(target=refresh, name=f'auth-refresh-{cache_key}', daemon=True).start()
+
+    def _get_token(self, cache_key: str, fetch: Callable[[], str], name: str) -> str:
+        """
+        获取 token：优先使用进程内缓存，即将过期时在后台提前刷新；
+        进程内缓存失效时，同一进程内只有一个线程加载，其他线程等待其结果
+
+        Args:
+            cache_key: 缓存键名
+            fetch: token 获取函数
+            name: token 名称
+        """
+        cached = self._tokens.get(cache_key)
+        if cached is not None:
+            token, expire_at, lifetime = cached
+            remaining = expire_at - time.time()
+            if remaining > 0:
+                if remaining <= min(httpseeker_config.AUTH_REFRESH_AHEAD, lifetime / 2):
+                    self._refresh_in_background(cache_key, fetch, name)
+                return token
+        with self._key_lock(cache_key):
+            cached = self._tokens.get(cache_key)
+            if cached is not None and cached[1] > time.time():
+                return cached[0]
+            return self._load_token(cache_key, fetch, name)
+
+    def _extract_token(self, res: requests.Response, name: str, decrypt: bool = False) -> str:
+        response_data = res.json()
+
+        # 检查是否需要解密响应
+        auth_config = self.auth_data[f'{self.auth_type}']
+        if decrypt and auth_config.get('encryption_enabled', False):
+            from httpseeker.utils.encryption_filter import get_encryption_filter
+
+            encryption_filter = get_encryption_filter(auth_config.get('encryption_key'))
+            response_data = encryption_filter.decrypt_response_data(response_data)
+
+        jp_token = findall(auth_config['token_key'], response_data)
+        token = jp_token[0] if jp_token else None
+        if not token:
+            raise AuthError(f'{name} 获取失败，请检查登录接口响应或 token 提取表达式')
+        return token
+
+    def _fetch_header_cookie(self, account: int | None = None) -> str:
+        res = self.request_auth(account)
+        cookies = {k: v for k, v in res.cookies.items()}
+        if not cookies:
+            raise AuthError('Cookie 获取失败，请检查登录接口响应')
+        return json.dumps(cookies, ensure_ascii=False)
+
+    def get_token(self, account: int | None = None) -> str | dict:
+        """
+        获取当前认证类型的 token
+
+        Args:
+            account: 账号池索引，为空时使用认证配置中的账号
+
+        Returns:
+            token，cookie 认证时为 cookies
+        """
+        if self.auth_type == AuthType.TOKEN:
+            cache_key, name = f'{redis_client.token_prefix}:bearer_token', 'Bearer Token'
+            fetch = lambda: self._extract_token(self.request_auth(account), 'Token')  # noqa: E731
+        elif self.auth_type == AuthType.TOKEN_CUSTOM:
+            cache_key, name = f'{redis_client.token_prefix}:bearer_token_custom', 'Bearer Token（自定义）'
+            fetch = lambda: self.get_auth_config(account)['token']  # noqa: E731
+        elif self.auth_type == AuthType.COOKIE:
+            cache_key, name = f'{redis_client.cookie_prefix}:header_cookie', 'Cookie'
+            fetch = lambda: self._fetch_header_cookie(account)  # noqa: E731
+        elif self.auth_type == AuthType.TK:
+            cache_key, name = f'{redis_client.token_prefix}:tk', 'TK Token'
+            fetch = lambda: self._extract_token(self.request_auth(account), name, decrypt=True)  # noqa: E731
+        else:
+            cache_key, name = f'{redis_client.token_prefix}:authorization', 'Authorization Token'
+            fetch = lambda: self._extract_token(self.request_auth(account), name, decrypt=True)  # noqa: E731
+        token = self._get_token(self._account_cache_key(cache_key, account), fetch, name)
+        return json.loads(token) if self.auth_type == AuthType.COOKIE else token
+
+    def auth_headers(self, headers: dict | None, account: int | None = None) -> dict | None:
+        """
+        添加认证请求头
+
+        Args:
+            headers: 请求头
+            account: 账号池索引，为空时按账号分配策略分配
+        """
+        if not self.is_auth or self.auth_type == AuthType.COOKIE:
+            return headers
+        token = self.get_token(self.lease_account() if account is None else account)
+        if self.auth_type in (AuthType.TOKEN, AuthType.TOKEN_CUSTOM):
+            auth_header = {'Authorization': f'Bearer {token}'}
+        elif self.auth_type == AuthType.TK:
+            auth_header = {'tk': token}
+        else:
+            auth_header = {'Authorization': token}
+        return {**headers, **auth_header} if headers is not None else auth_header
+
+    def auth_cookies(self, cookies: dict | None, account: int | None = None) -> dict | None:
+        """
+        添加认证 cookies
+
+        Args:
+            cookies: cookies
+            account: 账号池索引，为空时按账号分配策略分配
+        """
+        if not self.is_auth or self.auth_type != AuthType.COOKIE:
+            return cookies
+        header_cookie = self.get_token(self.lease_account() if account is None else account)
+        return {**cookies, **header_cookie} if cookies is not None else header_cookie
+
     @property
     def bearer_token(self) -> str:
-        cache_key = f'{redis_client.token_prefix}:bearer_token'
-        cache_bearer_token = self._get_cache(cache_key)
-        if cache_bearer_token:
-            token = cache_bearer_token
-            log.debug('✓ 使用缓存的 Bearer Token')
-        else:
-            log.info('缓存中无 Bearer Token，开始调用登录接口获取...')
-            res = self.request_auth()
-            jp_token = findall(self.auth_data[f'{self.auth_type}']['token_key'], res.json())
-            token = jp_token[0]
-            if not token:
-                raise AuthError('Token 获取失败，请检查登录接口响应或 token 提取表达式')
-            self._set_cache(cache_key, token, self.timeout)
-            log.info('✓ Bearer Token 获取成功并已缓存')
-        return token
+        return self.get_token()
 
     @property
     def bearer_token_custom(self) -> str:
-        cache_key = f'{redis_client.token_prefix}:bearer_token_custom'
-        cache_bearer_token_custom = self._get_cache(cache_key)
-        if cache_bearer_token_custom:
-            token = cache_bearer_token_custom
-        else:
-            token = self.auth_data[f'{self.auth_type}']['token']
-            self._set_cache(cache_key, token, self.timeout)
-        return token
+        return self.get_token()
 
     @property
     def header_cookie(self) -> dict:
-        cache_key = f'{redis_client.cookie_prefix}:header_cookie'
-        cache_cookie = self._get_cache(cache_key)
-        if cache_cookie:
-            cookies = json.loads(cache_cookie)
-            log.debug('✓ 使用缓存的 Cookie')
-        else:
-            log.info('缓存中无 Cookie，开始调用登录接口获取...')
-            res = self.request_auth()
-            res_cookie = res.cookies
-            cookies = {k: v for k, v in res_cookie.items()}
-            if not cookies:
-                raise AuthError('Cookie 获取失败，请检查登录接口响应')
-            self._set_cache(cache_key, json.dumps(cookies, ensure_ascii=False), self.timeout)
-            log.info('✓ Cookie 获取成功并已缓存')
-        return cookies
+        return self.get_token()
 
     @property
     def tk(self) -> str:
         """自定义 tk token 认证"""
-        cache_key = f'{redis_client.token_prefix}:tk'
-        cache_tk_token = self._get_cache(cache_key)
-        if cache_tk_token:
-            token = cache_tk_token
-            log.debug('✓ 使用缓存的 TK Token')
-        else:
-            from httpseeker.utils.encryption_filter import EncryptionFilter
-
-            log.info('缓存中无 TK Token，开始调用登录接口获取...')
-            res = self.request_auth()
-            response_data = res.json()
-
-            # 检查是否需要解密响应
-            auth_config = self.auth_data[f'{self.auth_type}']
-            encryption_enabled = auth_config.get('encryption_enabled', False)
-            if encryption_enabled:
-                encryption_key = auth_config.get('encryption_key')
-                encryption_filter = EncryptionFilter(
-                    encryption_enabled=True,
-                    encryption_key=encryption_key
-                )
-                response_data = encryption_filter.decrypt_response_data(response_data)
-
-            jp_token = findall(self.auth_data[f'{self.auth_type}']['token_key'], response_data)
-            token = jp_token[0]
-            if not token:
-                raise AuthError('TK Token 获取失败，请检查登录接口响应或 token 提取表达式')
-            self._set_cache(cache_key, token, self.timeout)
-            log.info(f'✓ TK Token 获取成功并已缓存（有效期: {self.timeout}秒）')
-        return token
+        return self.get_token()
 
     @property
     def authorization(self) -> str:
         """Authorization 头认证（不带 Bearer 前缀）"""
-        cache_key = f'{redis_client.token_prefix}:authorization'
-        cache_token = self._get_cache(cache_key)
-        if cache_token:
-            token = cache_token
-            log.debug('✓ 使用缓存的 Authorization Token')
-        else:
-            log.info('缓存中无 Authorization Token，开始调用登录接口获取...')
-            res = self.request_auth()
-            response_data = res.json()
-
-            # 检查是否需要解密响应
-            auth_config = self.auth_data[f'{self.auth_type}']
-            encryption_enabled = auth_config.get('encryption_enabled', False)
-            if encryption_enabled:
-                from httpseeker.utils.encryption_filter import EncryptionFilter
-                encryption_key = auth_config.get('encryption_key')
-                encryption_filter = EncryptionFilter(
-                    encryption_enabled=True,
-                    encryption_key=encryption_key
-                )
-                response_data = encryption_filter.decrypt_response_data(response_data)
-
-            jp_token = findall(self.auth_data[f'{self.auth_type}']['token_key'], response_data)
-            token = jp_token[0]
-            if not token:
-                raise AuthError('Authorization Token 获取失败，请检查登录接口响应或 token 提取表达式')
-            self._set_cache(cache_key, token, self.timeout)
-            log.info(f'✓ Authorization Token 获取成功并已缓存（有效期: {self.timeout}秒）')
-        return token
+        return self.get_token()
 
 
 auth = AuthPlugins()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import json
+
+from httpseeker.common.errors import CorrelateTestCaseError
+from httpseeker.db.redis import redis_client
+from httpseeker.enums.setup_type import SetupType
+from httpseeker.utils.case_loader import case_loader
+
+
+def load_all_case_data() -> list[dict]:
+    """
+    获取所有测试用例数据, 优先读取 redis 缓存, redis 未启用时从文件读取
+
+    :return:
+    """
+    if redis_client.is_enabled:
+        return [json.loads(case_data) for case_data in redis_client.get_prefix(f'{redis_client.case_data_prefix}:')]
+    return case_loader.load()
+
+
+def get_setup_testcases(case_steps: dict) -> list[str]:
+    """
+    获取用例前置关联的测试用例 case_id
+
+    :param case_steps:
+    :return:
+    """
+    setup_testcases = []
+    for setup in case_steps.get('setup') or []:
+        value = setup.get(SetupType.TESTCASE)
+        if isinstance(value, str):
+            setup_testcases.append(value)
+        elif isinstance(value, dict) and value.get('case_id'):
+            setup_testcases.append(value['case_id'])
+    return setup_testcases
+
+
+def build_case_graph(all_case_data: list[dict]) -> tuple[dict[str, list[str]], dict[str, str]]:
+    """
+    构建用例依赖图
+
+    :param all_case_data: 所有测试用例数据
+    :return: (case_id: 前置关联用例 case_id 列表, case_id: 用例数据文件名)
+    """
+    graph: dict[str, list[str]] = {}
+    case_file: dict[str, str] = {}
+    for case_data in all_case_data:
+        steps = case_data.get('test_steps')
+        if isinstance(steps, dict):
+            steps = [steps]
+        if not isinstance(steps, list):
+            continue
+        for case_steps in steps:
+            if not isinstance(case_steps, dict) or 'case_id' not in case_steps:
+                continue
+            graph[case_steps['case_id']] = get_setup_testcases(case_steps)
+            case_file[case_steps['case_id']] = case_data.get('filename', '')
+    return graph, case_file
+
+
+def find_cycle(graph: dict[str, list[str]]) -> list[str] | None:
+    """
+    查找依赖图中的循环关联
+
+    :param graph:
+    :return: 循环关联路径, 不存在时返回 None
+    """
+    visiting, visited = 1, 2
+    state: dict[str, int] = {}
+    for root in graph:
+        if state.get(root) == visited:
+            continue
+        path = [root]
+        stack = [iter(graph[root])]
+        state[root] = visiting
+        while stack:
+            node = next(stack[-1], None)
+            if node is None:
+                state[path.pop()] = visited
+                stack.pop()
+                continue
+            if state.get(node) == visiting:
+                return path[path.index(node) :] + [node]
+            if state.get(node) is None and node in graph:
+                state[node] = visiting
+                path.append(node)
+                stack.append(iter(graph[node]))
+    return None
+
+
+def case_graph_verify(all_case_data: list[dict] | None = None) -> None:
+    """
+    校验用例依赖图, 存在循环关联或关联不存在的用例时终止运行
+
+    :param all_case_data:
+    :return:
+    """
+    graph, _ = build_case_graph(all_case_data if all_case_data is not None else load_all_case_data())
+    for case_id, setup_testcases in graph.items():
+        for setup_testcase in setup_testcases:
+            if setup_testcase == case_id:
+                raise CorrelateTestCaseError(f'测试用例 {case_id} 关联自身')
+            if setup_testcase not in graph:
+                raise CorrelateTestCaseError(f'测试用例 {case_id} 关联的测试用例 {setup_testcase} 不存在')
+    cycle = find_cycle(graph)
+    if cycle is not None:
+        raise CorrelateTestCaseError(f'检测到测试用例循环关联: {" -> ".join(cycle)}')
+
+
+def get_case_groups(all_case_data: list[dict] | None = None) -> dict[str, str]:
+    """
+    获取用例分组, 存在前置关联关系的用例及同一数据文件中的用例归为同一组, 各组之间可并行执行
+
+    :param all_case_data:
+    :return: case_id: 分组名称
+    """
+    graph, case_file = build_case_graph(all_case_data if all_case_data is not None else load_all_case_data())
+    parent: dict[str, str] = {}
+
+    def find(node: str) -> str:
+        parent.setdefault(node, node)
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    def union(a: str, b: str) -> None:
+        root_a, root_b = find(a), find(b)
+        if root_a != root_b:
+            parent[max(root_a, root_b)] = min(root_a, root_b)
+
+    # 同一数据文件中的用例可能通过变量提取传递数据, 需保持在同一组中按顺序执行
+    for case_id, filename in case_file.items():
+        union(f'file:{filename}', case_id)
+    for case_id, setup_testcases in graph.items():
+        for setup_testcase in setup_testcases:
+            if setup_testcase in graph:
+                union(case_id, setup_testcase)
+    return {case_id: find(case_id) for case_id in graph}
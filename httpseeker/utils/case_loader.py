@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import copy
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+from httpseeker.common.errors import RequestDataParseError
+from httpseeker.common.json_handler import read_json_file
+from httpseeker.common.log import log
+from httpseeker.common.yaml_handler import read_yaml
+from httpseeker.core.path_conf import httpseeker_path
+from httpseeker.enums.case_data_type import CaseDataType
+from httpseeker.utils.file_control import get_file_property, search_all_case_data_files
+
+# 缓存格式版本, 缓存结构变化时递增
+_CACHE_VERSION = 1
+# 变化的文件数量达到此值时使用多进程解析
+_PARALLEL_THRESHOLD = 16
+
+
+def parse_case_file(filepath: str) -> dict[str, Any]:
+    """
+    解析测试用例数据文件
+
+    :param filepath:
+    :return: 用例数据, 包含 filename 及 file_hash
+    """
+    filename, _, file_type = get_file_property(filepath)
+    if file_type == CaseDataType.JSON:
+        case_data = read_json_file(filepath)
+    else:
+        case_data = read_yaml(filepath)
+    with open(filepath, 'rb') as f:
+        file_hash = hashlib.sha256(f.read()).hexdigest()
+    case_data.update({'filename': filename, 'file_hash': file_hash})
+    return case_data
+
+
+class CaseLoader:
+    """
+    测试用例数据增量加载器
+
+    以文件修改时间及大小与本地清单对比, 仅解析变化的文件, 变化较多时使用多进程解析;
+    解析结果以 pickle 保存到 data/.case_cache, 不依赖 redis
+    """
+
+    def __init__(self, cache_dir: str = httpseeker_path.case_cache_dir, workers: int | None = None) -> None:
+        """
+        :param cache_dir: 缓存目录
+        :param workers: 解析进程数, 默认为 CPU 核心数
+        """
+        self.cache_dir = cache_dir
+        self.cache_file = os.path.join(cache_dir, 'case_data.pickle')
+        self.workers = workers
+        # 文件路径: ((修改时间, 文件大小), 用例数据)
+        self._entries: dict[str, tuple[tuple[int, int], dict]] | None = None
+        # 文件名: 文件路径
+        self._filename_index: dict[str, str] | None = None
+        self._lock = threading.Lock()
+
+    def _read_cache(self) -> dict[str, tuple[tuple[int, int], dict]]:
+        try:
+            with open(self.cache_file, 'rb') as f:
+                version, entries = pickle.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            log.warning(f'测试用例数据缓存读取失败, 将重新解析: {e}')
+            return {}
+        return entries if version == _CACHE_VERSION else {}
+
+    def _write_cache(self, entries: dict[str, tuple[tuple[int, int], dict]]) -> None:
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, tmp_file = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump((_CACHE_VERSION, entries), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, self.cache_file)
+        except Exception as e:
+            log.warning(f'测试用例数据缓存写入失败: {e}')
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+
+    def _parse_files(self, files: list[str]) -> list[dict]:
+        if len(files) < _PARALLEL_THRESHOLD:
+            return [parse_case_file(file) for file in files]
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            return list(executor.map(parse_case_file, files, chunksize=8))
+
+    def load(self, files: list[str] | None = None) -> list[dict]:
+        """
+        加载测试用例数据, 返回值为共享数据, 请勿修改
+
+        :param files: 用例数据文件列表, 默认为当前项目所有用例数据文件, 此时同时清理已删除文件的缓存
+        :return:
+        """
+        full_scan = files is None
+        files = [os.path.abspath(file) for file in (files if files is not None else search_all_case_data_files())]
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._read_cache()
+            entries = self._entries
+            signatures = {}
+            changed_files = []
+            for file in files:
+                stat = os.stat(file)
+                signatures[file] = (stat.st_mtime_ns, stat.st_size)
+                cached = entries.get(file)
+                if cached is None or cached[0] != signatures[file]:
+                    changed_files.append(file)
+            removed_files = (
+                [file for file in entries if file not in signatures and not os.path.exists(file)] if full_scan else []
+            )
+            if changed_files:
+                cached = len(files) - len(changed_files)
+                log.info(f'解析测试用例数据文件: {len(changed_files)} 个变化, {cached} 个使用缓存')
+                for file, case_data in zip(changed_files, self._parse_files(changed_files)):
+                    entries[file] = (signatures[file], case_data)
+            for file in removed_files:
+                del entries[file]
+            if changed_files or removed_files:
+                self._write_cache(entries)
+            return [entries[file][1] for file in files]
+
+    def get_case_data(self, filename: str) -> dict:
+        """
+        按文件名获取用例数据, 首次调用时构建文件名索引, 后续仅校验目标文件是否变化
+
+        :param filename: 用例数据文件名
+        :return: 用例数据副本
+        """
+        if self._filename_index is None:
+            files = search_all_case_data_files()
+            index = {}
+            for file, case_data in zip(files, self.load(files)):
+                index.setdefault(case_data['filename'], os.path.abspath(file))
+            self._filename_index = index
+        filepath = self._filename_index.get(filename)
+        if filepath is None:
+            filepath = next((file for file in self._filename_index.values() if file.endswith(filename)), None)
+        if filepath is None or not os.path.exists(filepath):
+            raise RequestDataParseError(f'未找到测试用例文件: {filename}')
+        return copy.deepcopy(self.load([filepath])[0])
+
+    def clear(self) -> None:
+        """清空缓存"""
+        with self._lock:
+            self._entries = None
+            self._filename_index = None
+            if os.path.exists(self.cache_file):
+                os.remove(self.cache_file)
+
+
+case_loader = CaseLoader()
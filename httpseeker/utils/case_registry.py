@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import copy
+import json
+import threading
+
+from httpseeker.db.redis import redis_client
+from httpseeker.utils.case_loader import case_loader
+
+
+class CaseRegistry:
+    """
+    测试用例注册表
+
+    记录 case_id 对应的用例数据文件名及测试步骤索引, redis 启用时保存为 redis hash, 各进程首次使用时加载一次;
+    redis 未启用时使用本地用例数据构建
+    """
+
+    def __init__(self) -> None:
+        # case_id: (用例数据文件名, 测试步骤索引), test_steps 为 dict 时索引为 None
+        self._index: dict[str, tuple[str, int | None]] | None = None
+        # 用例数据文件名: 用例数据
+        self._case_data: dict[str, str | dict] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def build_index(all_case_data: list[dict]) -> dict[str, tuple[str, int | None]]:
+        """
+        构建用例索引
+
+        :param all_case_data: 所有测试用例数据
+        :return:
+        """
+        index: dict[str, tuple[str, int | None]] = {}
+        for case_data in all_case_data:
+            steps = case_data.get('test_steps')
+            if isinstance(steps, dict):
+                index[steps['case_id']] = (case_data['filename'], None)
+            elif isinstance(steps, list):
+                for i, case_steps in enumerate(steps):
+                    index[case_steps['case_id']] = (case_data['filename'], i)
+        return index
+
+    def register(self, index: dict[str, tuple[str, int | None]]) -> None:
+        """
+        注册用例索引
+
+        :param index:
+        :return:
+        """
+        if not redis_client.is_enabled:
+            # redis 未启用时索引无法跨进程共享, 由 _load 使用本地用例数据构建, 保证用例数据同时加载
+            self.clear()
+            return
+        redis_client.delete(redis_client.case_registry_key)
+        redis_client.hset(redis_client.case_registry_key, {k: json.dumps(v) for k, v in index.items()})
+        with self._lock:
+            self._index = index
+            self._case_data.clear()
+
+    def _load(self) -> dict[str, tuple[str, int | None]]:
+        if self._index is None:
+            with self._lock:
+                if self._index is None:
+                    if redis_client.is_enabled:
+                        self._index = {
+                            k: tuple(json.loads(v))  # type: ignore
+                            for k, v in redis_client.hgetall(redis_client.case_registry_key).items()
+                        }
+                    else:
+                        all_case_data = case_loader.load()
+                        self._index = self.build_index(all_case_data)
+                        self._case_data.update({case_data['filename']: case_data for case_data in all_case_data})
+        return self._index
+
+    def __contains__(self, case_id: str) -> bool:
+        return case_id in self._load()
+
+    def get_case(self, case_id: str) -> tuple[dict, dict]:
+        """
+        获取用例数据, 返回值为副本, 可直接修改
+
+        :param case_id:
+        :return: (用例数据文件数据, 用例测试步骤)
+        """
+        filename, step_index = self._load()[case_id]
+        source = self._case_data.get(filename)
+        if source is None:
+            source = self._case_data[filename] = redis_client.get(f'{redis_client.case_data_prefix}:{filename}')
+        case_data = json.loads(source) if isinstance(source, str) else copy.deepcopy(source)
+        steps = case_data['test_steps'] if step_index is None else case_data['test_steps'][step_index]
+        return case_data, steps
+
+    def clear(self) -> None:
+        """清空进程内缓存, 下次使用时重新加载"""
+        with self._lock:
+            self._index = None
+            self._case_data.clear()
+
+
+case_registry = CaseRegistry()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import os
+
+import cappa
+
+from _pytest.outcomes import Skipped
+from rich.table import Table
+
+from httpseeker.common.async_runner import LoadResult, async_runner
+from httpseeker.common.json_handler import read_json_file
+from httpseeker.common.send_request import send_request
+from httpseeker.common.yaml_handler import read_yaml
+from httpseeker.db.redis import redis_client
+from httpseeker.enums.case_data_type import CaseDataType
+from httpseeker.enums.request.engin import EnginType
+from httpseeker.utils.auth_plugins import auth
+from httpseeker.utils.file_control import get_file_property, search_all_case_data_files
+from httpseeker.utils.request.case_data_parse import case_data_init, case_id_unique_verify
+from httpseeker.utils.rich_console import console
+
+
+def get_load_case_data(filepath: str | None = None) -> list[dict]:
+    """
+    获取压测用例数据
+
+    :param filepath: 用例数据文件或目录, 为空时使用当前项目所有用例数据
+    :return:
+    """
+    if filepath is not None and os.path.isfile(filepath):
+        files = [filepath]
+    else:
+        files = search_all_case_data_files(filepath)
+    case_data_list = []
+    for file in files:
+        filename, _, file_type = get_file_property(file)
+        if file_type == CaseDataType.JSON:
+            file_data = read_json_file(file)
+        else:
+            file_data = read_yaml(file)
+        steps = file_data.get('test_steps')
+        if isinstance(steps, dict):
+            steps = [steps]
+        for step in steps or []:
+            case_data_list.append({'config': file_data['config'], 'test_steps': step, 'filename': filename})
+    return case_data_list
+
+
+def _replayable_files(files: dict | None) -> dict | None:
+    """读取上传文件内容, 使请求可重复发送"""
+    if not files:
+        return files
+    replayable = {}
+    for k, v in files.items():
+        if isinstance(v, tuple) and len(v) > 1 and hasattr(v[1], 'read'):
+            v = (v[0], v[1].read(), *v[2:])
+        replayable[k] = v
+    return replayable
+
+
+def prepare_load_requests(case_data_list: list[dict]) -> list[tuple]:
+    """
+    准备压测请求, 每个用例仅解析一次
+
+    :param case_data_list:
+    :return:
+    """
+    prepared_list = []
+    for case_data in case_data_list:
+        case_id = case_data['test_steps'].get('case_id')
+        try:
+            parsed_data, request_conf, request_data_parsed = send_request.prepare_request(
+                case_data, EnginType.httpx_async
+            )
+        except Skipped as e:
+            console.print(f'⚠️ 跳过用例 {case_id}: {e.msg}')
+            continue
+        except Exception as e:
+            console.print(f'⚠️ 用例 {case_id} 请求数据解析失败, 已跳过: {e}')
+            continue
+        request_data_parsed['files'] = _replayable_files(request_data_parsed.get('files'))
+        prepared_list.append((parsed_data, request_conf, request_data_parsed))
+    return prepared_list
+
+
+def load_report(results: dict[str, LoadResult], elapsed: float) -> Table:
+    """
+    生成压测报告
+
+    :param results:
+    :param elapsed: 实际执行时间(秒)
+    :return:
+    """
+    table = Table(title=f'压测结果 (耗时 {elapsed:.2f}s)')
+    columns = ('case_id', '请求数', '错误数', '错误率', 'RPS', 'P50(ms)', 'P95(ms)', 'P99(ms)', '排队P95(ms)')
+    for column in (*columns, '错误详情'):
+        table.add_column(column, justify='left' if column in ('case_id', '错误详情') else 'right')
+
+    def add_row(name: str, result: LoadResult) -> None:
+        error_rate = result.errors / result.total if result.total else 0
+        table.add_row(
+            name,
+            str(result.total),
+            str(result.errors),
+            f'{error_rate:.2%}',
+            f'{result.total / elapsed:.2f}' if elapsed else '0.00',
+            f'{result.percentile(50):.2f}',
+            f'{result.percentile(95):.2f}',
+            f'{result.percentile(99):.2f}',
+            f'{result.queue_percentile(95):.2f}',
+            ', '.join(f'{k}: {v}' for k, v in result.error_messages.most_common()),
+        )
+
+    total = LoadResult()
+    for case_id, result in results.items():
+        add_row(case_id, result)
+        total.latencies.extend(result.latencies)
+        total.queue_times.extend(result.queue_times)
+        total.errors += result.errors
+        total.error_messages.update(result.error_messages)
+    table.add_section()
+    add_row('总计', total)
+    return table
+
+
+def run_load_test(filepath: str | None, duration: int, rate: float, concurrency: int) -> None:
+    """
+    执行压测
+
+    :param filepath: 用例数据文件或目录
+    :param duration: 持续时间(秒)
+    :param rate: 每秒请求数, 为 0 时按固定并发数执行
+    :param concurrency: 并发数
+    :return:
+    """
+    if filepath is not None:
+        filepath = os.path.abspath(filepath)
+        if not os.path.exists(filepath):
+            raise cappa.Exit(f'\n❌ 用例数据文件不存在: {filepath}', code=1)
+    if redis_client.is_enabled:
+        # 前置关联测试用例依赖 redis 中的用例数据
+        redis_client.init()
+        case_data_init(False)
+        case_id_unique_verify()
+    case_data_list = get_load_case_data(filepath)
+    if auth.is_auth and len(auth.accounts) > 1:
+        # 每个账号分别准备一份请求, 循环重放时请求分散到账号池中的所有账号
+        prepared_list = []
+        for account in range(len(auth.accounts)):
+            with auth.use_account(account):
+                prepared_list.extend(prepare_load_requests(case_data_list))
+    else:
+        prepared_list = prepare_load_requests(case_data_list)
+    if not prepared_list:
+        raise cappa.Exit('\n❌ 没有可执行的压测用例', code=1)
+    mode = f'{rate} RPS' if rate > 0 else f'{concurrency} 并发'
+    console.print(f'\n🔥 开始压测: {len(prepared_list)} 个用例, {mode}, 持续 {duration}s...')
+    try:
+        results, elapsed = async_runner.replay(prepared_list, duration, rate, concurrency)
+    finally:
+        async_runner.close()
+    console.print(load_report(results, elapsed))
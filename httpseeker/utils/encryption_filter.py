@@ -7,13 +7,15 @@
 from __future__ import annotations
 
 import base64
+import binascii
 import json
 import logging
 
+from functools import lru_cache
 from typing import Optional, Dict
 
 from Crypto.Cipher import AES
-from Crypto.Util.Padding import pad, unpad
+from Crypto.Util.Padding import pad
 from Crypto.Random import get_random_bytes
 
 logger = logging.getLogger(__name__)
@@ -27,6 +29,8 @@ class EncryptionFilter:
     ALGORITHM = "AES/CBC/PKCS5Padding"
     DEFAULT_KEY = "your-32-byte-secure-aes-key-1234"
     IV_LENGTH = 16
+    # 分块解密时每块的 Base64 字符数，解码后为 48 字节的整数倍，保证每块密文按 AES 块对齐
+    CHUNK_CHARS = 64 * 1024
 
     def __init__(self, encryption_enabled: bool = False, encryption_key: str = None):
         """
@@ -55,10 +59,11 @@ class EncryptionFilter:
         try:
             iv = get_random_bytes(self.IV_LENGTH)
             cipher = AES.new(self.encryption_key, AES.MODE_CBC, iv)
-            plain_bytes = plain_text.encode('utf-8')
-            padded_data = pad(plain_bytes, AES.block_size)
-            encrypted = cipher.encrypt(padded_data)
-            combined = iv + encrypted
+            padded_data = pad(plain_text.encode('utf-8'), AES.block_size)
+            # IV 与密文写入同一个缓冲区，避免拼接时复制
+            combined = bytearray(self.IV_LENGTH + len(padded_data))
+            combined[:self.IV_LENGTH] = iv
+            cipher.encrypt(padded_data, output=memoryview(combined)[self.IV_LENGTH:])
             return base64.b64encode(combined).decode('utf-8')
         except Exception as e:
             logger.error(f"加密失败: {e}")
@@ -75,17 +80,102 @@ class EncryptionFilter:
             解密后的明文字符串
         """
         try:
-            decoded = base64.b64decode(encrypted_data)
-            iv = decoded[:16]
-            cipher_text = decoded[16:]
-            cipher = AES.new(self.encryption_key, AES.MODE_CBC, iv)
-            decrypted = cipher.decrypt(cipher_text)
-            unpadded = unpad(decrypted, AES.block_size)
-            return unpadded.decode('utf-8')
+            return self.decrypt_bytes(encrypted_data).decode('utf-8')
         except Exception as e:
             logger.error(f"解密失败: {e}")
             raise IOError(f"解密失败: {e}")
 
+    def decrypt_bytes(self, encrypted_data: str) -> bytearray:
+        """
+        解密为字节缓冲区
+
+        按块解码 Base64 并将密文直接解密到预分配的缓冲区中，大数据量时无需保留完整的解码结果；
+        密文中包含换行等非 Base64 字符时，先整体解码再解密
+
+        Args:
+            encrypted_data: Base64编码的密文
+
+        Returns:
+            去除填充后的明文字节
+        """
+        try:
+            plain = self._decrypt_chunked(encrypted_data)
+        except binascii.Error:
+            decoded = memoryview(base64.b64decode(encrypted_data))
+            if len(decoded) <= self.IV_LENGTH or (len(decoded) - self.IV_LENGTH) % AES.block_size:
+                raise ValueError(f"密文长度错误: {len(decoded)}")
+            plain = bytearray(len(decoded) - self.IV_LENGTH)
+            cipher = AES.new(self.encryption_key, AES.MODE_CBC, decoded[:self.IV_LENGTH])
+            cipher.decrypt(decoded[self.IV_LENGTH:], output=plain)
+        self._unpad(plain)
+        return plain
+
+    def _decrypt_chunked(self, encrypted_data: str) -> bytearray:
+        size = self.decoded_size(encrypted_data)
+        if size is None:
+            raise binascii.Error("非标准 Base64 密文")
+        if size <= self.IV_LENGTH or (size - self.IV_LENGTH) % AES.block_size:
+            raise ValueError(f"密文长度错误: {size}")
+        plain = bytearray(size - self.IV_LENGTH)
+        output = memoryview(plain)
+        cipher = None
+        offset = 0
+        for start in range(0, len(encrypted_data), self.CHUNK_CHARS):
+            chunk = memoryview(base64.b64decode(encrypted_data[start:start + self.CHUNK_CHARS], validate=True))
+            if cipher is None:
+                cipher = AES.new(self.encryption_key, AES.MODE_CBC, chunk[:self.IV_LENGTH])
+                chunk = chunk[self.IV_LENGTH:]
+            # CBC 模式下同一个 cipher 顺序解密各块，结果与整体解密一致
+            cipher.decrypt(chunk, output=output[offset:offset + len(chunk)])
+            offset += len(chunk)
+        return plain
+
+    @staticmethod
+    def _unpad(plain: bytearray) -> None:
+        """原地去除 PKCS7 填充"""
+        padding_len = plain[-1] if plain else 0
+        if not 1 <= padding_len <= AES.block_size or plain[-padding_len:] != bytes([padding_len]) * padding_len:
+            raise ValueError("Padding is incorrect.")
+        del plain[-padding_len:]
+
+    @classmethod
+    def decoded_size(cls, encrypted_data: str) -> int | None:
+        """
+        计算标准 Base64 字符串解码后的字节数
+
+        Args:
+            encrypted_data: Base64编码的密文
+
+        Returns:
+            解码后的字节数，不是标准 Base64 长度时返回 None
+        """
+        length = len(encrypted_data)
+        if not length or length % 4:
+            return None
+        return length // 4 * 3 - (2 if encrypted_data.endswith('==') else 1 if encrypted_data.endswith('=') else 0)
+
+    @classmethod
+    def is_ciphertext(cls, value: str) -> bool:
+        """
+        预检查字符串是否可能为密文（IV + 至少一个 AES 块），避免对明文做无意义的解密尝试
+
+        Args:
+            value: 待检查字符串
+
+        Returns:
+            是否可能为密文
+        """
+        size = cls.decoded_size(value)
+        return size is not None and size > cls.IV_LENGTH and (size - cls.IV_LENGTH) % AES.block_size == 0
+
+    @staticmethod
+    def _loads(plain: bytearray) -> any:
+        """将明文解析为 JSON，不是 JSON 时返回字符串"""
+        try:
+            return json.loads(plain)
+        except ValueError:
+            return plain.decode('utf-8')
+
     def encrypt_request_body(self, body: any) -> tuple[str, Dict[str, str]]:
         """
         加密请求体
@@ -142,37 +232,39 @@ class EncryptionFilter:
         try:
             # 策略1: 尝试将整个响应体作为加密字符串解密
             # 如果整个响应就是一个包含加密字符串的简单结构
-            if len(response_json) == 1 and isinstance(list(response_json.values())[0], str):
-                encrypted_full_response = list(response_json.values())[0]
-                try:
-                    decrypted_full = self.decrypt(encrypted_full_response)
+            plain_data = None
+            if len(response_json) == 1:
+                key, encrypted_full_response = next(iter(response_json.items()))
+                if isinstance(encrypted_full_response, str) and self.is_ciphertext(encrypted_full_response):
                     try:
-                        # 尝试解析为JSON对象
-                        decrypted_json = json.loads(decrypted_full)
-                        logger.info("✓ 整个响应体解密成功，解析为JSON对象")
-                        return decrypted_json
-                    except json.JSONDecodeError:
-                        # 不是JSON，返回原始响应
+                        decrypted = self._loads(self.decrypt_bytes(encrypted_full_response))
+                    except Exception as e:
+                        logger.debug(f"整个响应体解密失败，尝试其他策略: {e}")
+                    else:
+                        if not isinstance(decrypted, str):
+                            logger.info("✓ 整个响应体解密成功，解析为JSON对象")
+                            return decrypted
+                        # 不是JSON，若正好是 data 字段则复用解密结果，无需重复解密
                         logger.debug("整个响应体解密后不是JSON，尝试其他策略")
-                except Exception as e:
-                    logger.debug(f"整个响应体解密失败，尝试其他策略: {e}")
+                        if key == "data":
+                            plain_data = decrypted
 
             # 策略2: 检查响应中是否包含加密的data字段
-            if "data" in response_json and isinstance(response_json["data"], str):
+            if plain_data is not None:
+                response_json["data"] = plain_data
+                logger.info("✓ 响应data字段解密成功，保留为字符串")
+            elif "data" in response_json and isinstance(response_json["data"], str):
                 encrypted_data = response_json["data"]
 
                 # 尝试解密data字段
                 try:
-                    decrypted_data = self.decrypt(encrypted_data)
-
-                    # 尝试将解密后的数据解析为JSON
-                    try:
-                        response_json["data"] = json.loads(decrypted_data)
-                        logger.info("✓ 响应data字段解密成功，解析为JSON对象")
-                    except json.JSONDecodeError:
+                    decrypted_data = self._loads(self.decrypt_bytes(encrypted_data))
+                    response_json["data"] = decrypted_data
+                    if isinstance(decrypted_data, str):
                         # 不是JSON，保留为字符串（可能是token等）
-                        response_json["data"] = decrypted_data
                         logger.info("✓ 响应data字段解密成功，保留为字符串")
+                    else:
+                        logger.info("✓ 响应data字段解密成功，解析为JSON对象")
 
                 except Exception as e:
                     logger.warning(f"data字段解密失败，保留原始内容: {e}")
@@ -195,3 +287,17 @@ class EncryptionFilter:
         """
         encrypted_header = headers.get("X-Encrypted", "").lower()
         return encrypted_header == "true"
+
+
+@lru_cache(maxsize=32)
+def get_encryption_filter(encryption_key: Optional[str] = None) -> EncryptionFilter:
+    """
+    获取启用加密的过滤器，按密钥缓存复用，密钥仅校验一次
+
+    Args:
+        encryption_key: 加密密钥（32字节），为空时使用默认密钥
+
+    Returns:
+        加密过滤器
+    """
+    return EncryptionFilter(encryption_enabled=True, encryption_key=encryption_key)
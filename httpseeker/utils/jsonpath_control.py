@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import re
+
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any, Callable
+
+import jsonpath
+
+_SIMPLE_STEP_RE = re.compile(r"\.([A-Za-z_][A-Za-z0-9_]*)|\[(-?\d+)]|\['([^'\\]*)']|\[\"([^\"\\]*)\"]")
+
+_FALLBACK = object()
+
+
+def parse_simple_path(path: str) -> tuple[str | int, ...] | None:
+    """
+    解析简单 jsonpath 表达式, 例如: $.a.b[0], $['a-b'][-1]
+
+    :param path:
+    :return: 取值步骤, 包含过滤器、通配符等复杂语法时返回 None
+    """
+    path = path.strip()
+    if not path.startswith('$'):
+        return None
+    steps: list[str | int] = []
+    pos = 1
+    while pos < len(path):
+        match = _SIMPLE_STEP_RE.match(path, pos)
+        if match is None:
+            return None
+        name, index, single_quoted, double_quoted = match.groups()
+        if index is not None:
+            steps.append(int(index))
+        else:
+            steps.append(next(s for s in (name, single_quoted, double_quoted) if s is not None))
+        pos = match.end()
+    return tuple(steps)
+
+
+def _walk(steps: tuple[str | int, ...], data: Any) -> Any:
+    """按步骤直接遍历 dict(Mapping) / list 取值, 遇到无法确定结果的类型时交由 jsonpath 处理"""
+    for step in steps:
+        if isinstance(step, int):
+            if not isinstance(data, list):
+                return _FALLBACK
+            if not -len(data) <= step < len(data):
+                return None
+            data = data[step]
+        else:
+            if not isinstance(data, (dict, Mapping)):
+                return _FALLBACK
+            if step not in data:
+                return None
+            data = data[step]
+    return [data]
+
+
+@lru_cache(maxsize=1024)
+def compile_jsonpath(path: str) -> Callable[[Any], list]:
+    """
+    编译 jsonpath 表达式, 编译结果以 LRU 缓存
+
+    :param path:
+    :return: 取值函数, 参数为取值对象, 返回匹配结果列表
+    """
+    steps = parse_simple_path(path)
+    compiled = jsonpath.compile(path)
+    if steps is None:
+        return compiled.findall
+
+    def _findall(data: Any) -> list:
+        result = _walk(steps, data)
+        if result is _FALLBACK:
+            return compiled.findall(data)
+        return result or []
+
+    return _findall
+
+
+def findall(path: str, data: Any) -> list:
+    """
+    jsonpath 取值, 与 jsonpath.findall 结果一致
+
+    简单路径直接遍历 dict / list, 过滤器、通配符等复杂语法使用 jsonpath 引擎
+
+    :param path: jsonpath 表达式
+    :param data: 取值对象
+    :return:
+    """
+    return compile_jsonpath(path)(data)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import threading
+
+from collections import deque
+from typing import Any
+
+from httpseeker.common.log import Logger, log
+from httpseeker.core.get_conf import httpseeker_config
+
+# 静默模式下每个线程最多缓存的详情日志条数
+_QUIET_BUFFER_SIZE = 1000
+
+
+class LogField:
+    """日志字段, 仅在日志实际输出时才转换为字符串, 并按 max_field_length 截断"""
+
+    __slots__ = ('value',)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __str__(self) -> str:
+        limit = httpseeker_config.LOG_MAX_FIELD_LENGTH
+        value = self.value
+        if limit and isinstance(value, (str, bytes)) and len(value) > limit:
+            # 字符串先截断再转换, 避免复制完整内容
+            return f'{value[:limit]!s}...(已截断, 共 {len(value)} 字符)'
+        text = str(value)
+        if limit and len(text) > limit:
+            return f'{text[:limit]}...(已截断, 共 {len(text)} 字符)'
+        return text
+
+    def __format__(self, format_spec: str) -> str:
+        return format(str(self), format_spec)
+
+
+class DetailLogger:
+    """
+    详情日志
+
+    请求 / 响应等详情通过 {} 占位符传入, 日志级别未开启时不格式化; 静默模式下详情缓存在当前线程中,
+    用例失败时由 flush 输出, 用例通过时由 discard 丢弃
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+
+    def _buffer(self) -> deque:
+        buffer = getattr(self._local, 'buffer', None)
+        if buffer is None:
+            buffer = self._local.buffer = deque(maxlen=_QUIET_BUFFER_SIZE)
+        return buffer
+
+    def _log(self, level: str, message: str, values: tuple) -> None:
+        fields = tuple(LogField(value) for value in values)
+        if httpseeker_config.LOG_QUIET:
+            self._buffer().append((level, message, fields))
+        else:
+            log.opt(depth=2).log(level, message, *fields)
+
+    def debug(self, message: str, *values: Any) -> None:
+        self._log('DEBUG', message, values)
+
+    def info(self, message: str, *values: Any) -> None:
+        self._log('INFO', message, values)
+
+    def error(self, message: str, *values: Any) -> None:
+        self._log('ERROR', message, values)
+
+    def flush(self) -> None:
+        """输出当前线程缓存的详情日志"""
+        buffer = self._buffer()
+        if not buffer:
+            return
+        log.warning(f'<用例详情> 共 {len(buffer)} 条')
+        while buffer:
+            level, message, fields = buffer.popleft()
+            log.log(level, message, *fields)
+
+    def discard(self) -> None:
+        """丢弃当前线程缓存的详情日志"""
+        self._buffer().clear()
+
+
+def configure_log() -> None:
+    """按配置重新添加日志处理器"""
+    Logger.add_handlers(level=httpseeker_config.LOG_LEVEL, enqueue=httpseeker_config.LOG_ENQUEUE)
+
+
+detail_log = DetailLogger()
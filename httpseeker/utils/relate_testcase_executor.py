@@ -2,17 +2,14 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
-import ast
-import json
-
-from jsonpath import findall
-
 from httpseeker.common.errors import CorrelateTestCaseError, JsonPathFindError
 from httpseeker.common.log import log
+from httpseeker.common.relate_cache import relate_cache
 from httpseeker.common.variable_cache import variable_cache
-from httpseeker.db.redis import redis_client
 from httpseeker.enums.setup_type import SetupType
 from httpseeker.utils.allure_control import allure_step
+from httpseeker.utils.case_registry import case_registry
+from httpseeker.utils.jsonpath_control import findall
 from httpseeker.utils.request.vars_extractor import var_extractor
 
 
@@ -35,85 +32,35 @@ def exec_setup_testcase(parsed_data: dict, setup_testcase: str | dict) -> dict |
             raise CorrelateTestCaseError(error_text)
 
     # 判断关联测试用例是否存在
-    all_case_id = ast.literal_eval(redis_client.get(f'{redis_client.prefix}:case_id_list'))
-    error_text = '执行关联测试用例失败，未在测试用例中找到关联测试用例，请检查关联测试用例 case_id 是否存在'
-    if isinstance(setup_testcase, dict):
-        if setup_testcase['case_id'] not in all_case_id:
-            raise CorrelateTestCaseError(error_text)
-    elif isinstance(setup_testcase, str):
-        if setup_testcase not in all_case_id:
-            raise CorrelateTestCaseError(error_text)
+    relate_case_id = setup_testcase['case_id'] if isinstance(setup_testcase, dict) else setup_testcase
+    if relate_case_id not in case_registry:
+        raise CorrelateTestCaseError(
+            '执行关联测试用例失败，未在测试用例中找到关联测试用例，请检查关联测试用例 case_id 是否存在'
+        )
+    case_data, relate_case_steps = case_registry.get_case(relate_case_id)
+    is_circular_relate(parsed_case_id, relate_case_steps)
+    case_data['test_steps'] = relate_case_steps
 
     # 执行关联测试用例
     relate_count = 0
     # 用例中 testcase 参数为更新请求数据或提取变量时
     if isinstance(setup_testcase, dict):
         relate_count += 1
-        relate_case_id = setup_testcase['case_id']
-        relate_case_filename = redis_client.get(f'{redis_client.case_id_file_prefix}:{relate_case_id}')
-        case_data = redis_client.get(f'{redis_client.case_data_prefix}:{relate_case_filename}')
-        case_data = json.loads(case_data)
-        case_data_test_steps = case_data['test_steps']
-        if isinstance(case_data_test_steps, list):
-            for case_test_steps in case_data_test_steps:
-                if relate_case_id == case_test_steps['case_id']:
-                    relate_case_steps = case_test_steps
-                    is_circular_relate(parsed_case_id, relate_case_steps)
-                    if setup_testcase.get('request') is not None:
-                        testcase_data = {
-                            'test_steps': relate_case_steps,
-                            'update_request_data': setup_testcase['request'],
-                        }
-                        case_data.update(testcase_data)
-                        response = relate_testcase_exec_with_new_request_data(case_data)
-                        # 使用更新请求数据后的请求响应提取变量
-                        if setup_testcase.get('response') is not None:
-                            testcase_data = {
-                                'set_var_response': setup_testcase['response'],
-                            }
-                            relate_testcase_extract_with_response(testcase_data, response)
-                    else:
-                        if setup_testcase.get('response') is not None:
-                            testcase_data = {
-                                'test_steps': relate_case_steps,
-                                'set_var_response': setup_testcase['response'],
-                            }
-                            case_data.update(testcase_data)
-                            relate_testcase_extract(case_data)
+        if setup_testcase.get('request') is not None:
+            case_data.update({'update_request_data': setup_testcase['request']})
+            response = relate_testcase_exec_with_new_request_data(case_data)
+            # 使用更新请求数据后的请求响应提取变量
+            if setup_testcase.get('response') is not None:
+                testcase_data = {'set_var_response': setup_testcase['response']}
+                relate_testcase_extract_with_response(testcase_data, response)
         else:
-            relate_case_steps = case_data_test_steps
-            is_circular_relate(parsed_case_id, relate_case_steps)
-            if setup_testcase.get('request') is not None:
-                testcase_data = {'update_request_data': setup_testcase['request']}
-                case_data.update(testcase_data)
-                response = relate_testcase_exec_with_new_request_data(case_data)
-                if setup_testcase.get('response') is not None:
-                    testcase_data = {'set_var_response': setup_testcase['response']}
-                    relate_testcase_extract_with_response(testcase_data, response)
-            else:
-                if setup_testcase.get('response') is not None:
-                    testcase_data = {'set_var_response': setup_testcase['response']}
-                    case_data.update(testcase_data)
-                    relate_testcase_extract(case_data)
+            if setup_testcase.get('response') is not None:
+                case_data.update({'set_var_response': setup_testcase['response']})
+                relate_testcase_extract(case_data)
 
     # 用例中 testcase 参数为直接关联测试用例时
     elif isinstance(setup_testcase, str):
-        relate_case_filename = redis_client.get(f'{redis_client.case_id_file_prefix}:{setup_testcase}')
-        case_data = redis_client.get(f'{redis_client.case_data_prefix}:{relate_case_filename}')
-        case_data = json.loads(case_data)
-        case_data_test_steps = case_data['test_steps']
-        if isinstance(case_data_test_steps, list):
-            for case_test_steps in case_data_test_steps:
-                if setup_testcase == case_test_steps['case_id']:
-                    relate_case_steps = case_test_steps
-                    is_circular_relate(parsed_case_id, relate_case_steps)
-                    new_data = {'test_steps': relate_case_steps}
-                    case_data.update(new_data)
-                    relate_testcase_exec(case_data)
-        else:
-            relate_case_steps = case_data_test_steps
-            is_circular_relate(parsed_case_id, relate_case_steps)
-            relate_testcase_exec(case_data)
+        relate_testcase_exec(case_data)
 
     if relate_count > 0:
         # 应用关联测试用例变量到请求数据，使用模糊匹配，可能有解析速度优化效果
@@ -160,10 +107,16 @@ def relate_testcase_extract(testcase_data: dict) -> None:
     """
     from httpseeker.common.send_request import send_request
 
-    msg = f'>>> 执行关联测试用例变量提取：{testcase_data["test_steps"]["case_id"]}'
+    case_id = testcase_data['test_steps']['case_id']
+    msg = f'>>> 执行关联测试用例变量提取：{case_id}'
     log.info(msg)
     allure_step(msg, '此文件为空')
-    response = send_request.send_request(testcase_data, log_data=False, relate_log=True)
+    cacheable = relate_cache.is_cacheable(testcase_data['test_steps'])
+    response = relate_cache.get(case_id) if cacheable else None
+    if response is None:
+        response = send_request.send_request(testcase_data, log_data=False, relate_log=True)
+        if cacheable:
+            relate_cache.set(case_id, response)
     relate_testcase_extract_with_response(testcase_data, response)
     log.info('<<< 关联测试用例变量提取执行完成')
 
@@ -193,9 +146,15 @@ def relate_testcase_exec_with_new_request_data(testcase_data: dict) -> dict:
     """
     from httpseeker.common.send_request import send_request
 
-    msg = f'>>> 执行关联测试用例（使用新请求数据）：{testcase_data["test_steps"]["case_id"]}'
+    case_id = testcase_data['test_steps']['case_id']
+    msg = f'>>> 执行关联测试用例（使用新请求数据）：{case_id}'
     log.info(msg)
     allure_step(msg, '此文件为空')
+    cacheable = relate_cache.is_cacheable(testcase_data['test_steps'])
+    response = relate_cache.get(case_id, testcase_data['update_request_data']) if cacheable else None
+    if response is not None:
+        log.info('<<< 关联测试用例（使用新请求数据）执行完成')
+        return response
     for u in testcase_data['update_request_data']:
         keys = u['jsonpath'].split('.')[1:]
         new_request_data = {}
@@ -207,6 +166,8 @@ def relate_testcase_exec_with_new_request_data(testcase_data: dict) -> dict:
         testcase_data['test_steps']['request'].update(new_request_data)
         log.info(f'更新关联测试用例请求数据：{new_request_data}')
     response = send_request.send_request(testcase_data, log_data=False, relate_log=True)
+    if cacheable:
+        relate_cache.set(case_id, response, testcase_data['update_request_data'])
     log.info('<<< 关联测试用例（使用新请求数据）执行完成')
     return response
 
@@ -220,8 +181,13 @@ def relate_testcase_exec(testcase_data: dict) -> None:
     """
     from httpseeker.common.send_request import send_request
 
-    msg = f'>>> 执行关联测试用例：{testcase_data["test_steps"]["case_id"]}'
+    case_id = testcase_data['test_steps']['case_id']
+    msg = f'>>> 执行关联测试用例：{case_id}'
     log.info(msg)
     allure_step(msg, '此文件为空')
-    send_request.send_request(testcase_data, log_data=False, relate_log=True)
+    if not relate_cache.is_cacheable(testcase_data['test_steps']):
+        send_request.send_request(testcase_data, log_data=False, relate_log=True)
+    elif relate_cache.get(case_id) is None:
+        response = send_request.send_request(testcase_data, log_data=False, relate_log=True)
+        relate_cache.set(case_id, response)
     log.info('<<< 关联测试用例执行完成')
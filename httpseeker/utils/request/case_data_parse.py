@@ -13,13 +13,11 @@ import pytest
 from pydantic import ValidationError
 
 from httpseeker.common.errors import RequestDataParseError
-from httpseeker.common.json_handler import read_json_file
 from httpseeker.common.log import log
-from httpseeker.common.yaml_handler import read_yaml
 from httpseeker.db.redis import redis_client
-from httpseeker.enums.case_data_type import CaseDataType
 from httpseeker.schemas.case_data import CaseCacheData
-from httpseeker.utils.file_control import get_file_hash, get_file_property, search_all_case_data_files
+from httpseeker.utils.case_loader import case_loader
+from httpseeker.utils.case_registry import case_registry
 from httpseeker.utils.pydantic_parser import parse_error
 from httpseeker.utils.request.ids_extract import get_ids
 
@@ -43,6 +41,7 @@ def clean_cache_data(clean_cache: bool) -> None:
     """
     if clean_cache:
         redis_client.delete_prefix(redis_client.prefix, exclude=redis_client.token_prefix)
+        case_loader.clear()
 
 
 def case_data_init(pydantic_verify: bool) -> None:
@@ -52,25 +51,16 @@ def case_data_init(pydantic_verify: bool) -> None:
     :param pydantic_verify:
     :return:
     """
-    all_case_data_files = search_all_case_data_files()
-    for case_data_file in all_case_data_files:
-        file_type = get_file_property(case_data_file)[2]
-        if file_type == CaseDataType.JSON:
-            case_data = read_json_file(case_data_file)
-        else:
-            case_data = read_yaml(case_data_file)
-        filename = get_file_property(case_data_file)[0]
-        file_hash = get_file_hash(case_data_file)
-        case_data.update({'filename': filename, 'file_hash': file_hash})
-        redis_case_data = redis_client.get(f'{redis_client.case_data_prefix}:{filename}', logging=False)
-        if redis_case_data is None:
-            redis_client.set(f'{redis_client.case_data_prefix}:{filename}', json.dumps(case_data, ensure_ascii=False, cls=DateTimeEncoder))
-        else:
-            redis_file_hash = json.loads(redis_case_data).get('file_hash')
-            if file_hash != redis_file_hash:
-                redis_client.rset(
-                    f'{redis_client.case_data_prefix}:{filename}', json.dumps(case_data, ensure_ascii=False, cls=DateTimeEncoder)
-                )
+    all_case_data = {
+        f'{redis_client.case_data_prefix}:{case_data["filename"]}': case_data for case_data in case_loader.load()
+    }
+    keys = list(all_case_data)
+    changed_case_data = {}
+    for key, redis_case_data in zip(keys, redis_client.mget(keys)):
+        case_data = all_case_data[key]
+        if redis_case_data is None or json.loads(redis_case_data).get('file_hash') != case_data['file_hash']:
+            changed_case_data[key] = json.dumps(case_data, ensure_ascii=False, cls=DateTimeEncoder)
+    redis_client.mset(changed_case_data)
     if pydantic_verify:
         case_data_list = redis_client.get_prefix(f'{redis_client.case_data_prefix}:')
         count: int = 0
@@ -90,29 +80,29 @@ def case_id_unique_verify() -> None:
     :return:
     """
     all_case_id_dict: list[dict[str, str | list[str]]] = []
-    all_case_id = []
     case_id_count = defaultdict(int)
-    case_data_list = redis_client.get_prefix(f'{redis_client.case_data_prefix}:')
-    redis_client.delete_prefix(f'{redis_client.case_id_file_prefix}:')
+    # redis 未启用时使用本地用例数据
+    if redis_client.is_enabled:
+        case_data_list = [json.loads(c) for c in redis_client.get_prefix(f'{redis_client.case_data_prefix}:')]
+    else:
+        case_data_list = case_loader.load()
+    case_index: dict[str, tuple[str, int | None]] = {}
 
     for case_data in case_data_list:
-        case_data = json.loads(case_data)
         filename = case_data['filename']
         try:
             steps = case_data['test_steps']
             if isinstance(steps, dict):
                 case_id = steps['case_id']
-                all_case_id.append(case_id)
                 all_case_id_dict.append({filename: [case_id]})
                 case_id_count[case_id] += 1
-                redis_client.set(f'{redis_client.case_id_file_prefix}:{case_id}', filename)
+                case_index[case_id] = (filename, None)
             if isinstance(steps, list):
                 case_id_list = [s['case_id'] for s in steps]
-                all_case_id.extend(case_id_list)
                 all_case_id_dict.append({filename: case_id_list})
-                for case_id in case_id_list:
+                for i, case_id in enumerate(case_id_list):
                     case_id_count[case_id] += 1
-                    redis_client.set(f'{redis_client.case_id_file_prefix}:{case_id}', filename)
+                    case_index[case_id] = (filename, i)
         except KeyError:
             raise RequestDataParseError(f'测试用例数据文件 {filename} 结构错误，建议开启 pydantic 验证')
 
@@ -133,7 +123,7 @@ def case_id_unique_verify() -> None:
         sys.exit(1)
     else:
         redis_client.delete(f'{redis_client.prefix}:case_id:repeated')
-        redis_client.rset(f'{redis_client.prefix}:case_id_list', str(all_case_id))
+        case_registry.register(case_index)
 
 
 def _load_case_data_from_file(filename: str) -> dict:
@@ -143,15 +133,7 @@ def _load_case_data_from_file(filename: str) -> dict:
     :param filename: 文件名
     :return: 测试用例数据
     """
-    all_case_data_files = search_all_case_data_files()
-    for case_data_file in all_case_data_files:
-        if case_data_file.endswith(filename):
-            file_type = get_file_property(case_data_file)[2]
-            if file_type == CaseDataType.JSON:
-                return read_json_file(case_data_file)
-            else:
-                return read_yaml(case_data_file)
-    raise RequestDataParseError(f'未找到测试用例文件: {filename}')
+    return case_loader.get_case_data(filename)
 
 
 def get_testcase_data(*, filename: str) -> tuple[list, list]:
@@ -193,7 +175,7 @@ def get_testcase_data(*, filename: str) -> tuple[list, list]:
         marked_ddt_data_list = []
         for case in steps:
             if isinstance(case, dict):
-                _case_data = {'config': config, 'test_steps': case}
+                _case_data = {'config': config, 'test_steps': case, 'file_hash': case_data.get('file_hash')}
                 _ddt_data_list.append(_case_data)
                 mark = get_testcase_mark(_case_data)
                 if mark is not None:
@@ -2,14 +2,16 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
-import json
 import re
 
+from functools import lru_cache
 from typing import Any
 
 from httpseeker.common.log import log
 from httpseeker.enums.setup_type import SetupType
 from httpseeker.enums.teardown_type import TeardownType
+from httpseeker.utils.request.hook_registry import hook_registry
+from httpseeker.utils.request.template_engine import TemplateEngine
 
 
 class HookExecutor:
@@ -17,8 +19,11 @@ class HookExecutor:
         # hook 开头: a-zA-Z_
         # hook 表达: ${func()} 或 ${func(1, 2)}
         self.func_re = re.compile(r'\${([a-zA-Z_]\w*\([$\w.\-/\s=,]*\))}')
+        self.func_engine = TemplateEngine(self.func_re)
 
-    def _quote_string_args(self, func_call: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _quote_string_args(func_call: str) -> str:
         """
         将函数调用中的未加引号的字符串参数自动加上引号
         例如: get_google_auth_code(action) -> get_google_auth_code("action")
@@ -66,6 +71,18 @@ class HookExecutor:
 
         return f'{func_name}({", ".join(quoted_args)})'
 
+    @staticmethod
+    def _exclude_hooks(path: tuple, value: Any) -> bool:
+        # 数据排除: 前后置 hook 及 wait_until 轮询 hook 由请求前后置处理单独执行
+        if not (len(path) == 3 and path[0] == 'test_steps' and path[1] in ('setup', 'teardown')):
+            return False
+        if not isinstance(value, dict):
+            return False
+        wait_until = value.get(SetupType.WAIT_UNTIL)
+        return value.get(SetupType.HOOK if path[1] == 'setup' else TeardownType.HOOK) is not None or (
+            isinstance(wait_until, dict) and wait_until.get('hook') is not None
+        )
+
     def hook_func_value_replace(self, target: dict) -> Any:
         """
         执行除前后置 hook 以外的所有 hook 函数并替换为它的返回值
@@ -73,81 +90,44 @@ class HookExecutor:
         :param target:
         :return:
         """
-        # 数据排除
-        setup = target['test_steps'].get('setup')
-        teardown = target['test_steps'].get('teardown')
-        setup_hooks_with_index = []
-        teardown_hooks_with_index = []
-        if setup:
-            setup_hooks_with_index.extend(
-                [(i, item) for i, item in enumerate(setup) if item.get(SetupType.HOOK) is not None]
-            )
-            if setup_hooks_with_index:
-                target['test_steps']['setup'] = [
-                    item for item in target['test_steps']['setup'] if item.get(SetupType.HOOK) is None
-                ]
-        if teardown:
-            teardown_hooks_with_index.extend(
-                [(i, item) for i, item in enumerate(teardown) if item.get(TeardownType.HOOK) is not None]
-            )
-            if teardown_hooks_with_index:
-                target['test_steps']['teardown'] = [
-                    item for item in target['test_steps']['teardown'] if item.get(TeardownType.HOOK) is None
-                ]
-
-        str_target = json.dumps(target, ensure_ascii=False)
-
-        match = self.func_re.search(str_target)
-        if not match:
+        # 更新请求数据的关联测试用例结构可能变化, 不缓存替换位点
+        cache_key = None
+        if target.get('update_request_data') is None:
+            try:
+                cache_key = target['test_steps']['case_id']
+            except (KeyError, TypeError):
+                cache_key = None
+
+        if not self.func_engine.has_slots(target, self._exclude_hooks, cache_key):
             return target
 
         # hook 返回值替换
-        # 创建命名空间字典，用于存储导入的函数
-        hook_namespace = {}
-        exec('from httpseeker.core.hooks import *', hook_namespace)
-        for match in self.func_re.finditer(str_target):
+        def repl(match: re.Match) -> str:
             hook_key = match.group(1)
-            # 自动为未加引号的字符串参数添加引号
-            quoted_hook_key = self._quote_string_args(hook_key)
             try:
-                # 使用相同的命名空间执行函数调用
-                exec(f'result = {quoted_hook_key}', hook_namespace)
-                value = str(hook_namespace['result'])
-                str_target = self.func_re.sub(value, str_target, 1)
+                # 自动为未加引号的字符串参数添加引号
+                value = str(hook_registry.call(self._quote_string_args(hook_key)))
                 log.info(f'请求数据函数 {hook_key} 返回值替换完成')
             except Exception as e:
                 log.error(f'请求数据函数 {hook_key} 返回值替换失败: {e}')
                 raise e
+            return value
 
-        dict_target = json.loads(str_target)
-
-        # 数据还原
-        if setup:
-            if setup_hooks_with_index:
-                for i, item in setup_hooks_with_index:
-                    target['test_steps']['setup'].insert(i, item)
-        if teardown:
-            if teardown_hooks_with_index:
-                for i, item in teardown_hooks_with_index:
-                    target['test_steps']['teardown'].insert(i, item)
+        return self.func_engine.render(target, repl, exclude=self._exclude_hooks, cache_key=cache_key)
 
-        return dict_target
-
-    def exec_hook_func(self, hook_var: str) -> None:
+    def exec_hook_func(self, hook_var: str) -> Any:
         """
-        执行 hook 函数不返回任何值
+        执行 hook 函数
 
         :param hook_var:
-        :return:
+        :return: hook 函数返回值
         """
         key = self.func_re.search(hook_var)
         func = key.group(1)
         # 自动为未加引号的字符串参数添加引号
         quoted_func = self._quote_string_args(func)
-        hook_namespace = {}
-        exec('from httpseeker.core.hooks import *', hook_namespace)
         log.info(f'执行 hook：{func}')
-        exec(quoted_func, hook_namespace)
+        return hook_registry.call(quoted_func)
 
     @staticmethod
     def exec_any_code(code: str) -> bool:
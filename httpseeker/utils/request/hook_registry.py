@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import ast
+import importlib
+import threading
+
+from typing import Any, Callable
+
+
+class HookRegistry:
+    """
+    hook 函数注册表
+
+    首次使用时导入一次 hook 模块并索引其中的可调用对象, 每个 hook 表达式仅编译一次:
+    参数均为常量时直接绑定函数及参数, 其他表达式编译为代码对象后在 hook 命名空间中执行
+    """
+
+    def __init__(self, module: str = 'httpseeker.core.hooks', maxsize: int = 4096) -> None:
+        """
+        :param module: hook 模块
+        :param maxsize: hook 表达式编译缓存最大数量
+        """
+        self.module = module
+        self.maxsize = maxsize
+        self._namespace: dict[str, Any] | None = None
+        self._plans: dict[str, Callable[[], Any]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def namespace(self) -> dict[str, Any]:
+        """hook 命名空间, 等同于 from httpseeker.core.hooks import *"""
+        if self._namespace is None:
+            with self._lock:
+                if self._namespace is None:
+                    module = importlib.import_module(self.module)
+                    names = getattr(module, '__all__', None) or [n for n in dir(module) if not n.startswith('_')]
+                    self._namespace = {name: getattr(module, name) for name in names}
+        return self._namespace
+
+    def _compile(self, expression: str) -> Callable[[], Any]:
+        namespace = self.namespace
+        node = ast.parse(expression, mode='eval').body
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and callable(namespace.get(node.func.id))
+            and all(self._is_constant(arg) for arg in node.args)
+            and all(kw.arg is not None and self._is_constant(kw.value) for kw in node.keywords)
+        ):
+            func = namespace[node.func.id]
+            args = tuple(ast.literal_eval(arg) for arg in node.args)
+            kwargs = {kw.arg: ast.literal_eval(kw.value) for kw in node.keywords}
+            return lambda: func(*args, **kwargs)
+        code = compile(expression, '<hook>', 'eval')
+        return lambda: eval(code, namespace)
+
+    @staticmethod
+    def _is_constant(node: ast.expr) -> bool:
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+            node = node.operand
+        return isinstance(node, ast.Constant)
+
+    def call(self, expression: str) -> Any:
+        """
+        执行 hook 表达式
+
+        :param expression: hook 表达式, 例如: func(1, "a")
+        :return: hook 返回值
+        """
+        plan = self._plans.get(expression)
+        if plan is None:
+            plan = self._compile(expression)
+            if len(self._plans) >= self.maxsize:
+                self._plans.pop(next(iter(self._plans)))
+            self._plans[expression] = plan
+        return plan()
+
+    def clear(self) -> None:
+        """清空缓存, 下次使用时重新加载 hook 模块"""
+        with self._lock:
+            self._namespace = None
+            self._plans.clear()
+
+
+hook_registry = HookRegistry()
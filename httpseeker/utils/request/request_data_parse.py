@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import os
 
+from dataclasses import dataclass, fields
 from json import dumps as json_dumps
 from string import Template
+from typing import Any
 
 import allure
 
@@ -21,7 +23,7 @@ from httpseeker.core.get_conf import httpseeker_config
 from httpseeker.core.path_conf import httpseeker_path
 from httpseeker.db.mysql import mysql_client
 from httpseeker.enums.allure_severity_type import SeverityType
-from httpseeker.enums.request.auth import AuthType
+from httpseeker.enums.assert_type import AssertType
 from httpseeker.enums.request.body import BodyType
 from httpseeker.enums.request.engin import EnginType
 from httpseeker.enums.request.method import MethodType
@@ -31,23 +33,172 @@ from httpseeker.utils.auth_plugins import auth
 from httpseeker.utils.enum_control import get_enum_values
 from httpseeker.utils.request.hook_executor import hook_executor
 from httpseeker.utils.request.vars_extractor import var_extractor
+from httpseeker.utils.request.wait_until import WAIT_UNTIL_DEFAULTS, WAIT_UNTIL_SOURCES
 
 _RequestDataParamGetError = (KeyError, TypeError)
 
+_MISSING = object()
+
 
 def _error_msg(info: str) -> str:
     msg_template = Template('测试用例数据解析失败, $info')
     return msg_template.substitute(info=info)
 
 
+@dataclass(frozen=True, slots=True)
+class ParsedCase:
+    """
+    用例静态解析结果
+
+    由原始用例数据（hook 替换前）一次性校验编译, 同一用例重复执行时复用, 仅 hook、变量、认证等动态部分每次处理
+    """
+
+    allure_epic: str
+    allure_feature: str
+    allure_story: str
+    allure_severity: str | None
+    env: str
+    timeout: int | None
+    verify: bool | str | None
+    redirects: bool | None
+    proxies: dict | None
+    retry: int | None
+    encryption_enabled: bool | None
+    encryption_key: str | None
+    module: str
+    name: str
+    case_id: str
+    description: str | None
+    method: str
+    url_path: str
+    params: dict | bytes | None
+    headers_no_auth: dict | None
+    cookies_no_auth: dict | None
+    body_type: str | None
+    body: dict | bytes | str | None
+    files_no_parse: dict | None
+    is_setup: bool
+    setup: list | None
+    is_teardown: bool
+    teardown: list | None
+
+
+# 静态字段依赖的原始数据路径, hook 替换后路径上的数据未变化（同一对象）时, 直接使用编译结果
+_STATIC_FIELD_PATHS: dict[str, tuple[tuple[str, ...], ...]] = {
+    'allure_epic': (('config', 'allure', 'epic'),),
+    'allure_feature': (('config', 'allure', 'feature'),),
+    'allure_story': (('config', 'allure', 'story'),),
+    'allure_severity': (('config', 'allure', 'severity'),),
+    'env': (('config', 'request', 'env'),),
+    'timeout': (),
+    'verify': (),
+    'redirects': (),
+    'proxies': (('config', 'request', 'proxies'),),
+    'retry': (),
+    'encryption_enabled': (),
+    'encryption_key': (('config', 'request', 'encryption_key'),),
+    'module': (('config', 'module'),),
+    'name': (('test_steps', 'name'),),
+    'case_id': (('test_steps', 'case_id'),),
+    'description': (('test_steps', 'description'),),
+    'method': (('test_steps', 'request', 'method'),),
+    'url_path': (('test_steps', 'request', 'url'),),
+    'params': (('test_steps', 'request', 'params'),),
+    'headers_no_auth': (('test_steps', 'request', 'headers'), ('config', 'request', 'headers')),
+    'cookies_no_auth': (('test_steps', 'request', 'cookies'),),
+    'body_type': (('test_steps', 'request', 'body_type'),),
+    'body': (('test_steps', 'request', 'body'), ('test_steps', 'request', 'body_type')),
+    'files_no_parse': (('test_steps', 'request', 'files'),),
+    'is_setup': (('test_steps', 'setup'),),
+    'setup': (('test_steps', 'setup'),),
+    'is_teardown': (('test_steps', 'teardown'),),
+    'teardown': (('test_steps', 'teardown'),),
+}
+
+# 用例静态解析结果缓存, key: (用例数据文件哈希, case_id, 请求引擎), value: 解析结果
+_parsed_case_cache: dict[tuple[str, str, str], ParsedCase] = {}
+
+
+def _lookup(data: Any, path: tuple[str, ...]) -> Any:
+    try:
+        for key in path:
+            data = data[key]
+    except _RequestDataParamGetError:
+        return _MISSING
+    return data
+
+
+def _copy_value(value: Any) -> Any:
+    """复制编译结果中的 dict / list, 避免执行时修改共享的编译结果"""
+    if isinstance(value, dict):
+        return {k: _copy_value(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_value(v) for v in value]
+    return value
+
+
 class RequestDataParse:
     def __init__(self, request_data: dict, request_engin: str):
         self.config_check(request_data)
         self.test_steps_check(request_data)
+        self.raw_request_data = request_data
         self.request_data = hook_executor.hook_func_value_replace(request_data)
         self.request_engin = request_engin
+        self.parsed_case = self._get_parsed_case()
         self._is_run()  # put bottom
 
+    @classmethod
+    def compile_case(cls, request_data: dict, request_engin: str) -> ParsedCase | None:
+        """
+        编译用例静态解析结果, 校验失败时返回 None, 由执行时解析抛出具体错误
+
+        :param request_data: 原始用例数据
+        :param request_engin:
+        :return:
+        """
+        parser = cls.__new__(cls)
+        parser.request_data = request_data
+        parser.request_engin = request_engin
+        try:
+            return ParsedCase(**{f.name: getattr(parser, f.name) for f in fields(ParsedCase)})
+        except Exception:
+            return None
+
+    def _get_parsed_case(self) -> ParsedCase | None:
+        # 更新请求数据的关联测试用例, 数据与缓存不一致, 不使用编译结果
+        if self.raw_request_data.get('update_request_data') is not None:
+            return None
+        # 用例数据文件内容不变时编译结果不变, 无文件哈希的用例数据不使用编译结果
+        file_hash = self.raw_request_data.get('file_hash')
+        case_id = _lookup(self.raw_request_data, ('test_steps', 'case_id'))
+        if not isinstance(file_hash, str) or not isinstance(case_id, str):
+            return None
+        key = (file_hash, case_id, self.request_engin)
+        parsed_case = _parsed_case_cache.get(key)
+        if parsed_case is None:
+            parsed_case = self.compile_case(self.raw_request_data, self.request_engin)
+            if parsed_case is not None:
+                _parsed_case_cache[key] = parsed_case
+        return parsed_case
+
+    def _static(self, name: str) -> Any:
+        """
+        获取静态字段解析结果, 编译结果可用时返回其副本, 否则解析当前数据
+
+        :param name:
+        :return:
+        """
+        parsed_case = self.parsed_case
+        if parsed_case is None:
+            return getattr(self, name)
+        # 二进制请求体需每次读取文件
+        if name == 'body' and parsed_case.body_type == BodyType.binary:
+            return self.body
+        for path in _STATIC_FIELD_PATHS[name]:
+            if _lookup(self.request_data, path) is not _lookup(self.raw_request_data, path):
+                return getattr(self, name)
+        return _copy_value(getattr(parsed_case, name))
+
     @staticmethod
     def config_check(request_data: dict) -> dict:
         try:
@@ -185,7 +336,7 @@ class RequestDataParse:
                             )
                 if self.request_engin == EnginType.requests:
                     proxies = proxies
-                elif self.request_engin == EnginType.httpx:
+                elif self.request_engin in (EnginType.httpx, EnginType.httpx_pool, EnginType.httpx_async):
                     proxies = {'http://': proxies['http'], 'https://': proxies['https']}
         except _RequestDataParamGetError:
             proxies = None
@@ -383,24 +534,30 @@ class RequestDataParse:
             return method.upper()
 
     @property
-    def url(self) -> str:
+    def url_path(self) -> str:
         try:
             url = self.request_data['test_steps']['request']['url']
         except _RequestDataParamGetError:
             raise RequestDataParseError(_error_msg('缺少 test_steps:request:url 参数'))
-        else:
-            if not url.startswith('http'):
-                _env = self.env
-                try:
-                    env_file = os.path.join(httpseeker_path.run_env_dir, _env)
-                    env_dict = get_env_dict(env_file)
-                except Exception as e:
-                    raise RequestDataParseError(f'环境变量 {_env} 读取失败: {e}')
-                host = env_dict.get('host') or env_dict.get('HOST')
-                if host is None:
-                    raise RequestDataParseError(f'环境变量 {env_file} 读取失败, 缺少 HOST 参数')
-                url = host + url
-            return url
+        return url
+
+    @property
+    def url(self) -> str:
+        return self._join_host(self.url_path, self.env)
+
+    @staticmethod
+    def _join_host(url: str, env: str) -> str:
+        if not url.startswith('http'):
+            try:
+                env_file = os.path.join(httpseeker_path.run_env_dir, env)
+                env_dict = get_env_dict(env_file)
+            except Exception as e:
+                raise RequestDataParseError(f'环境变量 {env} 读取失败: {e}')
+            host = env_dict.get('host') or env_dict.get('HOST')
+            if host is None:
+                raise RequestDataParseError(f'环境变量 {env_file} 读取失败, 缺少 HOST 参数')
+            url = host + url
+        return url
 
     @property
     def params(self) -> dict | bytes | None:
@@ -415,7 +572,7 @@ class RequestDataParse:
         return params
 
     @property
-    def headers(self) -> dict | None:
+    def headers_no_auth(self) -> dict | None:
         try:
             headers = self.request_data['test_steps']['request']['headers']
         except _RequestDataParamGetError:
@@ -434,24 +591,18 @@ class RequestDataParse:
             if headers is not None:
                 if len(headers) == 0:
                     raise RequestDataParseError(_error_msg('参数 test_steps:request:headers 为空'))
-            if auth.is_auth:
-                bearer_token = None
-                if auth.auth_type == AuthType.TOKEN:
-                    bearer_token = {'Authorization': f'Bearer {auth.bearer_token}'}
-                elif auth.auth_type == AuthType.TOKEN_CUSTOM:
-                    bearer_token = {'Authorization': f'Bearer {auth.bearer_token_custom}'}
-                elif auth.auth_type == AuthType.TK:
-                    bearer_token = {'tk': auth.tk}
-                elif auth.auth_type == AuthType.AUTHORIZATION:
-                    bearer_token = {'Authorization': auth.authorization}
-                if headers is not None:
-                    headers.update(bearer_token)  # type: ignore
-                else:
-                    headers = bearer_token
             return headers
 
     @property
-    def cookies(self) -> dict | None:
+    def headers(self) -> dict | None:
+        return self._auth_headers(self.headers_no_auth)
+
+    @staticmethod
+    def _auth_headers(headers: dict | None) -> dict | None:
+        return auth.auth_headers(headers)
+
+    @property
+    def cookies_no_auth(self) -> dict | None:
         try:
             cookies = self.request_data['test_steps']['request']['cookies']
         except _RequestDataParamGetError:
@@ -459,15 +610,16 @@ class RequestDataParse:
         if cookies is not None:
             if not isinstance(cookies, dict):
                 raise RequestDataParseError(_error_msg('参数 test_steps:request:cookies 不是有效的 dict 类型'))
-        if auth.is_auth:
-            if auth.auth_type == AuthType.COOKIE:
-                header_cookie = auth.header_cookie
-                if cookies is not None:
-                    cookies.update(header_cookie)
-                else:
-                    cookies = header_cookie
         return cookies
 
+    @property
+    def cookies(self) -> dict | None:
+        return self._auth_cookies(self.cookies_no_auth)
+
+    @staticmethod
+    def _auth_cookies(cookies: dict | None) -> dict | None:
+        return auth.auth_cookies(cookies)
+
     @property
     def body_type(self) -> str | None:
         try:
@@ -596,6 +748,8 @@ class RequestDataParse:
                             self._setup_hook(i, value)
                         elif key == SetupType.WAIT_TIME:
                             self._setup_wait_time(i, value)
+                        elif key == SetupType.WAIT_UNTIL:
+                            self._wait_until(f'setup:wait_until[{i}]', value)
             return setup
 
     @staticmethod
@@ -688,6 +842,8 @@ class RequestDataParse:
                             self._teardown_assert(i, value)
                         elif key == TeardownType.WAIT_TIME:
                             self._teardown_wait_time(i, value)
+                        elif key == TeardownType.WAIT_UNTIL:
+                            self._wait_until(f'teardown:wait_until[{i}]', value)
             return teardown
 
     @staticmethod
@@ -750,6 +906,32 @@ class RequestDataParse:
                 )
         return wait_time
 
+    @staticmethod
+    def _wait_until(name: str, wait_until: dict | None) -> dict | None:
+        if wait_until is not None:
+            if not isinstance(wait_until, dict):
+                raise RequestDataParseError(_error_msg(f'参数 test_steps:{name} 不是有效的 dict 类型'))
+            sources = [source for source in WAIT_UNTIL_SOURCES if wait_until.get(source) is not None]
+            if len(sources) != 1:
+                raise RequestDataParseError(
+                    _error_msg(f'参数 test_steps:{name} 必须且只能包含 {WAIT_UNTIL_SOURCES} 其中之一')
+                )
+            for k in sources + ['jsonpath']:
+                if wait_until.get(k) is not None and not isinstance(wait_until[k], str):
+                    raise RequestDataParseError(_error_msg(f'参数 test_steps:{name}:{k} 不是有效的 str 类型'))
+            if sources[0] == 'sql' and mysql_client.is_enabled:
+                mysql_client.sql_verify(wait_until['sql'])
+            assert_type = wait_until.get('type')
+            if assert_type is not None and assert_type not in get_enum_values(AssertType):
+                raise RequestDataParseError(
+                    _error_msg(f'参数 test_steps:{name}:type 不合法, 仅支持: {get_enum_values(AssertType)}')
+                )
+            for k in WAIT_UNTIL_DEFAULTS:
+                v = wait_until.get(k)
+                if v is not None and (isinstance(v, bool) or not isinstance(v, (int, float)) or v <= 0):
+                    raise RequestDataParseError(_error_msg(f'参数 test_steps:{name}:{k} 不是有效的正数'))
+        return wait_until
+
     def get_request_data_parsed(self, relate_log: bool = False) -> dict:
         """
         获取所有解析后的请求数据
@@ -757,13 +939,14 @@ class RequestDataParse:
         :param relate_log:
         :return:
         """
-        case_id = self.case_id
+        case_id = self._static('case_id')
         if not relate_log:
             log.info(f'🏷️ ID: {case_id}')
+        env = self._static('env')
         # 自动解析 headers
-        headers = self.headers
-        body_type = self.body_type
-        body = self.body
+        headers = self._auth_headers(self._static('headers_no_auth'))
+        body_type = self._static('body_type')
+        body = self._static('body')
         if headers is None:
             if body_type:
                 if body_type == BodyType.form_data:
@@ -786,34 +969,34 @@ class RequestDataParse:
                     headers = {'Content-Type': 'application/xml'}
         # 请求数据整合
         all_data = {
-            'allure_epic': self.allure_epic,
-            'allure_feature': self.allure_feature,
-            'allure_story': self.allure_story,
-            'allure_severity': self.allure_severity,
-            'env': self.env,
-            'timeout': self.timeout,
-            'verify': self.verify,
-            'redirects': self.redirects,
-            'proxies': self.proxies,
-            'retry': self.retry,
-            'encryption_enabled': self.encryption_enabled,
-            'encryption_key': self.encryption_key,
-            'module': self.module,
-            'name': self.name,
+            'allure_epic': self._static('allure_epic'),
+            'allure_feature': self._static('allure_feature'),
+            'allure_story': self._static('allure_story'),
+            'allure_severity': self._static('allure_severity'),
+            'env': env,
+            'timeout': self._static('timeout'),
+            'verify': self._static('verify'),
+            'redirects': self._static('redirects'),
+            'proxies': self._static('proxies'),
+            'retry': self._static('retry'),
+            'encryption_enabled': self._static('encryption_enabled'),
+            'encryption_key': self._static('encryption_key'),
+            'module': self._static('module'),
+            'name': self._static('name'),
             'case_id': case_id,
-            'description': self.description,
-            'method': self.method,
-            'url': self.url,
-            'params': self.params,
+            'description': self._static('description'),
+            'method': self._static('method'),
+            'url': self._join_host(self._static('url_path'), env),
+            'params': self._static('params'),
             'headers': headers,
-            'cookies': self.cookies,
+            'cookies': self._auth_cookies(self._static('cookies_no_auth')),
             'body_type': body_type,
             'body': body,
             'files': self.files,
-            'files_no_parse': self.files_no_parse,
-            'is_setup': self.is_setup,
-            'setup': self.setup,
-            'is_teardown': self.is_teardown,
-            'teardown': self.teardown,
+            'files_no_parse': self._static('files_no_parse'),
+            'is_setup': self._static('is_setup'),
+            'setup': self._static('setup'),
+            'is_teardown': self._static('is_teardown'),
+            'teardown': self._static('teardown'),
         }
         return all_data
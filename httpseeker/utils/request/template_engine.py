@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Hashable
+
+if TYPE_CHECKING:
+    import re
+
+_ExcludeFunc = Callable[[tuple, Any], bool]
+
+
+def _snapshot(value: Any) -> Any:
+    """
+    复制数据结构快照, 仅复制 dict / list 容器, 其余值共享引用
+
+    :param value:
+    :return:
+    """
+    if isinstance(value, dict):
+        return {k: _snapshot(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_snapshot(v) for v in value]
+    return value
+
+
+class _SlotNode:
+    """
+    替换位点节点
+
+    children: 包含占位符的子节点; template: 包含占位符的字符串值; key_templates: 包含占位符的 dict key
+    """
+
+    __slots__ = ('children', 'template', 'key_templates')
+
+    def __init__(self) -> None:
+        self.children: dict[Any, _SlotNode] = {}
+        self.template: str | None = None
+        self.key_templates: dict[str, str] = {}
+
+
+class TemplateEngine:
+    """
+    模板替换引擎
+
+    遍历一次数据结构, 编译出包含占位符的位点（字符串值及 dict key）, 替换时仅复制位点路径上的容器,
+    每个字符串只做一次正则替换, 避免 json.dumps / json.loads 往返及逐个变量的重复扫描;
+    指定 cache_key 时缓存编译结果及数据快照, 后续数据与快照一致时直接按位点填充, 不一致时重新编译
+    """
+
+    def __init__(self, pattern: re.Pattern, maxsize: int = 4096) -> None:
+        """
+        :param pattern: 占位符正则
+        :param maxsize: 位点缓存最大数量
+        """
+        self.pattern = pattern
+        self.maxsize = maxsize
+        self._slot_cache: dict[Hashable, tuple[Any, _SlotNode | None]] = {}
+
+    def compile(self, target: Any, exclude: _ExcludeFunc | None = None) -> _SlotNode | None:
+        """
+        编译替换位点
+
+        :param target:
+        :param exclude: 排除函数, 参数为 (路径, 值), 返回 True 时不处理该路径
+        :return: 不包含占位符时返回 None
+        """
+        return self._compile(target, (), exclude)
+
+    def _compile(self, value: Any, path: tuple, exclude: _ExcludeFunc | None) -> _SlotNode | None:
+        if exclude is not None and path and exclude(path, value):
+            return None
+        if isinstance(value, str):
+            if self.pattern.search(value) is None:
+                return None
+            node = _SlotNode()
+            node.template = value
+            return node
+        if isinstance(value, dict):
+            items = value.items()
+        elif isinstance(value, list):
+            items = enumerate(value)
+        else:
+            return None
+        node = _SlotNode()
+        for k, v in items:
+            child = self._compile(v, (*path, k), exclude)
+            if child is not None:
+                node.children[k] = child
+            if isinstance(k, str) and self.pattern.search(k) is not None:
+                node.key_templates[k] = k
+        if not node.children and not node.key_templates:
+            return None
+        return node
+
+    def has_slots(self, target: Any, exclude: _ExcludeFunc | None = None, cache_key: Hashable | None = None) -> bool:
+        """
+        判断是否包含占位符
+
+        :param target:
+        :param exclude:
+        :param cache_key:
+        :return:
+        """
+        return self._get_slot_map(target, exclude, cache_key) is not None
+
+    def _get_slot_map(self, target: Any, exclude: _ExcludeFunc | None, cache_key: Hashable | None) -> _SlotNode | None:
+        if cache_key is None:
+            return self.compile(target, exclude)
+        cached = self._slot_cache.get(cache_key)
+        # 快照比较由容器的 C 层相等判断完成, 远快于重新遍历编译
+        if cached is not None and cached[0] == target:
+            return cached[1]
+        slot_map = self.compile(target, exclude)
+        if cached is None and len(self._slot_cache) >= self.maxsize:
+            self._slot_cache.pop(next(iter(self._slot_cache)))
+        self._slot_cache[cache_key] = (_snapshot(target), slot_map)
+        return slot_map
+
+    def render(
+        self,
+        target: Any,
+        repl: Callable[[re.Match], str],
+        *,
+        exclude: _ExcludeFunc | None = None,
+        cache_key: Hashable | None = None,
+    ) -> Any:
+        """
+        替换占位符
+
+        :param target: 替换目标, 不会被修改
+        :param repl: 占位符替换函数
+        :param exclude: 排除函数
+        :param cache_key: 位点缓存 key, 为空时不缓存
+        :return: 替换后的数据, 未包含占位符的部分与原数据共享
+        """
+        slot_map = self._get_slot_map(target, exclude, cache_key)
+        if slot_map is None:
+            return target
+        return self._render(slot_map, target, repl)
+
+    def _render(self, node: _SlotNode, value: Any, repl: Callable[[re.Match], str]) -> Any:
+        if node.template is not None:
+            return self.pattern.sub(repl, value)
+        new_value = dict(value) if isinstance(value, dict) else list(value)
+        for k, child in node.children.items():
+            new_value[k] = self._render(child, value[k], repl)
+        if node.key_templates:
+            new_value = {(self.pattern.sub(repl, k) if k in node.key_templates else k): v for k, v in new_value.items()}
+        return new_value
+
+    def clear(self) -> None:
+        """清空位点缓存"""
+        self._slot_cache.clear()
@@ -2,16 +2,19 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
-import json
 import os.path
 import re
 
+from typing import Any, Hashable
+
 from httpseeker.common.env_handler import get_env_dict
 from httpseeker.common.errors import RequestDataParseError, VariableError
 from httpseeker.common.log import log
 from httpseeker.common.variable_cache import variable_cache
-from httpseeker.common.yaml_handler import read_yaml
+from httpseeker.common.yaml_handler import read_yaml_vars
 from httpseeker.core.path_conf import httpseeker_path
+from httpseeker.utils.log_control import detail_log
+from httpseeker.utils.request.template_engine import TemplateEngine
 from httpseeker.utils.request.vars_recorder import record_variables
 
 
@@ -24,30 +27,28 @@ class VarsExtractor:
         self.vars_re = re.compile(r'\${([a-zA-Z_]\w*)}|(?<!\S)\$([a-zA-Z_]\w*)(?!\S)')
         # 关联变量表达: ^{var} 或 ^var
         self.relate_vars_re = re.compile(r'\^{([a-zA-Z_]\w*)}|(?<!\S)\^([a-zA-Z_]\w*)(?!\S)')
+        # 结构化数据中的变量表达, 字符串首尾视为非空白字符, 与按 json 文本匹配时的规则一致
+        self.vars_engine = TemplateEngine(re.compile(r'\${([a-zA-Z_]\w*)}|(?<=\s)\$([a-zA-Z_]\w*)(?=\s)'))
+        self.relate_vars_engine = TemplateEngine(re.compile(r'\^{([a-zA-Z_]\w*)}|(?<=\s)\^([a-zA-Z_]\w*)(?=\s)'))
+
+    @staticmethod
+    def _exclude_files(path: tuple, value: Any) -> bool:
+        # 排除 files 字段（包含文件对象）
+        return path == ('files',)
 
-    def vars_replace(self, target: str | dict, env: str) -> str | dict:
+    def vars_replace(self, target: str | dict, env: str, cache_key: Hashable | None = None) -> str | dict:
         """
         变量替换
 
         :param target:
         :param env:
+        :param cache_key: 变量位点缓存 key, 同一用例可指定, 数据未变化时跳过重复遍历
         :return:
         """
-        # 保存不可序列化的字段（如文件对象）
-        non_serializable_fields = {}
         if isinstance(target, dict):
-            # 排除 files 字段（包含文件对象，不可 JSON 序列化）
-            if 'files' in target and target['files'] is not None:
-                non_serializable_fields['files'] = target.pop('files')
-            str_target = json.dumps(target, ensure_ascii=False)
-        else:
-            str_target = target
-
-        match = self.vars_re.search(str_target)
-        if not match:
-            # 恢复不可序列化的字段
-            if non_serializable_fields:
-                target.update(non_serializable_fields)
+            if not self.vars_engine.has_slots(target, self._exclude_files, cache_key):
+                return target
+        elif not self.vars_re.search(target):
             return target
 
         # 获取环境名称
@@ -60,34 +61,32 @@ class VarsExtractor:
         except OSError:
             raise RequestDataParseError('运行环境获取失败, 请检查测试用例环境配置')
 
-        for match in self.vars_re.finditer(str_target):
+        global_vars: list[dict | None] = []
+
+        def repl(match: re.Match) -> str:
             var_key = match.group(1) or match.group(2)
-            if var_key is not None:
-                try:
-                    cache_value = variable_cache.get(var_key)
-                    if cache_value is None:
-                        global_vars = read_yaml(httpseeker_path.global_var_dir, filename='global_vars.yaml')
-                        var_value = env_vars.get(
-                            var_key.upper(), global_vars.get(var_key) if global_vars is not None else None
-                        )
-                        if var_value is None:
-                            raise VariableError(var_key)
-                        log.info(f'变量 {var_key}={var_value} 替换完成')
-                        str_target = self.vars_re.sub(str(var_value), str_target, 1)
-                    else:
-                        log.info(f'变量 {var_key}={cache_value} 替换完成')
-                        str_target = self.vars_re.sub(str(cache_value), str_target, 1)
-                except Exception as e:
-                    raise VariableError(f'变量 {var_key} 替换失败: {e}')
+            try:
+                cache_value = variable_cache.get(var_key)
+                if cache_value is None:
+                    if not global_vars:
+                        global_vars.append(read_yaml_vars())
+                    var_value = env_vars.get(
+                        var_key.upper(), global_vars[0].get(var_key) if global_vars[0] is not None else None
+                    )
+                    if var_value is None:
+                        raise VariableError(var_key)
+                    detail_log.info('变量 {}={} 替换完成', var_key, var_value)
+                    return str(var_value)
+                else:
+                    detail_log.info('变量 {}={} 替换完成', var_key, cache_value)
+                    return str(cache_value)
+            except Exception as e:
+                raise VariableError(f'变量 {var_key} 替换失败: {e}')
 
         if isinstance(target, dict):
-            result = json.loads(str_target)
-            # 恢复不可序列化的字段
-            if non_serializable_fields:
-                result.update(non_serializable_fields)
-            return result
+            return self.vars_engine.render(target, repl, exclude=self._exclude_files, cache_key=cache_key)
 
-        return str_target
+        return self.vars_re.sub(repl, target)
 
     def relate_vars_replace(self, target: dict) -> dict:
         """
@@ -96,28 +95,24 @@ class VarsExtractor:
         :param target:
         :return:
         """
-        str_target = json.dumps(target, ensure_ascii=False)
-
-        match = self.relate_vars_re.search(str_target)
-        if not match:
+        if not self.relate_vars_engine.has_slots(target):
             return target
 
         var_keys = []
         log.info('执行关联测试用例变量替换...')
-        for match in self.relate_vars_re.finditer(str_target):
+
+        def repl(match: re.Match) -> str:
             var_key = match.group(1) or match.group(2)
-            if var_key is not None:
-                var_keys.append(var_key)
-                default = '`AE86`'
-                cache_value = variable_cache.get(var_key, default=default, tag='relate_testcase')
-                if cache_value != default:
-                    try:
-                        str_target = self.relate_vars_re.sub(str(cache_value), str_target, 1)
-                        log.info(f'用例数据关联变量 {var_key} 替换完成')
-                    except Exception as e:
-                        raise VariableError(f'用例数据关联变量 {var_key} 替换失败: {e}')
-                else:
-                    raise VariableError(f'用例数据关联变量替换失败，临时变量池不存在变量: "{var_key}"')
+            var_keys.append(var_key)
+            default = '`AE86`'
+            cache_value = variable_cache.get(var_key, default=default, tag='relate_testcase')
+            if cache_value != default:
+                log.info(f'用例数据关联变量 {var_key} 替换完成')
+                return str(cache_value)
+            else:
+                raise VariableError(f'用例数据关联变量替换失败，临时变量池不存在变量: "{var_key}"')
+
+        dict_target = self.relate_vars_engine.render(target, repl)
 
         log.info('关联测试用例变量替换完毕')
         # TODO: https://github.com/StKali/cache3/issues/18
@@ -126,8 +121,6 @@ class VarsExtractor:
             for var_key in var_keys:
                 variable_cache.delete(var_key, tag='relate_testcase')
 
-        dict_target = json.loads(str_target)
-
         return dict_target
 
     @staticmethod
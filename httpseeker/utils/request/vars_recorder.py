@@ -1,13 +1,12 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-from jsonpath import findall
-
 from httpseeker.common.env_handler import write_env_vars
 from httpseeker.common.errors import JsonPathFindError, VariableError
 from httpseeker.common.variable_cache import variable_cache
 from httpseeker.common.yaml_handler import write_yaml_vars
 from httpseeker.core.path_conf import httpseeker_path
 from httpseeker.enums.var_type import VarType
+from httpseeker.utils.jsonpath_control import findall
 
 
 def record_variables(jsonpath: str, target: dict, key: str, set_type: str, env: str) -> None:
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import time
+
+from typing import Any, Callable
+
+from httpseeker.common.errors import AssertError, CorrelateTestCaseError, JsonPathFindError, SQLSyntaxError
+from httpseeker.common.log import log
+from httpseeker.db.mysql import mysql_client
+from httpseeker.enums.query_fetch_type import QueryFetchType
+from httpseeker.utils.allure_control import allure_step
+from httpseeker.utils.assert_control import asserter
+from httpseeker.utils.jsonpath_control import findall
+from httpseeker.utils.request.hook_executor import hook_executor
+
+# 轮询参数默认值
+WAIT_UNTIL_DEFAULTS = {'timeout': 30, 'interval': 1, 'backoff': 2, 'max_interval': 10}
+# 轮询数据来源, 必须且只能指定其中一个
+WAIT_UNTIL_SOURCES = ('testcase', 'sql', 'hook')
+
+
+def _testcase_probe(case_id: str) -> Callable[[], Any]:
+    from httpseeker.common.send_request import send_request
+    from httpseeker.utils.case_registry import case_registry
+
+    if case_id not in case_registry:
+        raise CorrelateTestCaseError(f'wait_until 执行失败，未在测试用例中找到关联测试用例: {case_id}')
+
+    def probe() -> Any:
+        case_data, case_steps = case_registry.get_case(case_id)
+        case_data['test_steps'] = case_steps
+        return send_request.send_request(case_data, log_data=False, relate_log=True)
+
+    return probe
+
+
+def _sql_probe(sql: str, fetch: QueryFetchType | None, env: str) -> Callable[[], Any]:
+    if not mysql_client.is_enabled:
+        raise SQLSyntaxError('MySQL 未启用，无法执行 wait_until SQL 轮询')
+    return lambda: mysql_client.exec_case_sql(sql, fetch or QueryFetchType.ONE, env)
+
+
+def _check_condition(wait_until: dict, data: Any) -> None:
+    """
+    校验等待条件, 条件不满足时抛出 AssertionError
+
+    :param wait_until:
+    :param data: 轮询数据
+    :return:
+    """
+    jsonpath = wait_until.get('jsonpath')
+    if jsonpath is None:
+        actual_value = data
+    else:
+        values = findall(jsonpath, data)
+        if not values:
+            raise JsonPathFindError(f'jsonpath 取值失败, 表达式: {jsonpath}')
+        actual_value = values[0]
+    assert_type = wait_until.get('type')
+    if assert_type is None:
+        if not actual_value:
+            raise AssertionError(f'{jsonpath or "轮询结果"} 不是真值: {actual_value}')
+    else:
+        expected_value = wait_until.get('value')
+        assert_check = f'{jsonpath or "轮询结果"} 未满足 {assert_type} {expected_value}, 实际结果: {actual_value}'
+        asserter._exec_json_assert(assert_check, expected_value, assert_type, actual_value)
+
+
+def exec_wait_until(wait_until: dict, env: str) -> None:
+    """
+    轮询等待: 重复发送关联测试用例请求 / 执行 SQL 查询 / 执行 hook, 直到等待条件满足或超时,
+    轮询间隔按 backoff 倍数递增, 最大不超过 max_interval
+
+    :param wait_until: 等待条件
+    :param env: 环境
+    :return:
+    """
+    sources = [source for source in WAIT_UNTIL_SOURCES if wait_until.get(source) is not None]
+    if len(sources) != 1:
+        raise AssertError(f'wait_until 数据来源必须且只能指定一个: {WAIT_UNTIL_SOURCES}')
+    settings = {k: v if wait_until.get(k) is None else wait_until[k] for k, v in WAIT_UNTIL_DEFAULTS.items()}
+    source = sources[0]
+    if source == 'testcase':
+        probe = _testcase_probe(wait_until['testcase'])
+    elif source == 'sql':
+        probe = _sql_probe(wait_until['sql'], wait_until.get('fetch'), env)
+    else:
+        hook = wait_until['hook']
+        probe = lambda: hook_executor.exec_hook_func(hook)  # noqa: E731
+
+    log.info(f'执行 wait_until 轮询：{wait_until}')
+    interval = settings['interval']
+    start = time.perf_counter()
+    deadline = start + settings['timeout']
+    polls = 0
+    while True:
+        polls += 1
+        try:
+            _check_condition(wait_until, probe())
+        except (AssertionError, JsonPathFindError) as e:
+            last_error = str(e) or '等待条件不满足'
+        else:
+            elapsed = round(time.perf_counter() - start, 3)
+            log.info(f'wait_until 条件满足：轮询 {polls} 次, 耗时 {elapsed} s')
+            allure_step('wait_until 条件满足', {'polls': polls, 'elapsed': elapsed, 'wait_until': wait_until})
+            return
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            break
+        log.info(f'wait_until 条件未满足, {min(interval, remaining):.2f} s 后重试：{last_error}')
+        time.sleep(min(interval, remaining))
+        interval = min(interval * settings['backoff'], settings['max_interval'])
+    elapsed = round(time.perf_counter() - start, 3)
+    allure_step(
+        'wait_until 等待超时', {'polls': polls, 'elapsed': elapsed, 'error': last_error, 'wait_until': wait_until}
+    )
+    raise AssertError(f'wait_until 等待超时：轮询 {polls} 次, 耗时 {elapsed} s, 最后一次结果: {last_error}')
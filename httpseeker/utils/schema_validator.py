@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+
+from typing import TYPE_CHECKING, Any, Callable
+
+from jsonschema import FormatChecker
+from jsonschema.exceptions import SchemaError, best_match
+from jsonschema.validators import Draft4Validator, Draft6Validator, Draft7Validator, validator_for
+
+from httpseeker.common.errors import AssertSyntaxError
+from httpseeker.common.log import log
+from httpseeker.core.get_conf import httpseeker_config
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+if TYPE_CHECKING:
+    from jsonschema.protocols import Validator
+
+# 数组长度达到此值时使用 fastjsonschema 校验（需安装 fastjsonschema）
+_FAST_THRESHOLD = 100
+# fastjsonschema 支持的 schema 版本, 其他版本（如未声明 $schema 时默认的 2020-12）仅使用 jsonschema 校验
+_FAST_DRAFTS = (Draft4Validator, Draft6Validator, Draft7Validator)
+
+
+class SchemaValidatorCache:
+    """
+    jsonschema 校验器缓存
+
+    以 schema 哈希为 key, 每个 schema 仅校验及构建一次校验器; 格式检查器在首次使用时按配置创建一次;
+    安装 fastjsonschema 后, 大数组响应使用其生成的校验函数, 校验失败时再由 jsonschema 给出详细错误
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """
+        :param maxsize: 校验器缓存最大数量
+        """
+        self.maxsize = maxsize
+        self._validators: dict[str, tuple[Validator, Callable[[Any], Any] | None]] = {}
+        self._format_checker: FormatChecker | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def format_checker(self) -> FormatChecker | None:
+        """格式检查器, 未开启 format 校验时为 None"""
+        if self._format_checker is None and httpseeker_config.REQUEST_JSONSCHEMA_FORMAT_CHECK:
+            self._format_checker = FormatChecker()
+        return self._format_checker
+
+    @staticmethod
+    def schema_hash(schema: dict) -> str:
+        """
+        计算 schema 哈希
+
+        :param schema:
+        :return:
+        """
+        text = json.dumps(schema, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    def _build(self, schema: dict) -> tuple[Validator, Callable[[Any], Any] | None]:
+        cls = validator_for(schema)
+        try:
+            cls.check_schema(schema)
+        except SchemaError as e:
+            raise AssertSyntaxError(f'jsonschema 断言内容格式错误, schema 不符合规范: {e.message}')
+        format_checker = self.format_checker
+        validator = cls(schema, format_checker=format_checker)
+        fast_validate = None
+        if fastjsonschema is not None and cls in _FAST_DRAFTS:
+            try:
+                fast_validate = fastjsonschema.compile(schema, use_formats=format_checker is not None)
+            except Exception as e:
+                log.debug(f'fastjsonschema 编译 schema 失败, 使用 jsonschema 校验: {e}')
+        return validator, fast_validate
+
+    def get(self, schema: dict) -> tuple[Validator, Callable[[Any], Any] | None]:
+        """
+        获取校验器
+
+        :param schema:
+        :return: (jsonschema 校验器, fastjsonschema 校验函数), 未安装或不支持时后者为 None
+        """
+        key = self.schema_hash(schema)
+        cached = self._validators.get(key)
+        if cached is None:
+            cached = self._build(schema)
+            with self._lock:
+                if len(self._validators) >= self.maxsize:
+                    self._validators.pop(next(iter(self._validators)))
+                self._validators[key] = cached
+        return cached
+
+    def validate(self, instance: Any, schema: dict) -> None:
+        """
+        校验数据, 校验失败时抛出 jsonschema.exceptions.ValidationError
+
+        :param instance:
+        :param schema:
+        :return:
+        """
+        validator, fast_validate = self.get(schema)
+        if fast_validate is not None and isinstance(instance, list) and len(instance) >= _FAST_THRESHOLD:
+            try:
+                fast_validate(instance)
+            except fastjsonschema.JsonSchemaException:
+                pass
+            else:
+                return
+        error = best_match(validator.iter_errors(instance))
+        if error is not None:
+            raise error
+
+    def clear(self) -> None:
+        """清空缓存, 下次使用时重新构建校验器及格式检查器"""
+        with self._lock:
+            self._validators.clear()
+            self._format_checker = None
+
+
+schema_validator = SchemaValidatorCache()
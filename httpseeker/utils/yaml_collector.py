@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import os
+import types
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from httpseeker.core.path_conf import httpseeker_path
+from httpseeker.enums.case_data_type import CaseDataType
+from httpseeker.utils.enum_control import get_enum_values
+from httpseeker.utils.file_control import get_file_property
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def get_testcase_names(file_root_name: str) -> tuple[str, str]:
+    """
+    获取用例数据文件对应的测试类名及测试函数名, 与自动生成的测试用例一致
+
+    :param file_root_name: 用例数据文件名（不含后缀）
+    :return: (测试类名, 测试函数名)
+    """
+    testcase_class_name = ''.join(name.title() for name in file_root_name.split('_'))
+    testcase_func_name = file_root_name
+    if not file_root_name.startswith('test_'):
+        testcase_class_name = 'Test' + testcase_class_name
+        testcase_func_name = 'test_' + testcase_func_name
+    return testcase_class_name, testcase_func_name
+
+
+def build_testcase_module(filepath: str) -> types.ModuleType:
+    """
+    根据用例数据文件构建测试模块, 等同于自动生成的测试用例文件
+
+    :param filepath: 用例数据文件路径
+    :return:
+    """
+    from httpseeker.common.send_request import send_request
+    from httpseeker.utils.request.case_data_parse import get_testcase_data
+
+    filename, file_root_name, _ = get_file_property(filepath)
+    testcase_class_name, testcase_func_name = get_testcase_names(file_root_name)
+    ddt_data, ids = get_testcase_data(filename=filename)
+
+    def testcase(self: object, case_data: dict) -> None:
+        send_request.send_request(case_data)
+
+    testcase.__name__ = testcase.__qualname__ = testcase_func_name
+    testcase.__doc__ = file_root_name
+    testcase_class = type(
+        testcase_class_name,
+        (),
+        {
+            '__doc__': testcase_class_name.replace('Test', ''),
+            testcase_func_name: pytest.mark.parametrize('case_data', ddt_data, ids=ids)(testcase),
+        },
+    )
+    module = types.ModuleType(testcase_func_name)
+    module.__file__ = filepath
+    setattr(module, testcase_class_name, testcase_class)
+    testcase_class.__module__ = module.__name__
+    return module
+
+
+class YamlCaseModule(pytest.Module):
+    """用例数据文件收集器, 在收集时从用例数据构建测试模块, 无需生成测试用例文件"""
+
+    def _getobj(self) -> types.ModuleType:
+        return build_testcase_module(str(self.path))
+
+
+def is_case_data_file(file_path: Path) -> bool:
+    """
+    判断是否为用例数据文件
+
+    :param file_path:
+    :return:
+    """
+    if file_path.suffix[1:] not in get_enum_values(CaseDataType):
+        return False
+    case_data_dir = os.path.abspath(httpseeker_path.case_data_dir)
+    return os.path.abspath(file_path).startswith(case_data_dir + os.sep)
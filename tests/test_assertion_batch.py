@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+from httpseeker.common import send_request as send_request_module
+from httpseeker.common.errors import AssertError
+from httpseeker.common.send_request import send_request
+from httpseeker.core.get_conf import httpseeker_config
+from httpseeker.enums.teardown_type import TeardownType
+from httpseeker.utils.assert_control import AssertionBatch
+
+RESPONSE = {'status_code': 200, 'json': {'code': 200, 'data': {'id': 1, 'name': 'seeker'}}}
+
+EQ_CODE = {'check': 'code 等于 200', 'value': 200, 'type': 'eq', 'jsonpath': '$.json.code'}
+EQ_ID = {'check': 'id 等于 2', 'value': 2, 'type': 'eq', 'jsonpath': '$.json.data.id'}
+MISSING_PATH = {'check': '字段存在', 'value': 1, 'type': 'eq', 'jsonpath': '$.json.data.missing'}
+SCHEMA = {
+    'check': 'name 为整数',
+    'type': 'jsonschema',
+    'jsonschema': {'type': 'object', 'properties': {'data': {'properties': {'name': {'type': 'integer'}}}}},
+}
+
+
+def test_soft_batch_collects_all_failures() -> None:
+    batch = AssertionBatch(RESPONSE, soft=True)
+    for assert_text in (EQ_CODE, EQ_ID, SCHEMA, MISSING_PATH):
+        batch.exec_asserter(assert_text)
+
+    assert [failure['assert'] for failure in batch.failures] == [EQ_ID, SCHEMA, MISSING_PATH]
+    with pytest.raises(AssertError, match='共 3 项'):
+        batch.raise_failures()
+
+
+def test_schema_failure_is_assert_error() -> None:
+    batch = AssertionBatch(RESPONSE)
+    with pytest.raises(AssertError, match='name 为整数'):
+        batch.exec_asserter(SCHEMA)
+
+
+def test_soft_failures_survive_teardown_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    def broken_hook(hook_var: str) -> None:
+        raise RuntimeError(hook_var)
+
+    monkeypatch.setattr(httpseeker_config, 'REQUEST_SOFT_ASSERT', True)
+    monkeypatch.setattr(send_request_module, 'ResponseView', lambda *args, **kwargs: RESPONSE)
+    monkeypatch.setattr(send_request_module.hook_executor, 'exec_hook_func', broken_hook)
+    parsed_data = {
+        'env': 'test.env',
+        'is_teardown': True,
+        'teardown': [{TeardownType.ASSERT: EQ_ID}, {TeardownType.HOOK: 'broken'}, {TeardownType.ASSERT: EQ_CODE}],
+    }
+
+    # 原异常不被软断言汇总替换, 汇总信息附加到原异常
+    with pytest.raises(RuntimeError, match='broken') as exc_info:
+        send_request.handle_response(parsed_data, {}, None, None, log_data=False)
+    if sys.version_info >= (3, 11):
+        assert 'id 等于 2' in exc_info.value.__notes__[0]
+
+
+def test_soft_failures_raised_after_teardown(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(httpseeker_config, 'REQUEST_SOFT_ASSERT', True)
+    monkeypatch.setattr(send_request_module, 'ResponseView', lambda *args, **kwargs: RESPONSE)
+    parsed_data = {
+        'env': 'test.env',
+        'is_teardown': True,
+        'teardown': [{TeardownType.ASSERT: EQ_ID}, {TeardownType.ASSERT: SCHEMA}, {TeardownType.ASSERT: EQ_CODE}],
+    }
+
+    with pytest.raises(AssertError, match='共 2 项') as exc_info:
+        send_request.handle_response(parsed_data, {}, None, None, log_data=False)
+    assert exc_info.value.__context__ is None
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator
+
+import pytest
+
+from httpseeker.common.async_runner import AsyncRunner
+
+DELAY = 0.2
+
+
+class SlowHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:  # noqa: N802
+        time.sleep(DELAY)
+        self.send_response(200)
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'ok')
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+class SlowServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+
+@pytest.fixture(scope='module')
+def slow_url() -> Iterator[str]:
+    server = SlowServer(('127.0.0.1', 0), SlowHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_port}/'
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def runner() -> Iterator[AsyncRunner]:
+    runner = AsyncRunner(concurrency=10)
+    yield runner
+    runner.close()
+
+
+def prepared(url: str) -> tuple:
+    request_conf = {'verify': False, 'proxies': None, 'timeout': 5, 'allow_redirects': False}
+    return {'case_id': 'slow'}, request_conf, {'method': 'GET', 'url': url}
+
+
+def test_replay_connection_pool_follows_replay_concurrency(slow_url: str, runner: AsyncRunner) -> None:
+    # 重放并发数大于 request.concurrency 时, 请求不应在连接池中排队
+    results, _ = runner.replay([prepared(slow_url)], duration=1, concurrency=50)
+    result = results['slow']
+    assert result.errors == 0
+    assert result.total >= 50 * int(1 / DELAY) * 0.8
+    assert result.percentile(50) < DELAY * 1000 * 2
+
+
+def test_rate_mode_reports_queue_time_separately(slow_url: str, runner: AsyncRunner) -> None:
+    # 100 RPS, 并发上限 5: 吞吐受限于 25 RPS, 等待并发名额的时间计入排队时间而不是请求耗时
+    results, _ = runner.replay([prepared(slow_url)], duration=1, rate=100, concurrency=5)
+    result = results['slow']
+    assert result.errors == 0
+    assert result.percentile(95) < DELAY * 1000 * 2
+    assert result.queue_percentile(95) > DELAY * 1000 * 2
+    assert len(result.queue_times) == result.total
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import base64
+import itertools
+import json
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import pytest
+
+from httpseeker.core.get_conf import httpseeker_config
+from httpseeker.enums.request.auth import AccountStrategy
+from httpseeker.utils.auth_plugins import AuthPlugins, auth, get_jwt_exp
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def make_jwt(exp: float) -> str:
+    payload = base64.urlsafe_b64encode(json.dumps({'exp': exp}).encode()).decode().rstrip('=')
+    return f'header.{payload}.signature'
+
+
+class Fetcher:
+    def __init__(self, *tokens: str, delay: float = 0) -> None:
+        self.tokens = list(tokens)
+        self.delay = delay
+        self.calls = 0
+
+    def __call__(self) -> str:
+        self.calls += 1
+        time.sleep(self.delay)
+        return self.tokens[min(self.calls, len(self.tokens)) - 1]
+
+
+@pytest.fixture
+def token_cache(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(auth, 'cache_dir', tmp_path)
+    monkeypatch.setattr(auth, '_tokens', {})
+    monkeypatch.setattr(auth, '_locks', {})
+    monkeypatch.setattr(auth, '_refreshing', set())
+
+
+def test_get_jwt_exp() -> None:
+    assert get_jwt_exp(make_jwt(1700000000)) == 1700000000
+    assert get_jwt_exp('opaque-token') is None
+
+
+@pytest.mark.usefixtures('token_cache')
+def test_concurrent_misses_login_once() -> None:
+    fetch = Fetcher('token', delay=0.1)
+    with ThreadPoolExecutor(8) as executor:
+        tokens = list(executor.map(lambda _: auth._get_token('key', fetch, 'Token'), range(8)))
+
+    assert tokens == ['token'] * 8
+    assert fetch.calls == 1
+
+
+@pytest.mark.usefixtures('token_cache')
+def test_expiry_from_jwt_and_shared_cache() -> None:
+    exp = int(time.time()) + 3600
+    token = make_jwt(exp)
+    assert auth._get_token('key', Fetcher(token), 'Token') == token
+    assert auth._tokens['key'][1] == exp
+
+    # 其他进程（进程内缓存为空）直接使用共享缓存
+    auth._tokens.clear()
+    fetch = Fetcher('other')
+    assert auth._get_token('key', fetch, 'Token') == token
+    assert fetch.calls == 0
+
+
+@pytest.mark.usefixtures('token_cache')
+def test_refresh_ahead_in_background(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(httpseeker_config, 'AUTH_REFRESH_AHEAD', 60)
+    auth._tokens['key'] = ('old', time.time() + 10, 3600)
+    refreshed = threading.Event()
+    fetch = Fetcher('new')
+
+    def fetch_and_notify() -> str:
+        try:
+            return fetch()
+        finally:
+            refreshed.set()
+
+    # 即将过期时仍返回当前 token, 由后台线程刷新
+    assert auth._get_token('key', fetch_and_notify, 'Token') == 'old'
+    assert refreshed.wait(5)
+    for _ in range(50):
+        if auth._tokens['key'][0] == 'new':
+            break
+        time.sleep(0.02)
+    assert auth._get_token('key', fetch_and_notify, 'Token') == 'new'
+    assert fetch.calls == 1
+
+
+ACCOUNTS = [{'account': 'user1', 'pwd': 'p1'}, {'account': 'user2', 'pwd': 'p2'}, {'account': 'user3', 'pwd': 'p3'}]
+
+
+@pytest.fixture
+def account_pool(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(auth, 'accounts', ACCOUNTS)
+    monkeypatch.setattr(auth, '_account_counter', itertools.count())
+    monkeypatch.setattr(auth, '_account_local', threading.local())
+    monkeypatch.delenv('PYTEST_XDIST_WORKER', raising=False)
+
+
+@pytest.mark.usefixtures('account_pool')
+def test_round_robin_lease(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(auth, 'account_strategy', AccountStrategy.ROUND_ROBIN)
+
+    assert [auth.lease_account() for _ in range(4)] == [0, 1, 2, 0]
+
+
+@pytest.mark.usefixtures('account_pool')
+def test_affinity_lease(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(auth, 'account_strategy', AccountStrategy.AFFINITY)
+
+    # 同一线程固定使用同一账号, 不同线程分配不同账号
+    leases = {auth.lease_account() for _ in range(3)}
+    with ThreadPoolExecutor(1) as executor:
+        other = executor.submit(lambda: {auth.lease_account() for _ in range(3)}).result()
+    assert leases == {0}
+    assert other == {1}
+
+    monkeypatch.setenv('PYTEST_XDIST_WORKER', 'gw4')
+    assert auth.lease_account() == 1
+
+
+@pytest.mark.usefixtures('account_pool')
+def test_use_account_pins_lease() -> None:
+    with auth.use_account(2):
+        assert [auth.lease_account() for _ in range(2)] == [2, 2]
+        with auth.use_account(0):
+            assert auth.lease_account() == 0
+        assert auth.lease_account() == 2
+    assert auth.lease_account() == 0
+
+
+@pytest.mark.usefixtures('account_pool')
+def test_account_config_and_cache_key() -> None:
+    assert auth.get_auth_config(4)['account'] == 'user2'
+    assert auth.get_auth_config(4)['url'] == auth.get_auth_config()['url']
+    assert auth._account_cache_key('token', 1) == 'token:user2'
+    assert auth._account_cache_key('token', None) == 'token'
+
+
+def test_accounts_from_pool_file(tmp_path: Path) -> None:
+    pool_file = tmp_path / 'accounts.yaml'
+    pool_file.write_text('accounts:\n  - account: user1\n    pwd: p1\n', encoding='utf-8')
+
+    assert AuthPlugins.get_accounts(str(pool_file)) == [{'account': 'user1', 'pwd': 'p1'}]
+    assert AuthPlugins.get_accounts(None) == []
+
+
+@pytest.mark.usefixtures('account_pool')
+def test_case_and_relate_case_share_account(monkeypatch: pytest.MonkeyPatch) -> None:
+    from httpseeker.common.send_request import send_request
+
+    monkeypatch.setattr(auth, 'account_strategy', AccountStrategy.ROUND_ROBIN)
+    leased: list[tuple[str, int]] = []
+
+    def fake_send_request(request_data: dict, request_engin: str, log_data: bool, relate_log: bool) -> dict:
+        # 用例请求数据解析、前置关联测试用例及 wait_until 轮询均按需分配账号
+        leased.append((request_data['case_id'], auth.lease_account()))
+        for relate_case in request_data.get('setup', []):
+            send_request.send_request(relate_case, relate_log=True)
+        leased.append((request_data['case_id'], auth.lease_account()))
+        return {}
+
+    monkeypatch.setattr(send_request, '_send_request', fake_send_request)
+    send_request.send_request({'case_id': 'order', 'setup': [{'case_id': 'login'}, {'case_id': 'cart'}]})
+    send_request.send_request({'case_id': 'pay'})
+
+    assert leased == [
+        ('order', 0),
+        ('login', 0),
+        ('login', 0),
+        ('cart', 0),
+        ('cart', 0),
+        ('order', 0),
+        ('pay', 1),
+        ('pay', 1),
+    ]
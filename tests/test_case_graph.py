@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import pytest
+
+from httpseeker.common.errors import CorrelateTestCaseError
+from httpseeker.utils.case_graph import case_graph_verify, find_cycle, get_case_groups
+
+
+def case_file(filename: str, *steps: tuple[str, list]) -> dict:
+    return {
+        'filename': filename,
+        'test_steps': [
+            {'case_id': case_id, 'setup': [{'testcase': setup} for setup in setups]} for case_id, setups in steps
+        ],
+    }
+
+
+def test_find_cycle() -> None:
+    assert find_cycle({'a': ['b'], 'b': ['c'], 'c': []}) is None
+    assert find_cycle({'a': ['b'], 'b': ['c'], 'c': ['a']}) == ['a', 'b', 'c', 'a']
+    assert find_cycle({'x': [], 'a': ['b'], 'b': ['a']}) == ['a', 'b', 'a']
+
+
+def test_verify_reports_cycle_across_files() -> None:
+    all_case_data = [
+        case_file('order.yaml', ('create_order', ['login']), ('pay_order', [{'case_id': 'refund'}])),
+        case_file('refund.yaml', ('refund', ['pay_order'])),
+        case_file('login.yaml', ('login', [])),
+    ]
+
+    with pytest.raises(CorrelateTestCaseError, match='pay_order -> refund -> pay_order'):
+        case_graph_verify(all_case_data)
+
+
+@pytest.mark.parametrize(
+    ('steps', 'error'),
+    [
+        ([('a', ['a'])], '关联自身'),
+        ([('a', ['missing'])], '不存在'),
+    ],
+)
+def test_verify_invalid_relation(steps: list, error: str) -> None:
+    with pytest.raises(CorrelateTestCaseError, match=error):
+        case_graph_verify([case_file('a.yaml', *steps)])
+
+
+def test_case_groups() -> None:
+    all_case_data = [
+        case_file('login.yaml', ('login', [])),
+        case_file('order.yaml', ('create_order', ['login']), ('query_order', [])),
+        case_file('user.yaml', ('query_user', [])),
+        case_file('goods.yaml', ('query_goods', [])),
+    ]
+    case_graph_verify(all_case_data)
+
+    groups = get_case_groups(all_case_data)
+    # 存在关联关系及同一文件的用例同组, 其他用例各自成组
+    assert groups['login'] == groups['create_order'] == groups['query_order']
+    assert len({groups['login'], groups['query_user'], groups['query_goods']}) == 3
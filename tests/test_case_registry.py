@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import pytest
+
+from httpseeker.db.redis import redis_client
+from httpseeker.utils import relate_testcase_executor
+from httpseeker.utils.case_loader import case_loader
+from httpseeker.utils.case_registry import case_registry
+from httpseeker.utils.request.case_data_parse import case_id_unique_verify
+
+CASE_DATA = [
+    {
+        'filename': 'user.yaml',
+        'config': {'module': 'user'},
+        'test_steps': [
+            {'name': '登录', 'case_id': 'login_001', 'request': {'method': 'POST', 'url': '/login'}},
+            {'name': '查询', 'case_id': 'user_001', 'setup': [{'testcase': 'login_001'}]},
+        ],
+    },
+    {
+        'filename': 'order.yaml',
+        'config': {'module': 'order'},
+        'test_steps': {'name': '下单', 'case_id': 'order_001', 'setup': [{'testcase': 'login_001'}]},
+    },
+]
+
+
+@pytest.fixture
+def local_cases(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(redis_client, '_enabled', False)
+    monkeypatch.setattr(case_loader, 'load', lambda: CASE_DATA)
+    case_registry.clear()
+    yield
+    case_registry.clear()
+
+
+@pytest.mark.usefixtures('local_cases')
+def test_registry_without_redis_after_unique_verify() -> None:
+    case_id_unique_verify()
+    assert all(case_id in case_registry for case_id in ('login_001', 'user_001', 'order_001'))
+    case_data, steps = case_registry.get_case('order_001')
+    assert case_data['filename'] == 'order.yaml'
+    assert steps['case_id'] == 'order_001'
+
+
+@pytest.mark.usefixtures('local_cases')
+def test_relate_case_lookup_without_redis(monkeypatch: pytest.MonkeyPatch) -> None:
+    executed = []
+    monkeypatch.setattr(relate_testcase_executor, 'relate_testcase_exec', executed.append)
+    case_id_unique_verify()
+    relate_testcase_executor.exec_setup_testcase({'case_id': 'user_001'}, 'login_001')
+    assert len(executed) == 1
+    assert executed[0]['test_steps']['case_id'] == 'login_001'
+    # 返回副本, 修改不影响注册表
+    executed[0]['test_steps']['name'] = 'changed'
+    assert case_registry.get_case('login_001')[1]['name'] == '登录'
+
+
+@pytest.mark.usefixtures('local_cases')
+def test_unique_verify_detects_duplicates_without_redis(monkeypatch: pytest.MonkeyPatch) -> None:
+    duplicated = [*CASE_DATA, {'filename': 'dup.yaml', 'test_steps': {'case_id': 'login_001'}}]
+    monkeypatch.setattr(case_loader, 'load', lambda: duplicated)
+    with pytest.raises(SystemExit):
+        case_id_unique_verify()
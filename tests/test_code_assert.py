@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import pytest
+
+from httpseeker.common.errors import AssertSyntaxError
+from httpseeker.utils.assert_control import asserter
+
+RESPONSE = {
+    'status_code': 200,
+    'json': {
+        'msg': 'ok',
+        'enabled': False,
+        'price': 3.5,
+        'tags': ['a', 'b'],
+        'id': '4d3c9ec4-1b8f-4d8e-9d2a-0c5f1e2b7a61',
+    },
+}
+
+
+@pytest.mark.parametrize(
+    'assert_text',
+    [
+        "assert 200 == pm.response.get('status_code')",
+        "assert 'ok' == pm.response.get('json').get('msg')",
+        "assert 'a' in pm.response.get('json').get('tags')",
+        "assert 3 < pm.response.get('json').get('price')",
+        # 转型函数作用于原始值, 而不是其字符串形式
+        "assert False == bool(pm.response.get('json').get('enabled'))",
+        "assert 3 == int(pm.response.get('json').get('price'))",
+        "assert ['a','b'] == list(pm.response.get('json').get('tags'))",
+        "assert pm.response.get('json').get('id') == IsUUID",
+    ],
+)
+def test_code_assert_uses_raw_value(assert_text: str) -> None:
+    asserter.exec_asserter(RESPONSE, assert_text)
+
+
+def test_code_assert_failure_message() -> None:
+    with pytest.raises(AssertionError, match='状态码错误'):
+        asserter.exec_asserter(RESPONSE, "assert 201 == pm.response.get('status_code'), '状态码错误'")
+
+
+def test_code_assert_requires_get() -> None:
+    with pytest.raises(AssertSyntaxError):
+        asserter.exec_asserter(RESPONSE, "assert 200 == pm.response['status_code']")
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import base64
+import json
+
+import pytest
+
+from Crypto.Cipher import AES
+from Crypto.Util.Padding import unpad
+
+from httpseeker.utils.encryption_filter import EncryptionFilter, get_encryption_filter
+
+
+@pytest.fixture
+def encryption_filter() -> EncryptionFilter:
+    return get_encryption_filter(None)
+
+
+def legacy_decrypt(encrypted_data: str) -> str:
+    decoded = base64.b64decode(encrypted_data)
+    cipher = AES.new(EncryptionFilter.DEFAULT_KEY.encode(), AES.MODE_CBC, decoded[:16])
+    return unpad(cipher.decrypt(decoded[16:]), AES.block_size).decode('utf-8')
+
+
+def test_filter_is_cached_per_key() -> None:
+    assert get_encryption_filter(None) is get_encryption_filter(None)
+    assert get_encryption_filter('k' * 32) is not get_encryption_filter(None)
+
+
+@pytest.mark.parametrize('length', [0, 1, 15, 16, 17, 1000])
+def test_round_trip(encryption_filter: EncryptionFilter, length: int) -> None:
+    text = '测试' * length
+    encrypted = encryption_filter.encrypt(text)
+    assert encryption_filter.decrypt(encrypted) == text
+    assert legacy_decrypt(encrypted) == text
+
+
+def test_chunked_decrypt_matches_one_shot(encryption_filter: EncryptionFilter) -> None:
+    text = json.dumps([{'id': i, 'name': f'用户{i}'} for i in range(20000)], ensure_ascii=False)
+    encrypted = encryption_filter.encrypt(text)
+    # 密文跨越多个分块, 且最后一块不是完整分块
+    assert len(encrypted) > EncryptionFilter.CHUNK_CHARS * 2
+    assert len(encrypted) % EncryptionFilter.CHUNK_CHARS
+    assert encryption_filter.decrypt(encrypted) == text
+
+
+def test_decrypt_with_line_breaks_falls_back(encryption_filter: EncryptionFilter) -> None:
+    encrypted = encryption_filter.encrypt('x' * 500)
+    wrapped = '\n'.join(encrypted[i : i + 76] for i in range(0, len(encrypted), 76))
+    assert encryption_filter.decrypt(wrapped) == 'x' * 500
+
+
+def test_decrypt_rejects_bad_padding(encryption_filter: EncryptionFilter) -> None:
+    encrypted = get_encryption_filter('k' * 32).encrypt('secret')
+    with pytest.raises(IOError):
+        encryption_filter.decrypt(encrypted)
+
+
+def test_decrypt_response_data(encryption_filter: EncryptionFilter) -> None:
+    payload = {'records': [1, 2, 3]}
+    # 整个响应体为密文
+    assert encryption_filter.decrypt_response_data({'body': encryption_filter.encrypt(json.dumps(payload))}) == payload
+    # data 字段为 JSON 密文
+    response = {'code': 200, 'data': encryption_filter.encrypt(json.dumps(payload))}
+    assert encryption_filter.decrypt_response_data(response) == {'code': 200, 'data': payload}
+    # data 字段为非 JSON 密文, 保留为字符串
+    assert encryption_filter.decrypt_response_data({'data': encryption_filter.encrypt('token')}) == {'data': 'token'}
+    # data 字段为明文, 保留原始内容
+    assert encryption_filter.decrypt_response_data({'code': 200, 'data': 'ok'}) == {'code': 200, 'data': 'ok'}
+
+
+def test_encrypt_request_body(encryption_filter: EncryptionFilter) -> None:
+    body, headers = encryption_filter.encrypt_request_body({'account': '18800000000'})
+    assert headers == {'X-Encrypted': 'true'}
+    assert json.loads(encryption_filter.decrypt(body['data'])) == {'account': '18800000000'}
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import copy
+import itertools
+import json
+
+from typing import Any
+
+import pytest
+
+from httpseeker.core import hooks
+from httpseeker.utils.request.hook_executor import HookExecutor
+from httpseeker.utils.request.hook_registry import HookRegistry, hook_registry
+
+
+def baseline_call(expression: str) -> Any:
+    """替换前的实现: 每次在 from httpseeker.core.hooks import * 的命名空间中执行"""
+    namespace: dict = {}
+    exec('from httpseeker.core.hooks import *', namespace)
+    exec(f'result = {expression}', namespace)
+    return namespace['result']
+
+
+def baseline_value_replace(executor: HookExecutor, target: dict) -> dict:
+    """替换前的实现: 按 json 文本整体替换, 前后置 hook 不执行且保留在原位"""
+    str_target = json.dumps(target, ensure_ascii=False)
+    for match in executor.func_re.finditer(str_target):
+        value = str(baseline_call(executor._quote_string_args(match.group(1))))
+        str_target = executor.func_re.sub(value, str_target, 1)
+    return json.loads(str_target)
+
+
+@pytest.fixture
+def phones(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    phones: list[str] = []
+    counter = itertools.count(13800000000)
+
+    class FakeFaker:
+        @staticmethod
+        def phone_number() -> str:
+            phones.append(str(next(counter)))
+            return phones[-1]
+
+    monkeypatch.setattr(hooks, 'faker', FakeFaker())
+    return phones
+
+
+@pytest.mark.parametrize(
+    'expression',
+    [
+        pytest.param('sum_a_b(1, 2)', id='bind-args'),
+        pytest.param('sum_a_b(a=1, b=-2)', id='bind-kwargs'),
+        pytest.param('sum_a_b("a", "b")', id='bind-str'),
+        pytest.param('sum_a_b(1, 2) + 1', id='eval-binop'),
+        pytest.param('sum_a_b(1, sum_a_b(2, 3))', id='eval-nested'),
+        pytest.param('sum_a_b(*[1, 2])', id='eval-starred'),
+    ],
+)
+def test_call_matches_baseline(expression: str) -> None:
+    registry = HookRegistry()
+    for _ in range(2):
+        assert registry.call(expression) == baseline_call(expression)
+
+
+@pytest.mark.parametrize('expression', ['random_phone()', 'str(random_phone())'])
+def test_call_is_not_cached(phones: list[str], expression: str) -> None:
+    registry = HookRegistry()
+
+    assert [registry.call(expression) for _ in range(3)] == phones
+    assert len(set(phones)) == 3
+
+
+@pytest.mark.parametrize(
+    'hook', ['${sum_a_b(1, 2)}', '${sum_a_b(a, b)}', '${sum_a_b(a=1, b=2)}', '${sum_a_b(-1, 2.5)}']
+)
+def test_exec_hook_func_matches_baseline(hook: str) -> None:
+    executor = HookExecutor()
+    expression = executor._quote_string_args(executor.func_re.search(hook).group(1))
+
+    assert executor.exec_hook_func(hook) == baseline_call(expression)
+
+
+def test_value_replace_matches_baseline(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(hooks.faker, 'phone_number', lambda: '13800000000')
+    executor = HookExecutor()
+    target = {
+        'test_steps': {
+            'case_id': 'hook_case',
+            'request': {'json': {'phone': '${random_phone()}', 'sum': 'n=${sum_a_b(1, 2)}'}},
+            'setup': [{'hook': '${sum_a_b(3, 4)}'}, {'sql': 'select ${sum_a_b(5, 6)}'}],
+            'teardown': [{'hook': '${random_phone()}'}],
+        }
+    }
+    original = copy.deepcopy(target)
+
+    result = executor.hook_func_value_replace(target)
+
+    expected = baseline_value_replace(executor, original)
+    # 前后置 hook 不在替换时执行, 保留在原位
+    expected['test_steps']['setup'][0] = original['test_steps']['setup'][0]
+    expected['test_steps']['teardown'][0] = original['test_steps']['teardown'][0]
+    assert result == expected
+    assert target == original
+
+
+def test_value_replace_calls_hook_for_every_request(phones: list[str]) -> None:
+    executor = HookExecutor()
+    target = {'test_steps': {'case_id': 'hook_case', 'request': {'json': {'phone': '${random_phone()}'}}}}
+
+    results = [executor.hook_func_value_replace(target)['test_steps']['request']['json']['phone'] for _ in range(3)]
+
+    assert results == phones
+    assert len(set(results)) == 3
+
+
+def test_global_registry_namespace_matches_star_import() -> None:
+    namespace: dict = {}
+    exec('from httpseeker.core.hooks import *', namespace)
+    namespace.pop('__builtins__')
+
+    assert hook_registry.namespace.keys() == namespace.keys()
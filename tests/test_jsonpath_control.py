@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import Any
+
+import jsonpath
+import pytest
+
+from httpseeker.utils.jsonpath_control import findall, parse_simple_path
+
+DATA = {
+    'a': {'b': [1, 2, {'c': 3}], 'x.y': 5, 'd-e': 6, 'n': None, 'z': 0, 'f': False},
+    'list': [[1, 2], [3, 4]],
+    's': 'text',
+}
+
+MAPPING_DATA = MappingProxyType({'a': MappingProxyType({'b': [MappingProxyType({'c': 1})], 'x.y': 2})})
+
+
+@pytest.mark.parametrize(
+    ['path', 'steps'],
+    [
+        ('$', ()),
+        ('$.a.b[0]', ('a', 'b', 0)),
+        ('$.a.b[-1]', ('a', 'b', -1)),
+        ("$.a['x.y']", ('a', 'x.y')),
+        ('$.a["d-e"]', ('a', 'd-e')),
+        ('$.list[1][0]', ('list', 1, 0)),
+        ('$.a.b[?(@.c==3)]', None),
+        ('$.a.*', None),
+        ('$.a.b[*]', None),
+        ('$..c', None),
+        ('$.a.b[0:2]', None),
+        ('a.b', None),
+    ],
+)
+def test_parse_simple_path(path: str, steps: tuple | None) -> None:
+    assert parse_simple_path(path) == steps
+
+
+@pytest.mark.parametrize(
+    'path',
+    [
+        # 索引
+        '$.a.b[0]',
+        '$.a.b[-1]',
+        '$.a.b[-3]',
+        '$.a.b[-4]',
+        '$.a.b[3]',
+        '$.list[1][0]',
+        '$.list[-1][-2]',
+        # 带引号的 key
+        "$.a['x.y']",
+        '$.a["d-e"]',
+        "$['a']['b'][1]",
+        # key 不存在或类型不匹配
+        '$.missing',
+        '$.a.missing.b',
+        '$.a.b.c',
+        '$.a.b[0].c',
+        '$.a.z[0]',
+        '$.s[0]',
+        # 假值
+        '$.a.n',
+        '$.a.z',
+        '$.a.f',
+        '$.a.n.x',
+        # 过滤器、通配符等由 jsonpath 处理
+        '$.a.b[?(@.c==3)]',
+        '$.a.*',
+        '$.a.b[*]',
+        '$..c',
+        '$.a.b[0:2]',
+        '$',
+    ],
+)
+def test_findall_matches_jsonpath(path: str) -> None:
+    assert findall(path, DATA) == jsonpath.findall(path, DATA)
+
+
+@pytest.mark.parametrize('path', ['$.a.b[0].c', "$.a['x.y']", '$.a.b[1]', '$.a.missing', '$.a.b[*].c', '$..c'])
+def test_findall_on_mapping_matches_jsonpath(path: str) -> None:
+    assert findall(path, MAPPING_DATA) == jsonpath.findall(path, MAPPING_DATA)
+
+
+@pytest.mark.parametrize('data', [[], {}, None, 'text', 1])
+def test_findall_on_any_root_matches_jsonpath(data: Any) -> None:
+    for path in ('$.a', '$[0]', '$'):
+        assert findall(path, data) == jsonpath.findall(path, data)
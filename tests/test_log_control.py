@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+from typing import Iterator
+
+import pytest
+
+from httpseeker.common.log import log
+from httpseeker.core.get_conf import httpseeker_config
+from httpseeker.utils.log_control import DetailLogger, LogField
+
+
+class Unprintable:
+    def __str__(self) -> str:
+        raise AssertionError('日志未输出时不应格式化')
+
+
+@pytest.fixture
+def messages() -> Iterator[list[str]]:
+    messages: list[str] = []
+    handler_id = log.add(lambda message: messages.append(message.rstrip('\n')), format='{level}|{message}')
+    yield messages
+    log.remove(handler_id)
+
+
+@pytest.mark.parametrize(
+    ('value', 'expected'),
+    [
+        ('x' * 30, 'xxxxxxxxxx...(已截断, 共 30 字符)'),
+        (b'x' * 30, "b'xxxxxxxxxx'...(已截断, 共 30 字符)"),
+        ({'data': 'x' * 30}, "{'data': '...(已截断, 共 42 字符)"),
+        ('short', 'short'),
+    ],
+)
+def test_log_field_truncation(monkeypatch: pytest.MonkeyPatch, value: str | bytes | dict, expected: str) -> None:
+    monkeypatch.setattr(httpseeker_config, 'LOG_MAX_FIELD_LENGTH', 10)
+
+    assert str(LogField(value)) == expected
+    assert f'{LogField(value):>8}' == f'{expected:>8}'
+
+
+def test_log_field_not_formatted_when_level_disabled(messages: list[str]) -> None:
+    log.trace('{}', LogField(Unprintable()))
+
+    assert messages == []
+
+
+def test_quiet_mode_flush(monkeypatch: pytest.MonkeyPatch, messages: list[str]) -> None:
+    monkeypatch.setattr(httpseeker_config, 'LOG_QUIET', True)
+    monkeypatch.setattr(httpseeker_config, 'LOG_MAX_FIELD_LENGTH', 0)
+    detail_log = DetailLogger()
+    detail_log.info('请求: {}', {'id': 1})
+    detail_log.error('响应: {}', 'failed')
+    assert messages == []
+
+    detail_log.flush()
+    assert messages == ['WARNING|<用例详情> 共 2 条', "INFO|请求: {'id': 1}", 'ERROR|响应: failed']
+    detail_log.flush()
+    assert len(messages) == 3
+
+
+def test_quiet_mode_discard(monkeypatch: pytest.MonkeyPatch, messages: list[str]) -> None:
+    monkeypatch.setattr(httpseeker_config, 'LOG_QUIET', True)
+    detail_log = DetailLogger()
+    detail_log.info('请求: {}', Unprintable())
+
+    detail_log.discard()
+    detail_log.flush()
+    assert messages == []
+
+
+def test_detail_logged_immediately_when_not_quiet(monkeypatch: pytest.MonkeyPatch, messages: list[str]) -> None:
+    monkeypatch.setattr(httpseeker_config, 'LOG_QUIET', False)
+    DetailLogger().info('请求: {}', 'data')
+
+    assert messages == ['INFO|请求: data']
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+from httpseeker import conftest
+from httpseeker.core.get_conf import httpseeker_config
+from httpseeker.enums.request.engin import EnginType
+
+if TYPE_CHECKING:
+    import pytest
+
+pytest_plugins = ['pytester']
+
+CASES = """
+import sys
+
+import pytest
+
+
+def case(case_id):
+    return {'test_steps': {'case_id': case_id}}
+
+
+@pytest.mark.parametrize(
+    'case_data',
+    [
+        case('run_001'),
+        pytest.param(case('skip_001'), marks=pytest.mark.skip),
+        pytest.param(case('skipif_001'), marks=pytest.mark.skipif(sys.platform == 'never', reason='')),
+        case('run_002'),
+    ],
+)
+def test_case(case_data):
+    pass
+"""
+
+
+def test_prefetch_skips_skip_and_skipif(pytester: pytest.Pytester) -> None:
+    pytester.makepyfile(test_cases=CASES, test_other=CASES)
+    items, _ = pytester.inline_genitems()
+    module = next(item.module for item in items if item.module.__name__ == 'test_cases')
+
+    case_data_list = conftest.get_prefetch_case_data(items, module)
+
+    assert [case_data['test_steps']['case_id'] for case_data in case_data_list] == ['run_001', 'run_002']
+
+
+def test_no_prefetch_on_xdist_worker(monkeypatch: pytest.MonkeyPatch) -> None:
+    prefetched: list = []
+    monkeypatch.setattr(httpseeker_config, 'REQUEST_ENGIN', EnginType.httpx_async)
+    monkeypatch.setattr(conftest.async_runner, 'prefetch', prefetched.append)
+    monkeypatch.setenv('PYTEST_XDIST_WORKER', 'gw0')
+    request = SimpleNamespace(session=SimpleNamespace(items=[]), module=None)
+
+    for _ in conftest.module_fixture.__pytest_wrapped__.obj(request):
+        pass
+
+    assert prefetched == []
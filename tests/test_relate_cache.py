@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+from typing import Iterator
+
+import pytest
+
+from cache3 import Cache
+
+from httpseeker.common.relate_cache import relate_cache
+from httpseeker.common.send_request import send_request
+from httpseeker.utils.relate_testcase_executor import relate_testcase_exec, relate_testcase_extract
+
+TEARDOWN = [{'extract': [{'key': 'order_id', 'type': 'cache', 'jsonpath': '$.json.id'}]}]
+
+
+@pytest.fixture
+def sent(monkeypatch: pytest.MonkeyPatch) -> Iterator[list]:
+    sent: list = []
+
+    def fake_send_request(request_data: dict, **kwargs) -> dict:
+        sent.append(request_data['test_steps']['case_id'])
+        return {'json': {'id': len(sent)}}
+
+    monkeypatch.setattr(relate_cache, 'enabled', True)
+    monkeypatch.setattr(relate_cache, 'cache', Cache('httpseeker_test_relate'))
+    monkeypatch.setattr(send_request, 'send_request', fake_send_request)
+    yield sent
+    relate_cache.clear()
+
+
+def make_case(case_id: str, teardown: list | None = None) -> dict:
+    return {'test_steps': {'case_id': case_id, 'teardown': teardown}}
+
+
+def test_case_without_teardown_is_cached(sent: list) -> None:
+    for _ in range(2):
+        relate_testcase_exec(make_case('login'))
+        relate_testcase_extract({**make_case('login'), 'set_var_response': [{'key': 'id', 'jsonpath': '$.json.id'}]})
+
+    assert sent == ['login']
+
+
+def test_case_with_teardown_always_runs(sent: list) -> None:
+    for _ in range(2):
+        relate_testcase_exec(make_case('create_order', TEARDOWN))
+        relate_testcase_extract(
+            {**make_case('create_order', TEARDOWN), 'set_var_response': [{'key': 'id', 'jsonpath': '$.json.id'}]}
+        )
+
+    assert sent == ['create_order'] * 4
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import copy
+
+import pytest
+
+from httpseeker.enums.request.engin import EnginType
+from httpseeker.utils.auth_plugins import auth
+from httpseeker.utils.request import request_data_parse
+from httpseeker.utils.request.request_data_parse import RequestDataParse
+
+CASE = {
+    'config': {
+        'allure': {'epic': 'epic', 'feature': 'feature', 'story': 'story'},
+        'request': {'env': 'Dz_like_bofa_admin.env', 'headers': {'Content-Type': 'application/json'}},
+        'module': 'module',
+    },
+    'test_steps': {
+        'name': 'name',
+        'case_id': 'parse_cache_001',
+        'description': 'description',
+        'request': {
+            'method': 'GET',
+            'url': '/records',
+            'params': {'page': 1},
+            'headers': None,
+            'cookies': None,
+            'body_type': None,
+            'body': None,
+            'files': None,
+        },
+        'teardown': [{'assert': {'check': 'code', 'type': 'eq', 'value': 200, 'jsonpath': '$.json.code'}}],
+    },
+    'file_hash': 'hash-1',
+}
+
+
+@pytest.fixture(autouse=True)
+def parse_cache(monkeypatch: pytest.MonkeyPatch) -> dict:
+    cache: dict = {}
+    monkeypatch.setattr(request_data_parse, '_parsed_case_cache', cache)
+    monkeypatch.setattr(auth, 'is_auth', False)
+    return cache
+
+
+def parse(case: dict) -> dict:
+    return RequestDataParse(case, EnginType.requests).get_request_data_parsed()
+
+
+def test_cached_values_are_copies(parse_cache: dict) -> None:
+    first = parse(CASE)
+    first['params']['page'] = 2
+    first['teardown'].clear()
+
+    second = parse(CASE)
+    assert len(parse_cache) == 1
+    assert second['params'] == {'page': 1}
+    assert len(second['teardown']) == 1
+    assert CASE['test_steps']['request']['params'] == {'page': 1}
+
+
+def test_cache_keyed_on_file_hash(parse_cache: dict) -> None:
+    parse(CASE)
+    changed = copy.deepcopy(CASE)
+    changed['test_steps']['request']['url'] = '/changed'
+    changed['file_hash'] = 'hash-2'
+
+    assert parse(changed)['url'].endswith('/changed')
+    assert len(parse_cache) == 2
+
+
+def test_case_without_file_hash_not_cached(parse_cache: dict) -> None:
+    case = {k: v for k, v in CASE.items() if k != 'file_hash'}
+
+    assert parse(case)['params'] == {'page': 1}
+    assert not parse_cache
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import json
+
+from datetime import timedelta
+from typing import Any
+
+import httpx
+import pytest
+
+from httpseeker.common.errors import SendRequestError
+from httpseeker.common.response_view import ResponseView
+from httpseeker.common.send_request import send_request
+from httpseeker.utils.encryption_filter import get_encryption_filter
+
+
+class CountingResponse(httpx.Response):
+    json_calls = 0
+
+    def json(self, **kwargs) -> Any:
+        self.json_calls += 1
+        return super().json(**kwargs)
+
+
+def make_response(content: bytes, content_type: str = 'application/json') -> CountingResponse:
+    response = CountingResponse(
+        200,
+        content=content,
+        headers={'Content-Type': content_type},
+        request=httpx.Request('GET', 'https://example.com/api'),
+    )
+    response.elapsed = timedelta(milliseconds=12)
+    return response
+
+
+def make_view(response: httpx.Response, **kwargs) -> ResponseView:
+    return ResponseView(response, {'method': 'GET'}, '2026-10-17 10:00:00', **kwargs)
+
+
+def test_lazy_keys_decode_once() -> None:
+    response = make_response(b'{"code": 200, "data": [1, 2]}')
+    view = make_view(response)
+
+    assert not view.is_loaded('json')
+    assert view['json'] == {'code': 200, 'data': [1, 2]}
+    assert view['json'] is view['json']
+    assert view.to_dict()['json'] is view['json']
+    assert view.is_loaded('json')
+    assert response.json_calls == 1
+
+
+def test_declared_json_parse_error_raises() -> None:
+    view = make_view(make_response(b'<html>error</html>'))
+
+    with pytest.raises(SendRequestError):
+        view['json']
+
+
+def test_undeclared_json_parse_error_is_empty() -> None:
+    view = make_view(make_response(b'<html>ok</html>', 'text/html'))
+
+    assert view['json'] == {}
+    assert view['text'] == '<html>ok</html>'
+
+
+def test_response_is_decrypted() -> None:
+    payload = {'code': 200, 'data': {'token': 'abc'}}
+    encrypted = get_encryption_filter(None).encrypt(json.dumps(payload))
+    view = make_view(make_response(json.dumps({'data': encrypted}).encode()), encryption_enabled=True)
+
+    assert view['json'] == payload
+
+
+def test_allure_request_down_does_not_decode_json() -> None:
+    response = make_response(b'{"code": 200}')
+    view = make_view(response)
+
+    send_request.allure_request_down(view)
+
+    assert not view.is_loaded('json')
+    assert response.json_calls == 0
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import pytest
+
+from jsonschema.exceptions import ValidationError
+
+from httpseeker.common.errors import AssertSyntaxError
+from httpseeker.utils.schema_validator import SchemaValidatorCache
+
+SCHEMA = {'type': 'array', 'items': {'type': 'object', 'required': ['id'], 'properties': {'id': {'type': 'integer'}}}}
+
+
+def test_validator_built_once_per_schema() -> None:
+    cache = SchemaValidatorCache()
+    validator, _ = cache.get(SCHEMA)
+
+    # key 顺序不同的相同 schema 共享校验器
+    assert cache.get(dict(reversed(SCHEMA.items())))[0] is validator
+    assert len(cache._validators) == 1
+
+
+def test_cache_evicts_oldest() -> None:
+    cache = SchemaValidatorCache(maxsize=2)
+    for n in range(3):
+        cache.get({'type': 'integer', 'minimum': n})
+
+    assert list(cache._validators) == [
+        cache.schema_hash({'type': 'integer', 'minimum': 1}),
+        cache.schema_hash({'type': 'integer', 'minimum': 2}),
+    ]
+
+
+@pytest.mark.parametrize('size', [1, 200])
+def test_validate_reports_error(size: int) -> None:
+    cache = SchemaValidatorCache()
+    instance = [{'id': i} for i in range(size)]
+    cache.validate(instance, SCHEMA)
+
+    instance[-1] = {'id': 'x'}
+    with pytest.raises(ValidationError, match="'x' is not of type 'integer'"):
+        cache.validate(instance, SCHEMA)
+
+
+def test_fast_path_for_draft7() -> None:
+    pytest.importorskip('fastjsonschema')
+    cache = SchemaValidatorCache()
+    schema = {'$schema': 'http://json-schema.org/draft-07/schema#', **SCHEMA}
+    instance = [{'id': i} for i in range(200)]
+
+    assert cache.get(schema)[1] is not None
+    cache.validate(instance, schema)
+    instance[-1] = {'id': 'x'}
+    with pytest.raises(ValidationError, match="'x' is not of type 'integer'"):
+        cache.validate(instance, schema)
+
+
+@pytest.mark.parametrize(
+    'schema',
+    [
+        {'type': 'array', 'prefixItems': [{'type': 'string'}]},
+        {'type': 'array', 'items': {'dependentRequired': {'a': ['b']}}},
+        {'type': 'array', 'items': {'unevaluatedProperties': False}},
+    ],
+)
+def test_fast_path_skipped_for_2020_12(schema: dict) -> None:
+    pytest.importorskip('fastjsonschema')
+    cache = SchemaValidatorCache()
+    instance = [1] + [{'a': 1} for _ in range(199)]
+
+    # 未声明 $schema 时按 2020-12 校验, fastjsonschema 按 draft-07 会放过这些数据
+    assert cache.get(schema)[1] is None
+    with pytest.raises(ValidationError):
+        cache.validate(instance, schema)
+
+
+def test_invalid_schema() -> None:
+    with pytest.raises(AssertSyntaxError):
+        SchemaValidatorCache().get({'type': 'unknown'})
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import threading
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Iterator
+
+import pytest
+
+from httpseeker.common.async_runner import AsyncRunner
+from httpseeker.common.send_request import SendRequests
+from httpseeker.common.session_pool import httpx_async_send, session_pool
+
+
+class CookieHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:  # noqa: N802
+        if self.path == '/login':
+            # 设置 cookie 并重定向, 重定向请求应携带该 cookie
+            self.send_response(302)
+            self.send_header('Set-Cookie', 'sid=account-a; Path=/')
+            self.send_header('Location', '/echo')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        body = (self.headers.get('Cookie') or '').encode()
+        self.send_response(200)
+        self.send_header('Set-Cookie', 'tracker=1; Path=/')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture(scope='module')
+def base_url() -> Iterator[str]:
+    server = ThreadingHTTPServer(('127.0.0.1', 0), CookieHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_port}'
+    server.shutdown()
+    server.server_close()
+    session_pool.close()
+
+
+def request_kwargs(url: str, cookies: dict | None = None) -> dict:
+    return {
+        'method': 'GET',
+        'url': url,
+        'cookies': cookies,
+        'timeout': 5,
+        'verify': False,
+        'proxies': None,
+        'allow_redirects': True,
+        'retry': 1,
+    }
+
+
+ENGINES: dict[str, Callable] = {
+    'requests': lambda **kwargs: SendRequests._requests_engin(pool=True, **kwargs),
+    'httpx': lambda **kwargs: SendRequests._httpx_engin(pool=True, **kwargs),
+}
+
+
+# 共享客户端不使用已弃用的单请求 cookies 参数
+@pytest.mark.filterwarnings('error::DeprecationWarning')
+@pytest.mark.parametrize('engin', ['requests', 'httpx'])
+def test_pooled_session_does_not_leak_cookies(base_url: str, engin: str) -> None:
+    send = ENGINES[engin]
+    # 重定向过程中设置的 cookie 在同一请求内有效
+    assert send(**request_kwargs(f'{base_url}/login')).text == 'sid=account-a'
+    # 上一个请求的 Set-Cookie 不会被后续请求携带
+    assert send(**request_kwargs(f'{base_url}/echo')).text == ''
+    # 每个请求单独传入的 cookie 正常发送且不会保留
+    assert send(**request_kwargs(f'{base_url}/echo', {'sid': 'account-b'})).text == 'sid=account-b'
+    assert send(**request_kwargs(f'{base_url}/echo')).text == ''
+
+
+def test_pooled_httpx_client_does_not_store_cookies(base_url: str) -> None:
+    response = ENGINES['httpx'](**request_kwargs(f'{base_url}/login', {'sid': 'account-b'}))
+
+    assert [r.status_code for r in response.history] == [302]
+    assert not session_pool.get_httpx_client(base_url, False, None).cookies
+
+
+def test_async_client_does_not_keep_cookies(base_url: str) -> None:
+    runner = AsyncRunner(concurrency=2)
+    try:
+
+        async def send_in_turn() -> list[str]:
+            client = runner.get_client(base_url, False, None)
+            texts = []
+            for path in ('login', 'echo'):
+                response = await httpx_async_send(client, follow_redirects=True, method='GET', url=f'{base_url}/{path}')
+                texts.append(response.text)
+            return texts
+
+        assert runner.run(send_in_turn()) == ['sid=account-a', '']
+    finally:
+        runner.close()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import copy
+import io
+import json
+import re
+
+from typing import Any
+
+import pytest
+
+from httpseeker.utils.request import vars_extractor
+from httpseeker.utils.request.vars_extractor import VarsExtractor
+
+VARS = {'host': 'https://example.com', 'id': 42, 'name': 'alice', 'token': 't0k'}
+
+VARS_RE = re.compile(r'\${([a-zA-Z_]\w*)}|(?<!\S)\$([a-zA-Z_]\w*)(?!\S)')
+
+
+def baseline_vars_replace(target: dict) -> dict:
+    """替换前的实现: 剔除 files 后按 json 文本整体替换"""
+    target = dict(target)
+    files = target.pop('files', None)
+    str_target = VARS_RE.sub(lambda m: str(VARS[m.group(1) or m.group(2)]), json.dumps(target, ensure_ascii=False))
+    result = json.loads(str_target)
+    if files is not None:
+        result['files'] = files
+    return result
+
+
+@pytest.fixture
+def extractor(monkeypatch: pytest.MonkeyPatch) -> VarsExtractor:
+    class FakeVariableCache:
+        @staticmethod
+        def get(key: str) -> Any:
+            return VARS.get(key)
+
+    monkeypatch.setattr(vars_extractor, 'variable_cache', FakeVariableCache())
+    monkeypatch.setattr(vars_extractor, 'get_env_dict', lambda _: {})
+    monkeypatch.setattr(vars_extractor, 'read_yaml_vars', dict)
+    return VarsExtractor()
+
+
+@pytest.mark.parametrize(
+    'target',
+    [
+        pytest.param({'url': '${host}/user', 'body': {'${name}': 1, 'a ${name} b': '$id'}}, id='dict-key'),
+        pytest.param({'body': {'ids': [['${id}', 1], {'n': ['x', '${name}']}]}}, id='nested-list'),
+        pytest.param({'params': {'only': '${id}', 'embedded': 'id=${id}&n=${name}'}}, id='only-vs-embedded'),
+        pytest.param({'params': {'bare': '$id', 'spaced': 'a $id b', 'tail': 'x$id'}}, id='bare-var'),
+        pytest.param({'body': {'n': 1, 'f': 1.5, 'b': True, 'none': None, 's': '${token}'}}, id='non-string'),
+        pytest.param({'url': '/plain', 'body': {'a': [1, 2]}}, id='no-vars'),
+    ],
+)
+def test_vars_replace_matches_baseline(extractor: VarsExtractor, target: dict) -> None:
+    assert extractor.vars_replace(target, 'test.env') == baseline_vars_replace(target)
+
+
+def test_files_are_excluded(extractor: VarsExtractor) -> None:
+    file = io.BytesIO(b'${token}')
+    target = {'url': '${host}', 'files': {'file': file, 'name': '${name}'}}
+
+    result = extractor.vars_replace(target, 'test.env')
+
+    assert result == baseline_vars_replace(target)
+    assert result['files'] is target['files']
+    assert result['files']['file'] is file
+
+
+def test_render_does_not_mutate_original(extractor: VarsExtractor) -> None:
+    target = {'url': '${host}', 'body': {'user': {'${name}': ['${id}']}, 'static': {'a': 1}}}
+    original = copy.deepcopy(target)
+
+    result = extractor.vars_replace(target, 'test.env', cache_key='case')
+    extractor.vars_replace(target, 'test.env', cache_key='case')
+
+    assert target == original
+    assert result['body']['static'] is target['body']['static']
+
+
+@pytest.mark.parametrize(
+    'datas',
+    [
+        pytest.param([{'url': '/plain'}, {'url': '${host}'}], id='none-then-slots'),
+        pytest.param([{'url': '${host}'}, {'url': '${host}', 'body': {'id': '${id}'}}], id='added-slot'),
+        pytest.param([{'body': ['${id}', '${name}']}, {'body': ['${name}']}], id='removed-slot'),
+        pytest.param([{'body': {'${name}': 1}}, {'body': {'name': 1}}, {'body': {'${name}': 1}}], id='key-changed'),
+    ],
+)
+def test_cache_key_reused_with_different_data(extractor: VarsExtractor, datas: list) -> None:
+    for target in datas:
+        assert extractor.vars_replace(target, 'test.env', cache_key='case') == baseline_vars_replace(target)
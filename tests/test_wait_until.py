@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import pytest
+
+from httpseeker.common.errors import AssertError
+from httpseeker.utils.request import wait_until as wait_until_module
+from httpseeker.utils.request.wait_until import exec_wait_until
+
+
+class FakeClock:
+    """记录 sleep 时长的虚拟时钟"""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def perf_counter(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(wait_until_module, 'time', clock)
+    return clock
+
+
+@pytest.fixture
+def hook_results(monkeypatch: pytest.MonkeyPatch) -> list:
+    results: list = []
+    monkeypatch.setattr(wait_until_module.hook_executor, 'exec_hook_func', lambda hook: results.pop(0))
+    return results
+
+
+def test_polls_until_condition_met(clock: FakeClock, hook_results: list) -> None:
+    hook_results.extend([{'status': 'pending'}, {'status': 'pending'}, {'status': 'done'}])
+    wait_until = {'hook': '${probe()}', 'jsonpath': '$.status', 'type': 'eq', 'value': 'done', 'interval': 1}
+
+    exec_wait_until(wait_until, 'test.env')
+
+    assert clock.sleeps == [1, 2]
+    assert hook_results == []
+
+
+def test_backoff_capped_and_timeout(clock: FakeClock, hook_results: list) -> None:
+    hook_results.extend([False] * 20)
+    wait_until = {'hook': '${probe()}', 'timeout': 20, 'interval': 1, 'backoff': 3, 'max_interval': 5}
+
+    with pytest.raises(AssertError, match='wait_until 等待超时'):
+        exec_wait_until(wait_until, 'test.env')
+
+    # 1 -> 3 -> 5 -> 5 ..., 最后一次等待不超过剩余时间
+    assert clock.sleeps == [1, 3, 5, 5, 5, 1]
+    assert clock.now == 20
+
+
+def test_requires_single_source(clock: FakeClock) -> None:
+    with pytest.raises(AssertError, match='数据来源必须且只能指定一个'):
+        exec_wait_until({'hook': '${probe()}', 'sql': 'select 1'}, 'test.env')
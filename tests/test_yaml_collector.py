@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import pytest
+
+from httpseeker.utils.case_loader import parse_case_file
+from httpseeker.utils.request import case_data_parse
+from httpseeker.utils.request.ids_extract import get_ids
+from httpseeker.utils.yaml_collector import get_testcase_names
+
+pytest_plugins = ['pytester']
+
+CASE_DATA = """
+config:
+  allure:
+    epic: epic
+    feature: feature
+    story: story
+  request:
+    env: Dz_like_bofa_admin.env
+  module: order
+test_steps:
+  - name: create
+    case_id: order_create_001
+    mark: [smoke]
+    request:
+      method: POST
+      url: /order
+  - name: query
+    case_id: order_query_001
+    request:
+      method: GET
+      url: /order
+"""
+
+# 与 case_auto_generator 生成的测试用例文件一致
+GENERATED_STUB = """
+import pytest
+
+from httpseeker.common.send_request import send_request
+from httpseeker.utils.request.case_data_parse import get_testcase_data
+
+ddt_data, ids = get_testcase_data(filename='order_case.yaml')
+
+
+class TestOrderCase:
+    \"\"\"OrderCase\"\"\"
+
+    @pytest.mark.parametrize('case_data', ddt_data, ids=ids)
+    def test_order_case(self, case_data):
+        \"\"\"order_case\"\"\"
+        send_request.send_request(case_data)
+"""
+
+YAML_CONFTEST = """
+from httpseeker.utils.yaml_collector import YamlCaseModule
+
+
+def pytest_collect_file(file_path, parent):
+    if file_path.suffix == '.yaml':
+        return YamlCaseModule.from_parent(parent, path=file_path)
+"""
+
+
+@pytest.fixture
+def case_dir(pytester: pytest.Pytester, monkeypatch: pytest.MonkeyPatch) -> pytest.Pytester:
+    pytester.makefile('.yaml', order_case=CASE_DATA)
+    monkeypatch.setattr(
+        case_data_parse, '_load_case_data_from_file', lambda filename: parse_case_file(str(pytester.path / filename))
+    )
+    return pytester
+
+
+def collect(pytester: pytest.Pytester, *args: str) -> list[tuple[str, str, list[str]]]:
+    items, _ = pytester.inline_genitems(*args)
+    return [
+        (
+            item.nodeid.split('::', 1)[1],
+            item.callspec.id,
+            sorted(m.name for m in item.iter_markers() if m.name != 'parametrize'),
+        )
+        for item in items
+    ]
+
+
+def test_get_testcase_names() -> None:
+    assert get_testcase_names('order_case') == ('TestOrderCase', 'test_order_case')
+    assert get_testcase_names('test_order_case') == ('TestOrderCase', 'test_order_case')
+
+
+def test_yaml_collect_matches_generated_stub(case_dir: pytest.Pytester) -> None:
+    case_dir.makeconftest(YAML_CONFTEST)
+    yaml_items = collect(case_dir, 'order_case.yaml')
+    case_dir.makepyfile(test_order_case=GENERATED_STUB)
+    stub_items = collect(case_dir, 'test_order_case.py')
+
+    ddt_data, ids = case_data_parse.get_testcase_data(filename='order_case.yaml')
+    assert ids == get_ids([data if isinstance(data, dict) else data.values[0] for data in ddt_data])
+    assert yaml_items == stub_items
+    assert [item[1] for item in yaml_items] == ids
+    assert [item[2] for item in yaml_items] == [['smoke'], []]
+    assert yaml_items[0][0].startswith('TestOrderCase::test_order_case[')